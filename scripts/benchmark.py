@@ -0,0 +1,286 @@
+import base64
+import json
+import os
+import statistics
+import time
+from functools import partial
+from typing import Any, Callable, Dict
+
+import click
+from nationguessr.data.game import GameSession
+from nationguessr.service.catalog import load_country_catalog
+from nationguessr.service.encoding import EncodingProfile
+from nationguessr.service.fsm.codec import SessionCodec
+from nationguessr.service.fsm.marshalling import marshal_value, unmarshal_value
+from nationguessr.service.fsm.signing import SigV4Signer
+from nationguessr.service.image import ImageEditService, load_image_asset
+from nationguessr.settings import CardEncodingFormat
+
+
+def measure(func: Callable[[], object], iterations: int) -> float:
+    """Returns the median duration of the function call in milliseconds."""
+
+    func()
+    durations = []
+
+    for _ in range(iterations):
+        started_at = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - started_at)
+
+    return statistics.median(durations) * 1000
+
+
+def attribute_size(attribute_value: Dict[str, Any]) -> int:
+    """Returns the size of the attribute value in bytes by DynamoDB item size rules."""
+
+    attribute_type, value = next(iter(attribute_value.items()))
+
+    match attribute_type:
+        case "S" | "N":
+            return len(value.encode("utf-8"))
+        case "B":
+            return len(base64.b64decode(value))
+        case "L":
+            return 3 + sum(1 + attribute_size(item) for item in value)
+        case "M":
+            return 3 + sum(
+                len(k.encode("utf-8")) + 1 + attribute_size(v) for k, v in value.items()
+            )
+        case _:
+            return 1
+
+
+@click.group(
+    "benchmark",
+    help="A CLI application for benchmarking performance-critical parts of the bot. "
+    "Requires the `src` folder in the `PYTHONPATH`.",
+)
+@click.version_option("1.0.0", prog_name="benchmark")
+def cli() -> None:
+    pass
+
+
+@cli.command(
+    "encoding", help="Measure encode time and size of game cards per encoding profile."
+)
+@click.option(
+    "-a",
+    "--assets",
+    "assets_folder",
+    type=click.Path(exists=True, file_okay=False),
+    default=os.path.join("src", "assets"),
+    show_default=True,
+    help="Path to the folder with static assets.",
+)
+@click.option(
+    "-n",
+    "--iterations",
+    type=click.IntRange(min=1),
+    default=10,
+    show_default=True,
+    help="Number of measured encodes per card and profile.",
+)
+def encoding(assets_folder: str, iterations: int) -> None:
+    image_edit_service = ImageEditService(
+        os.path.join(assets_folder, "fonts", "Poppins-ExtraBold.ttf"), (66, 68, 110)
+    )
+    game_session = GameSession(
+        score_board={128: "01/01/1970", 64: "01/01/1970", 8: "01/01/1970"},
+        lives_remained=3,
+        current_score=42,
+        options=[],
+        correct_option="",
+    )
+
+    quiz_card_template_path = os.path.join(assets_folder, "cards", "game_guessing.png")
+    heart_icon_path = os.path.join(assets_folder, "icons", "heart.png")
+    game_over_card_template_path = os.path.join(assets_folder, "cards", "game_over.png")
+    game_scores_template_path = os.path.join(assets_folder, "cards", "game_scores.png")
+
+    quiz_card_image = image_edit_service.add_multiline_text(
+        load_image_asset(quiz_card_template_path),
+        [
+            f"{i + 1}. A benchmark fact about the geography, history and culture of the country"
+            for i in range(5)
+        ],
+        text_size=28,
+        position=(0, -100),
+        center=True,
+    )
+    quiz_card_image = image_edit_service.add_glyph_text(
+        quiz_card_image, "00042", text_size=64, position=(713, 50)
+    )
+    quiz_card_image = image_edit_service.add_icon_strip(
+        quiz_card_image, heart_icon_path, game_session.lives_remained, (100, 50)
+    )
+
+    cards = {
+        "quiz": (quiz_card_image, [quiz_card_template_path, heart_icon_path]),
+        "game_over": (
+            image_edit_service.add_text(
+                load_image_asset(game_over_card_template_path),
+                "42",
+                text_size=128,
+                position=(0, 10),
+                center=True,
+            ),
+            [game_over_card_template_path],
+        ),
+        "game_scores": (
+            image_edit_service.add_multiline_text(
+                load_image_asset(game_scores_template_path),
+                [
+                    f"{i + 1}. {timestamp} - {score} point(s)"
+                    for i, (score, timestamp) in enumerate(
+                        game_session.score_board.items()
+                    )
+                ],
+                text_size=48,
+                center=True,
+            ),
+            [game_scores_template_path],
+        ),
+    }
+    profiles: Dict[str, EncodingProfile] = {
+        "png-6": EncodingProfile(CardEncodingFormat.PNG, compression_level=6),
+        "png-1": EncodingProfile(CardEncodingFormat.PNG, compression_level=1),
+        "png-9": EncodingProfile(CardEncodingFormat.PNG, compression_level=9),
+        "png-palette-6": EncodingProfile(
+            CardEncodingFormat.PNG_PALETTE, compression_level=6
+        ),
+        "jpeg-85": EncodingProfile(CardEncodingFormat.JPEG, quality=85),
+        "webp-85": EncodingProfile(CardEncodingFormat.WEBP, quality=85),
+    }
+
+    click.echo(f"{'card':<12} {'profile':<14} {'encode, ms':>11} {'size, KB':>9}")
+
+    for card_name, (card_image, palette_paths) in cards.items():
+        for profile_name, profile in profiles.items():
+            encode_card = partial(profile.encode, card_image, palette_paths)
+            encoded_card = encode_card()
+            duration = measure(encode_card, iterations)
+
+            click.echo(
+                f"{card_name:<12} {profile_name:<14} {duration:>11.2f} "
+                f"{len(encoded_card) / 1024:>9.1f}"
+            )
+
+
+@cli.command(
+    "fsm-data",
+    help="Measure encode and decode time and item size of FSM data per storage layout.",
+)
+@click.option(
+    "-a",
+    "--assets",
+    "assets_folder",
+    type=click.Path(exists=True, file_okay=False),
+    default=os.path.join("src", "assets"),
+    show_default=True,
+    help="Path to the folder with static assets.",
+)
+@click.option(
+    "-n",
+    "--iterations",
+    type=click.IntRange(min=1),
+    default=10000,
+    show_default=True,
+    help="Number of measured encodes and decodes per layout.",
+)
+def fsm_data(assets_folder: str, iterations: int) -> None:
+    catalog = load_country_catalog(os.path.join(assets_folder, "data", "countries.csv"))
+    data = GameSession(
+        score_board={128: "01/01/2024", 64: "12/02/2024", 8: "28/02/2024"},
+        lives_remained=2,
+        current_score=42,
+        options=list(catalog.names[:4]),
+        correct_option=catalog.names[2],
+    ).model_dump()
+
+    def encode_binary(codec: SessionCodec) -> Dict[str, Any]:
+        return {"B": base64.b64encode(codec.encode(data)).decode("ascii")}
+
+    def decode_binary(codec: SessionCodec, data_value: Dict[str, Any]) -> Any:
+        return codec.decode(base64.b64decode(data_value["B"]))
+
+    layouts = {
+        "json-in-map": (
+            lambda: {"M": {k: {"S": json.dumps(v)} for k, v in data.items()}},
+            lambda data_value: {
+                k: json.loads(v["S"]) for k, v in data_value["M"].items()
+            },
+        ),
+        "native": (partial(marshal_value, data), unmarshal_value),
+        "binary": (
+            partial(encode_binary, SessionCodec(catalog, compression_level=0)),
+            partial(decode_binary, SessionCodec(catalog, compression_level=0)),
+        ),
+        "binary-zlib": (
+            partial(encode_binary, SessionCodec(catalog)),
+            partial(decode_binary, SessionCodec(catalog)),
+        ),
+    }
+
+    click.echo(
+        f"{'layout':<12} {'encode, us':>11} {'decode, us':>11} {'item size, B':>13}"
+    )
+
+    for layout_name, (encode_data, decode_data) in layouts.items():
+        data_value = encode_data()
+        encode_duration = measure(encode_data, iterations)
+        decode_duration = measure(partial(decode_data, data_value), iterations)
+
+        click.echo(
+            f"{layout_name:<12} {encode_duration * 1000:>11.1f} "
+            f"{decode_duration * 1000:>11.1f} {attribute_size(data_value):>13}"
+        )
+
+
+@cli.command(
+    "signing", help="Measure SigV4 signing time with and without cached signing keys."
+)
+@click.option(
+    "-n",
+    "--iterations",
+    type=click.IntRange(min=1),
+    default=10000,
+    show_default=True,
+    help="Number of measured signatures per mode.",
+)
+def signing(iterations: int) -> None:
+    signer_args = (
+        "AKIDEXAMPLE",
+        "wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY",
+        "eu-central-1",
+        "dynamodb",
+        "dynamodb.eu-central-1.amazonaws.com",
+    )
+    request_body = json.dumps(
+        {
+            "TableName": "fsm-table",
+            "Key": {"chat_id": {"S": "123456789"}, "user_id": {"S": "123456789"}},
+            "ProjectionExpression": "state_value, data_value, data_version",
+            "ConsistentRead": True,
+        }
+    )
+    signer = SigV4Signer(*signer_args)
+
+    # A new signer per request derives the signing key and builds all parts again
+    modes = {
+        "uncached": lambda: SigV4Signer(*signer_args).sign(
+            request_body, "DynamoDB_20120810.GetItem"
+        ),
+        "cached": lambda: signer.sign(request_body, "DynamoDB_20120810.GetItem"),
+    }
+
+    click.echo(f"{'mode':<10} {'sign, us':>9}")
+
+    for mode_name, sign_request in modes.items():
+        duration = measure(sign_request, iterations)
+
+        click.echo(f"{mode_name:<10} {duration * 1000:>9.1f}")
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,47 @@
+import os
+import sys
+
+import click
+from nationguessr.service.factstore import compile_fact_store
+
+
+@click.command(
+    "factstore",
+    help="A CLI application for compiling the country facts archive into a memory-mapped binary facts store. "
+    "Requires the `src` folder in the `PYTHONPATH`.",
+)
+@click.version_option("1.0.0", prog_name="factstore")
+@click.option(
+    "-i",
+    "--input",
+    "input_path",
+    type=click.Path(exists=True, dir_okay=False),
+    default=os.path.join("src", "assets", "data", "country_facts.zip"),
+    show_default=True,
+    help="Path to the archive with per-country CSV files of facts.",
+)
+@click.option(
+    "-o",
+    "--output",
+    "output_path",
+    type=click.Path(dir_okay=False, writable=True),
+    default=os.path.join("src", "assets", "data", "country_facts.bin"),
+    show_default=True,
+    help="Path to the compiled binary facts store.",
+)
+def cli(input_path: str, output_path: str) -> None:
+    try:
+        countries_num, facts_num = compile_fact_store(input_path, output_path)
+    except Exception as e:
+        click.echo(f"❌ Failed to compile the facts store: {e}", err=True)
+        sys.exit(1)
+
+    click.echo(
+        f"✅ Compiled {click.style(facts_num, bold=True)} facts about "
+        f"{click.style(countries_num, bold=True)} countries into "
+        f"{click.style(output_path, bold=True)}"
+    )
+
+
+if __name__ == "__main__":
+    cli()
@@ -2,19 +2,23 @@ import asyncio
 import json
 import logging
 import os
+from functools import partial
 
 from aiogram import Bot, Dispatcher, types
 from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
+from nationguessr.app.editing import card_asset_paths, warm_up_quiz_card_text
 from nationguessr.app.handlers import root_router
-from nationguessr.service.fsm.storage import DynamoDBStorage
-from nationguessr.service.game import (
-    GenerationFromGptStrategy,
-    GenerationFromZipStrategy,
-    GuessingFactsGameService,
+from nationguessr.service.cache import FileIdRegistry, RenderedCardCache
+from nationguessr.service.factory import (
+    create_fact_generation_strategy,
+    create_fsm_storage,
 )
+from nationguessr.service.fsm.middleware import ItemScopeMiddleware
+from nationguessr.service.game import GuessingFactsGameService
 from nationguessr.service.image import ImageEditService
-from nationguessr.settings import FactsGenerationStrategy, Settings
+from nationguessr.service.rendering import RenderExecutor
+from nationguessr.settings import Settings
 
 settings = Settings()
 
@@ -31,40 +35,55 @@ bot = Bot(
     settings.token,
     default=DefaultBotProperties(parse_mode=ParseMode.MARKDOWN, protect_content=True),
 )
-state_storage = DynamoDBStorage(
-    settings.aws_access_key,
-    settings.aws_secret_key,
-    settings.aws_fsm_table_name,
-    settings.aws_region,
-)
-dp = Dispatcher(storage=state_storage)
+state_storage = create_fsm_storage(settings)
+# The FSM middleware is registered manually, so it runs within the item scope of the storage
+dp = Dispatcher(storage=state_storage, disable_fsm=True)
+dp.update.outer_middleware(ItemScopeMiddleware(state_storage))
+dp.update.outer_middleware(dp.fsm)
 dp.include_router(root_router)
 
+# Facts corpus is loaded once during the container initialization and reused across warm invocations
+facts_game_service = GuessingFactsGameService(
+    create_fact_generation_strategy(settings), settings
+)
 
-async def main(update_event) -> None:
-    text_font_path = os.path.join(
-        settings.assets_folder, "fonts", "Poppins-ExtraBold.ttf"
-    )
-    image_edit_service = ImageEditService(text_font_path, settings.default_text_color)
+image_edit_service = ImageEditService(
+    os.path.join(settings.assets_folder, "fonts", "Poppins-ExtraBold.ttf"),
+    settings.default_text_color,
+    text_tiles_memory_limit=settings.text_tiles_memory_limit,
+)
+
+# Rendered cards are cached in memory across warm invocations and in the `/tmp` folder if it's configured
+render_executor = RenderExecutor(
+    settings.rendering_executor,
+    settings.rendering_workers,
+    card_asset_paths(settings),
+    RenderedCardCache(
+        settings.card_cache_memory_limit,
+        settings.card_cache_dir,
+        settings.card_cache_disk_max_entries,
+    ),
+    (
+        partial(warm_up_quiz_card_text, image_edit_service, settings)
+        if settings.text_tiles_warm_up
+        else None
+    ),
+)
+
+# Telegram file ids of uploaded cards are reused across warm invocations
+file_id_registry = FileIdRegistry(settings.file_id_registry_max_entries)
 
-    update_obj = types.Update(**update_event)
 
-    match settings.fact_generation_strategy:
-        case FactsGenerationStrategy.LOCAL_ZIPFILE:
-            primary_strategy = GenerationFromZipStrategy(settings)
-            facts_game_service = GuessingFactsGameService(primary_strategy, settings)
-        case FactsGenerationStrategy.GENERATIVE_AI:
-            fallback_strategy = GenerationFromZipStrategy(settings)
-            primary_strategy = GenerationFromGptStrategy(settings, fallback_strategy)
-            facts_game_service = GuessingFactsGameService(primary_strategy, settings)
-        case _:
-            raise ValueError("Unsupported fact generation strategy")
+async def main(update_event) -> None:
+    update_obj = types.Update(**update_event)
 
     await dp.feed_update(
         bot=bot,
         update=update_obj,
         facts_game_service=facts_game_service,
         image_edit_service=image_edit_service,
+        render_executor=render_executor,
+        file_id_registry=file_id_registry,
         app_settings=settings,
     )
 
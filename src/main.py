@@ -2,19 +2,23 @@ import asyncio
 import logging
 import os
 import sys
+from functools import partial
 
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
+from nationguessr.app.editing import card_asset_paths, warm_up_quiz_card_text
 from nationguessr.app.handlers import root_router
-from nationguessr.service.fsm.storage import DynamoDBStorage
-from nationguessr.service.game import (
-    GenerationFromGptStrategy,
-    GenerationFromZipStrategy,
-    GuessingFactsGameService,
+from nationguessr.service.cache import FileIdRegistry, RenderedCardCache
+from nationguessr.service.factory import (
+    create_fact_generation_strategy,
+    create_fsm_storage,
 )
+from nationguessr.service.fsm.middleware import ItemScopeMiddleware
+from nationguessr.service.game import GuessingFactsGameService
 from nationguessr.service.image import ImageEditService
-from nationguessr.settings import FactsGenerationStrategy, Settings
+from nationguessr.service.rendering import RenderExecutor
+from nationguessr.settings import Settings
 
 settings = Settings()
 
@@ -30,28 +34,36 @@ async def main():
         )
         sys.exit(1)
 
-    state_storage = DynamoDBStorage(
-        settings.aws_access_key,
-        settings.aws_secret_key,
-        settings.aws_fsm_table_name,
-        settings.aws_region,
-    )
+    state_storage = create_fsm_storage(settings)
 
-    match settings.fact_generation_strategy:
-        case FactsGenerationStrategy.LOCAL_ZIPFILE:
-            primary_strategy = GenerationFromZipStrategy(settings)
-            facts_game_service = GuessingFactsGameService(primary_strategy, settings)
-        case FactsGenerationStrategy.GENERATIVE_AI:
-            fallback_strategy = GenerationFromZipStrategy(settings)
-            primary_strategy = GenerationFromGptStrategy(settings, fallback_strategy)
-            facts_game_service = GuessingFactsGameService(primary_strategy, settings)
-        case _:
-            raise ValueError("Unsupported fact generation strategy")
+    facts_game_service = GuessingFactsGameService(
+        create_fact_generation_strategy(settings), settings
+    )
 
     text_font_path = os.path.join(
         settings.assets_folder, "fonts", "Poppins-ExtraBold.ttf"
     )
-    image_edit_service = ImageEditService(text_font_path, settings.default_text_color)
+    image_edit_service = ImageEditService(
+        text_font_path,
+        settings.default_text_color,
+        text_tiles_memory_limit=settings.text_tiles_memory_limit,
+    )
+    render_executor = RenderExecutor(
+        settings.rendering_executor,
+        settings.rendering_workers,
+        card_asset_paths(settings),
+        RenderedCardCache(
+            settings.card_cache_memory_limit,
+            settings.card_cache_dir,
+            settings.card_cache_disk_max_entries,
+        ),
+        (
+            partial(warm_up_quiz_card_text, image_edit_service, settings)
+            if settings.text_tiles_warm_up
+            else None
+        ),
+    )
+    file_id_registry = FileIdRegistry(settings.file_id_registry_max_entries)
 
     bot = Bot(
         settings.token,
@@ -59,14 +71,21 @@ async def main():
             parse_mode=ParseMode.MARKDOWN, protect_content=True
         ),
     )
-    dp = Dispatcher(storage=state_storage)
+    # The FSM middleware is registered manually, so it runs within the item scope of the storage
+    dp = Dispatcher(storage=state_storage, disable_fsm=True)
+    dp.update.outer_middleware(ItemScopeMiddleware(state_storage))
+    dp.update.outer_middleware(dp.fsm)
     dp.include_router(root_router)
+    dp.shutdown.register(facts_game_service.close)
+    dp.shutdown.register(render_executor.close)
 
     await dp.start_polling(
         bot,
         skip_updates=True,
         facts_game_service=facts_game_service,
         image_edit_service=image_edit_service,
+        render_executor=render_executor,
+        file_id_registry=file_id_registry,
         app_settings=settings,
     )
 
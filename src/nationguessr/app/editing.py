@@ -1,55 +1,116 @@
-import io
+import logging
 import os
-from typing import List
+from typing import Any, List, Sequence, Tuple
 
-import aiofiles
 from aiogram.types import BufferedInputFile
-from PIL import Image
 
 from ..data.game import GameSession
+from ..service.cache import RenderedCardCache
+from ..service.corpus import load_facts_corpus
+from ..service.encoding import EncodingProfile
 from ..service.game import number_as_character
-from ..service.image import ImageEditService
+from ..service.image import ImageEditService, load_image_asset
+from ..service.rendering import RenderExecutor
 from ..settings import Settings
 
+logger = logging.getLogger()
 
-async def edit_game_over_card(
+QUIZ_CARD_FACTS_TEXT_SIZE = 28
+
+# Bump the version on every change of card rendering, so previously cached cards are not served anymore
+CARD_RENDERER_VERSION = 1
+
+
+def card_asset_paths(app_settings: Settings) -> List[str]:
+    return [
+        os.path.join(app_settings.assets_folder, "cards", "game_over.png"),
+        os.path.join(app_settings.assets_folder, "cards", "game_scores.png"),
+        os.path.join(app_settings.assets_folder, "cards", "game_guessing.png"),
+        os.path.join(app_settings.assets_folder, "icons", "heart.png"),
+    ]
+
+
+def card_filename(card_name: str, app_settings: Settings) -> str:
+    return f"{card_name}.{EncodingProfile.from_settings(app_settings).extension}"
+
+
+def warm_up_quiz_card_text(
+    image_edit_service: ImageEditService, app_settings: Settings
+) -> None:
+    """Rasterises facts of the local facts archive into the shared cache of text tiles, so quiz
+    cards with these facts skip font rasterisation.
+
+    Args:
+        image_edit_service (ImageEditService): The service drawing on images.
+        app_settings (Settings): An application settings instance.
+    """
+
+    facts_corpus = load_facts_corpus(
+        os.path.join(app_settings.assets_folder, "data", "country_facts.zip")
+    )
+    warmed_up_facts = image_edit_service.warm_up_text_tiles(
+        (
+            fact
+            for country_code in facts_corpus.country_codes
+            for fact in facts_corpus.facts(country_code)
+        ),
+        text_size=QUIZ_CARD_FACTS_TEXT_SIZE,
+    )
+
+    logger.info(f"Rasterised text tiles of {warmed_up_facts} facts")
+
+
+def card_cache_key(
+    card_name: str,
+    image_edit_service: ImageEditService,
+    app_settings: Settings,
+    template_path: str | os.PathLike,
+    *render_inputs: Any,
+) -> str:
+    template_stat = os.stat(template_path)
+
+    return RenderedCardCache.key(
+        card_name,
+        CARD_RENDERER_VERSION,
+        (
+            os.path.basename(template_path),
+            template_stat.st_size,
+            template_stat.st_mtime_ns,
+        ),
+        image_edit_service.cache_key,
+        EncodingProfile.from_settings(app_settings),
+        *render_inputs,
+    )
+
+
+def render_game_over_card(
     image_edit_service: ImageEditService,
     app_settings: Settings,
     final_score: int,
-) -> BufferedInputFile:
+) -> bytes:
     game_over_card_template_path = os.path.join(
         app_settings.assets_folder, "cards", "game_over.png"
     )
 
-    async with aiofiles.open(game_over_card_template_path, "rb") as template_file:
-        template_image_bytes = await template_file.read()
-
-        with (
-            io.BytesIO(template_image_bytes) as img_buffer,
-            io.BytesIO() as output_img_buffer,
-        ):
-            game_over_card_template = Image.open(img_buffer)
-
-            game_over_card_image = image_edit_service.add_text(
-                game_over_card_template,
-                str(final_score),
-                text_size=128,
-                position=(0, 10),
-                center=True,
-            )
-            game_over_card_image.save(output_img_buffer, format="PNG")
-
-            output_img_buffer.seek(0)
-            output_img_bytes = output_img_buffer.read()
+    game_over_card_template = load_image_asset(game_over_card_template_path)
+    game_over_card_image = image_edit_service.add_text(
+        game_over_card_template,
+        str(final_score),
+        text_size=128,
+        position=(0, 10),
+        center=True,
+    )
 
-    return BufferedInputFile(output_img_bytes, filename="game_over_card.png")
+    return EncodingProfile.from_settings(app_settings).encode(
+        game_over_card_image, [game_over_card_template_path]
+    )
 
 
-async def edit_game_scores_card(
+def render_game_scores_card(
     image_edit_service: ImageEditService,
     game_session: GameSession,
     app_settings: Settings,
-) -> BufferedInputFile:
+) -> bytes:
     score_records = [
         f"{i + 1}. {timestamp} - {score} point(s)"
         for i, (score, timestamp) in enumerate(
@@ -61,82 +122,170 @@ async def edit_game_scores_card(
         app_settings.assets_folder, "cards", "game_scores.png"
     )
 
-    async with aiofiles.open(game_scores_template_path, "rb") as template_file:
-        template_image_bytes = await template_file.read()
-
-        with (
-            io.BytesIO(template_image_bytes) as img_buffer,
-            io.BytesIO() as output_img_buffer,
-        ):
-            game_scores_card_template = Image.open(img_buffer)
-            game_scores_image = image_edit_service.add_multiline_text(
-                game_scores_card_template,
-                score_records,
-                text_size=48,
-                position=(0, 0),
-                center=True,
-            )
-
-            game_scores_image.save(output_img_buffer, format="PNG")
-
-            output_img_buffer.seek(0)
-            output_img_bytes = output_img_buffer.read()
+    game_scores_card_template = load_image_asset(game_scores_template_path)
+    game_scores_image = image_edit_service.add_multiline_text(
+        game_scores_card_template,
+        score_records,
+        text_size=48,
+        position=(0, 0),
+        center=True,
+    )
 
-    return BufferedInputFile(output_img_bytes, filename="game_scores.png")
+    return EncodingProfile.from_settings(app_settings).encode(
+        game_scores_image, [game_scores_template_path]
+    )
 
 
-async def edit_quiz_game_card(
+def render_quiz_game_cards(
     image_edit_service: ImageEditService,
-    game_session: GameSession,
     app_settings: Settings,
     round_facts: List[str],
-) -> BufferedInputFile:
+    hud_states: Sequence[Tuple[int, int]],
+) -> List[bytes]:
+    """Renders quiz cards of the round for every HUD state. The facts panel is rendered once
+    per round, and every card is finished with blits of pre-rasterised score digits and a
+    pre-built strip of hearts.
+
+    Args:
+        image_edit_service (ImageEditService): The service drawing on images.
+        app_settings (Settings): An application settings instance.
+        round_facts (List[str]): Facts of the round.
+        hud_states (Sequence[Tuple[int, int]]): Pairs of the current score and remaining lives.
+
+    Returns:
+        List[bytes]: PNG bytes of quiz cards in the order of HUD states.
+    """
+
     quiz_card_template_path = os.path.join(
         app_settings.assets_folder, "cards", "game_guessing.png"
     )
 
     heart_icon_path = os.path.join(app_settings.assets_folder, "icons", "heart.png")
 
-    async with (
-        aiofiles.open(quiz_card_template_path, "rb") as template_file,
-        aiofiles.open(heart_icon_path, "rb") as heart_icon,
-    ):
-        template_image_bytes = await template_file.read()
-        heart_icon_bytes = await heart_icon.read()
-
-        with (
-            io.BytesIO(template_image_bytes) as img_buffer,
-            io.BytesIO(heart_icon_bytes) as heart_icon_buffer,
-            io.BytesIO() as output_img_buffer,
-        ):
-            quiz_card_template = Image.open(img_buffer)
-            heart_icon = Image.open(heart_icon_buffer)
-
-            numerated_text = [
-                f"{i + 1}. {chunk}" for i, chunk in enumerate(round_facts)
-            ]
-            quiz_card_image = image_edit_service.add_multiline_text(
-                quiz_card_template,
-                numerated_text,
-                text_size=28,
-                position=(0, -100),
-                center=True,
-            )
-            quiz_card_image = image_edit_service.add_text(
-                quiz_card_image,
-                number_as_character(game_session.current_score),
-                text_size=64,
-                position=(713, 50),
+    facts_panel_image = image_edit_service.add_numbered_text(
+        load_image_asset(quiz_card_template_path),
+        round_facts,
+        text_size=QUIZ_CARD_FACTS_TEXT_SIZE,
+        position=(0, -100),
+        center=True,
+    )
+
+    encoding_profile = EncodingProfile.from_settings(app_settings)
+    quiz_cards = []
+
+    for i, (current_score, lives_remained) in enumerate(hud_states):
+        # The last card is drawn on the facts panel itself to save a copy
+        quiz_card_image = (
+            facts_panel_image.copy() if i < len(hud_states) - 1 else facts_panel_image
+        )
+        quiz_card_image = image_edit_service.add_glyph_text(
+            quiz_card_image,
+            number_as_character(current_score),
+            text_size=64,
+            position=(713, 50),
+        )
+        quiz_card_image = image_edit_service.add_icon_strip(
+            quiz_card_image, heart_icon_path, lives_remained, position=(100, 50)
+        )
+
+        quiz_cards.append(
+            encoding_profile.encode(
+                quiz_card_image, [quiz_card_template_path, heart_icon_path]
             )
+        )
+
+    return quiz_cards
+
+
+def render_quiz_game_card(
+    image_edit_service: ImageEditService,
+    game_session: GameSession,
+    app_settings: Settings,
+    round_facts: List[str],
+) -> bytes:
+    (quiz_card,) = render_quiz_game_cards(
+        image_edit_service,
+        app_settings,
+        round_facts,
+        [(game_session.current_score, game_session.lives_remained)],
+    )
+
+    return quiz_card
 
-            for i in range(game_session.lives_remained):
-                quiz_card_template.paste(
-                    heart_icon, (100 + i * heart_icon.width, 50), mask=heart_icon
-                )
 
-            quiz_card_image.save(output_img_buffer, format="PNG")
+async def edit_game_over_card(
+    render_executor: RenderExecutor,
+    image_edit_service: ImageEditService,
+    app_settings: Settings,
+    final_score: int,
+) -> BufferedInputFile:
+    game_over_card_template_path = os.path.join(
+        app_settings.assets_folder, "cards", "game_over.png"
+    )
+
+    output_img_bytes = await render_executor.run_cached(
+        card_cache_key(
+            "game_over_card",
+            image_edit_service,
+            app_settings,
+            game_over_card_template_path,
+            final_score,
+        ),
+        render_game_over_card,
+        image_edit_service,
+        app_settings,
+        final_score,
+    )
+
+    return BufferedInputFile(
+        output_img_bytes, filename=card_filename("game_over_card", app_settings)
+    )
 
-            output_img_buffer.seek(0)
-            output_img_bytes = output_img_buffer.read()
 
-    return BufferedInputFile(output_img_bytes, filename="quiz_card.png")
+async def edit_game_scores_card(
+    render_executor: RenderExecutor,
+    image_edit_service: ImageEditService,
+    game_session: GameSession,
+    app_settings: Settings,
+) -> BufferedInputFile:
+    game_scores_template_path = os.path.join(
+        app_settings.assets_folder, "cards", "game_scores.png"
+    )
+
+    output_img_bytes = await render_executor.run_cached(
+        card_cache_key(
+            "game_scores",
+            image_edit_service,
+            app_settings,
+            game_scores_template_path,
+            sorted(game_session.score_board.items()),
+        ),
+        render_game_scores_card,
+        image_edit_service,
+        game_session,
+        app_settings,
+    )
+
+    return BufferedInputFile(
+        output_img_bytes, filename=card_filename("game_scores", app_settings)
+    )
+
+
+async def edit_quiz_game_card(
+    render_executor: RenderExecutor,
+    image_edit_service: ImageEditService,
+    game_session: GameSession,
+    app_settings: Settings,
+    round_facts: List[str],
+) -> BufferedInputFile:
+    output_img_bytes = await render_executor.run(
+        render_quiz_game_card,
+        image_edit_service,
+        game_session,
+        app_settings,
+        round_facts,
+    )
+
+    return BufferedInputFile(
+        output_img_bytes, filename=card_filename("quiz_card", app_settings)
+    )
@@ -1,4 +1,5 @@
 import logging
+from typing import List, Sequence
 
 from aiogram import F, Router, types
 from aiogram.enums import InputMediaType
@@ -7,18 +8,53 @@ from aiogram.fsm.context import FSMContext
 from aiogram.types.bot_command import BotCommand
 from aiogram.utils.markdown import link
 
-from ..data.game import GameSession
+from ..data.game import FactsGuessingGameRound, GameSession
+from ..service.cache import FileIdRegistry
 from ..service.fsm.state import BotState
-from ..service.game import GuessingFactsGameService, record_new_score
+from ..service.game import (
+    GuessingFactsGameService,
+    QuizCardRenderer,
+    record_new_score,
+)
 from ..service.image import ImageEditService
+from ..service.rendering import RenderExecutor
 from ..service.utils import batched
 from ..settings import Settings
-from .editing import edit_game_over_card, edit_game_scores_card, edit_quiz_game_card
+from .editing import (
+    card_filename,
+    edit_game_over_card,
+    edit_game_scores_card,
+    edit_quiz_game_card,
+    render_quiz_game_cards,
+)
+from .media import send_card
 
 root_router = Router(name=__name__)
 logger = logging.getLogger()
 
 
+def quiz_card_renderer(
+    render_executor: RenderExecutor,
+    image_edit_service: ImageEditService,
+    app_settings: Settings,
+) -> QuizCardRenderer:
+    async def render_quiz_cards(
+        game_round: FactsGuessingGameRound, game_sessions: Sequence[GameSession]
+    ) -> List[bytes]:
+        return await render_executor.run(
+            render_quiz_game_cards,
+            image_edit_service,
+            app_settings,
+            game_round.facts,
+            [
+                (game_session.current_score, game_session.lives_remained)
+                for game_session in game_sessions
+            ],
+        )
+
+    return render_quiz_cards
+
+
 @root_router.error(ExceptionTypeFilter(Exception), F.update.message.as_("message"))
 async def error_handler(event: types.ErrorEvent, message: types.Message):
     logger.critical(
@@ -69,6 +105,7 @@ async def start_guess_facts_game(
     message: types.Message,
     state: FSMContext,
     facts_game_service: GuessingFactsGameService,
+    render_executor: RenderExecutor,
     image_edit_service: ImageEditService,
     app_settings: Settings,
 ) -> None:
@@ -84,7 +121,11 @@ async def start_guess_facts_game(
     )
 
     game_quiz_card = await edit_quiz_game_card(
-        image_edit_service, new_game_session, app_settings, game_round.facts
+        render_executor,
+        image_edit_service,
+        new_game_session,
+        app_settings,
+        game_round.facts,
     )
 
     await state.set_state(BotState.playing_guess_facts)
@@ -108,6 +149,12 @@ async def start_guess_facts_game(
         ),
     )
 
+    facts_game_service.schedule_next_round(
+        (message.chat.id, message.from_user.id),
+        new_game_session,
+        quiz_card_renderer(render_executor, image_edit_service, app_settings),
+    )
+
 
 @root_router.message(BotState.select_game, F.text == "🚩 Guess by Flag")
 async def start_guess_flag_game(message: types.Message) -> None:
@@ -122,11 +169,14 @@ async def play_guess_facts_game(
     callback_query: types.CallbackQuery,
     state: FSMContext,
     facts_game_service: GuessingFactsGameService,
+    render_executor: RenderExecutor,
     image_edit_service: ImageEditService,
+    file_id_registry: FileIdRegistry,
     app_settings: Settings,
 ) -> None:
     state_data = await state.get_data()
     current_game_session = GameSession(**state_data)
+    chat_key = (callback_query.message.chat.id, callback_query.from_user.id)
 
     if (
         callback_query.data is None
@@ -145,18 +195,21 @@ async def play_guess_facts_game(
         current_game_session.current_score += 1
 
     if current_game_session.lives_remained == 0:
+        facts_game_service.discard_next_round(chat_key)
+
         current_score = current_game_session.current_score
         current_game_session = record_new_score(current_game_session, app_settings)
         game_over_card = await edit_game_over_card(
-            image_edit_service, app_settings, current_score
+            render_executor, image_edit_service, app_settings, current_score
         )
 
         await state.set_state(BotState.select_game)
         await state.update_data(**current_game_session.model_dump())
-        await callback_query.message.edit_media(
-            types.InputMediaPhoto(
-                type=InputMediaType.PHOTO,
-                media=game_over_card,
+        await send_card(
+            game_over_card,
+            file_id_registry,
+            lambda photo: callback_query.message.edit_media(
+                types.InputMediaPhoto(type=InputMediaType.PHOTO, media=photo),
             ),
         )
 
@@ -178,10 +231,26 @@ async def play_guess_facts_game(
 
         return
 
-    game_round = await facts_game_service.new_game_round()
-    game_quiz_card = await edit_quiz_game_card(
-        image_edit_service, current_game_session, app_settings, game_round.facts
+    next_round = await facts_game_service.take_next_round(
+        chat_key, current_game_session
     )
+    if next_round is None:
+        next_round = await facts_game_service.new_game_round(), None
+
+    game_round, game_quiz_card_bytes = next_round
+
+    if game_quiz_card_bytes is not None:
+        game_quiz_card = types.BufferedInputFile(
+            game_quiz_card_bytes, filename=card_filename("quiz_card", app_settings)
+        )
+    else:
+        game_quiz_card = await edit_quiz_game_card(
+            render_executor,
+            image_edit_service,
+            current_game_session,
+            app_settings,
+            game_round.facts,
+        )
 
     current_game_session.options = game_round.options
     current_game_session.correct_option = game_round.correct_option
@@ -207,6 +276,12 @@ async def play_guess_facts_game(
 
     await callback_query.answer()
 
+    facts_game_service.schedule_next_round(
+        chat_key,
+        current_game_session,
+        quiz_card_renderer(render_executor, image_edit_service, app_settings),
+    )
+
 
 @root_router.message(
     Command(
@@ -219,7 +294,10 @@ async def play_guess_facts_game(
 async def restart_handler(
     message: types.Message,
     state: FSMContext,
+    facts_game_service: GuessingFactsGameService,
+    render_executor: RenderExecutor,
     image_edit_service: ImageEditService,
+    file_id_registry: FileIdRegistry,
     app_settings: Settings,
 ) -> None:
     logger.info(
@@ -227,29 +305,35 @@ async def restart_handler(
         " command"
     )
 
+    facts_game_service.discard_next_round((message.chat.id, message.from_user.id))
+
     state_data = await state.get_data()
     current_game_session = GameSession(**state_data)
 
     current_score = current_game_session.current_score
     current_game_session = record_new_score(current_game_session, app_settings)
     game_over_card = await edit_game_over_card(
-        image_edit_service, app_settings, current_score
+        render_executor, image_edit_service, app_settings, current_score
     )
 
     await state.set_state(BotState.select_game)
     await state.update_data(**current_game_session.model_dump())
-    await message.answer_photo(
+    await send_card(
         game_over_card,
-        caption="👾 The game is over! Want to give it another go? Just select new game from the options below to "
-        "start fresh!",
-        reply_markup=types.ReplyKeyboardMarkup(
-            keyboard=[
-                [
-                    types.KeyboardButton(text="🔍 Guess from Facts"),
-                    types.KeyboardButton(text="🚩 Guess by Flag"),
-                ]
-            ],
-            resize_keyboard=True,
+        file_id_registry,
+        lambda photo: message.answer_photo(
+            photo,
+            caption="👾 The game is over! Want to give it another go? Just select new game from the options below "
+            "to start fresh!",
+            reply_markup=types.ReplyKeyboardMarkup(
+                keyboard=[
+                    [
+                        types.KeyboardButton(text="🔍 Guess from Facts"),
+                        types.KeyboardButton(text="🚩 Guess by Flag"),
+                    ]
+                ],
+                resize_keyboard=True,
+            ),
         ),
     )
 
@@ -283,7 +367,9 @@ async def tutorial_handler(message: types.Message, app_settings: Settings) -> No
 async def score_handler(
     message: types.Message,
     state: FSMContext,
+    render_executor: RenderExecutor,
     image_edit_service: ImageEditService,
+    file_id_registry: FileIdRegistry,
     app_settings: Settings,
 ) -> None:
     logger.info(
@@ -300,10 +386,10 @@ async def score_handler(
             await message.answer("🌟 Your scoreboard is a blank canvas!")
         else:
             game_scores_card = await edit_game_scores_card(
-                image_edit_service, current_game_session, app_settings
+                render_executor, image_edit_service, current_game_session, app_settings
             )
 
-            await message.answer_photo(game_scores_card)
+            await send_card(game_scores_card, file_id_registry, message.answer_photo)
     else:
         await message.answer("🌟 Your scoreboard is a blank canvas!")
 
@@ -0,0 +1,45 @@
+import logging
+from typing import Awaitable, Callable
+
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.types import BufferedInputFile, InputFile, Message
+
+from ..service.cache import FileIdRegistry
+
+logger = logging.getLogger()
+
+
+async def send_card(
+    card: BufferedInputFile,
+    file_id_registry: FileIdRegistry,
+    send_photo: Callable[[InputFile | str], Awaitable[Message | bool]],
+) -> Message | bool:
+    """Sends the card by its Telegram `file_id` if the same card was uploaded before, otherwise
+    uploads the card and registers the `file_id` of the sent photo. If Telegram rejects a stale
+    `file_id`, the id is discarded and the card is uploaded again.
+
+    Args:
+        card (BufferedInputFile): The rendered card.
+        file_id_registry (FileIdRegistry): The registry of uploaded cards.
+        send_photo (Callable[[InputFile | str], Awaitable[Message | bool]]): A coroutine function
+            sending a photo given as a file or a `file_id`, e.g., a bound `answer_photo`.
+
+    Returns:
+        Message | bool: The result of the send call.
+    """
+
+    content_hash = FileIdRegistry.content_hash(card.data)
+
+    if (file_id := file_id_registry.get(content_hash)) is not None:
+        try:
+            return await send_photo(file_id)
+        except TelegramBadRequest as ex:
+            logger.warning(f"Failed to send the card by a registered file_id: '{ex}'")
+            file_id_registry.discard(content_hash)
+
+    sent_message = await send_photo(card)
+
+    if isinstance(sent_message, Message) and sent_message.photo:
+        file_id_registry.put(content_hash, sent_message.photo[-1].file_id)
+
+    return sent_message
@@ -0,0 +1,381 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, List
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class FactsCache:
+    def __init__(
+        self,
+        db_path: str | os.PathLike,
+        ttl: float,
+        max_entries: int,
+        sets_per_entry: int = 3,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """A persistent SQLite cache of generated fact sets. An entry of the cache is keyed by
+        the country code and the prompt version and holds up to `sets_per_entry` fact sets, so
+        facts keep rotating between rounds. A fact set expires `ttl` seconds after it was added.
+        The cache keeps at most `max_entries` entries and evicts the least recently used ones.
+
+        Args:
+            db_path (str | os.PathLike): The path to the SQLite database file.
+            ttl (float): The lifetime of a fact set in seconds.
+            max_entries (int): The maximum number of entries in the cache.
+            sets_per_entry (int): The number of fact sets an entry holds before it is served.
+            clock (Callable[[], float]): A function returning the current time in seconds.
+        """
+
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._sets_per_entry = sets_per_entry
+        self._clock = clock
+        self._stats = CacheStats()
+
+        self._lock = threading.Lock()
+
+        if db_dir := os.path.dirname(db_path):
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                country_code TEXT NOT NULL,
+                prompt_version TEXT NOT NULL,
+                last_used_at REAL NOT NULL,
+                PRIMARY KEY (country_code, prompt_version)
+            );
+            CREATE TABLE IF NOT EXISTS fact_sets (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                country_code TEXT NOT NULL,
+                prompt_version TEXT NOT NULL,
+                facts TEXT NOT NULL,
+                created_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS fact_sets_key
+                ON fact_sets (country_code, prompt_version);
+            CREATE INDEX IF NOT EXISTS entries_last_used_at
+                ON entries (last_used_at);
+            """
+        )
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(**vars(self._stats))
+
+    def get(self, country_code: str, prompt_version: str) -> List[str] | None:
+        """Returns a random non-expired fact set of the entry. An entry is served only when it
+        holds all `sets_per_entry` fact sets, otherwise it is a miss and the caller is expected
+        to generate and `put` a new fact set.
+
+        Args:
+            country_code (str): The ISO 3166-1 alpha-2 code of the country.
+            prompt_version (str): The version of the prompt the facts were generated with.
+
+        Returns:
+            List[str] | None: A cached fact set, or None on a cache miss.
+        """
+
+        now = self._clock()
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM fact_sets WHERE country_code = ? AND prompt_version = ?"
+                " AND created_at <= ?",
+                (country_code, prompt_version, now - self._ttl),
+            )
+            fact_sets = self._connection.execute(
+                "SELECT facts FROM fact_sets WHERE country_code = ? AND prompt_version = ?"
+                " ORDER BY RANDOM()",
+                (country_code, prompt_version),
+            ).fetchall()
+
+            if len(fact_sets) < self._sets_per_entry:
+                self._stats.misses += 1
+                return None
+
+            self._connection.execute(
+                "UPDATE entries SET last_used_at = ?"
+                " WHERE country_code = ? AND prompt_version = ?",
+                (now, country_code, prompt_version),
+            )
+            self._stats.hits += 1
+
+        return json.loads(fact_sets[0][0])
+
+    def put(self, country_code: str, prompt_version: str, facts: List[str]) -> None:
+        """Adds a fact set to the entry, dropping the oldest fact sets of the entry above
+        `sets_per_entry` and the least recently used entries above `max_entries`.
+
+        Args:
+            country_code (str): The ISO 3166-1 alpha-2 code of the country.
+            prompt_version (str): The version of the prompt the facts were generated with.
+            facts (List[str]): The generated fact set.
+        """
+
+        now = self._clock()
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO fact_sets (country_code, prompt_version, facts, created_at)"
+                " VALUES (?, ?, ?, ?)",
+                (country_code, prompt_version, json.dumps(facts), now),
+            )
+            self._connection.execute(
+                "DELETE FROM fact_sets WHERE id IN (SELECT id FROM fact_sets"
+                " WHERE country_code = ? AND prompt_version = ?"
+                " ORDER BY created_at DESC, id DESC LIMIT -1 OFFSET ?)",
+                (country_code, prompt_version, self._sets_per_entry),
+            )
+            self._connection.execute(
+                "INSERT INTO entries (country_code, prompt_version, last_used_at)"
+                " VALUES (?, ?, ?) ON CONFLICT (country_code, prompt_version)"
+                " DO UPDATE SET last_used_at = excluded.last_used_at",
+                (country_code, prompt_version, now),
+            )
+
+            evicted_entries = self._connection.execute(
+                "SELECT country_code, prompt_version FROM entries"
+                " ORDER BY last_used_at DESC LIMIT -1 OFFSET ?",
+                (self._max_entries,),
+            ).fetchall()
+
+            for evicted_entry in evicted_entries:
+                self._connection.execute(
+                    "DELETE FROM entries WHERE country_code = ? AND prompt_version = ?",
+                    evicted_entry,
+                )
+                self._connection.execute(
+                    "DELETE FROM fact_sets WHERE country_code = ? AND prompt_version = ?",
+                    evicted_entry,
+                )
+
+            self._stats.evictions += len(evicted_entries)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class RenderedCardCache:
+    def __init__(
+        self,
+        memory_limit: int,
+        disk_dir: str | os.PathLike | None = None,
+        disk_max_entries: int = 1024,
+    ) -> None:
+        """A content-addressed two-tier cache of rendered cards. The memory tier is an LRU cache
+        limited by the total size of cards in bytes. The optional disk tier keeps up to
+        `disk_max_entries` cards as files in the directory and evicts the least recently used
+        ones. Cards found only on disk are promoted to memory.
+
+        Args:
+            memory_limit (int): The maximum total size of cards in memory in bytes.
+            disk_dir (str | os.PathLike | None): The directory of the disk tier, e.g., `/tmp` on
+                AWS Lambda. The disk tier is disabled if not set.
+            disk_max_entries (int): The maximum number of cards in the disk tier.
+        """
+
+        self._memory_limit = memory_limit
+        self._disk_dir = disk_dir
+        self._disk_max_entries = disk_max_entries
+
+        self._memory_entries: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_size = 0
+        self._disk_entries: OrderedDict[str, None] = OrderedDict()
+        self._memory_stats = CacheStats()
+        self._disk_stats = CacheStats()
+        self._lock = threading.Lock()
+
+        if disk_dir is not None:
+            os.makedirs(disk_dir, exist_ok=True)
+
+            # Cards left by a previous process are restored from the oldest to the most recently used
+            disk_files = sorted(
+                (
+                    entry
+                    for entry in os.scandir(disk_dir)
+                    if entry.name.endswith(".card")
+                ),
+                key=lambda entry: entry.stat().st_mtime_ns,
+            )
+
+            for disk_file in disk_files:
+                self._disk_entries[disk_file.name.removesuffix(".card")] = None
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        """Builds a cache key from the hash of all parts, e.g., the template, render inputs and
+        the renderer version. Parts must be JSON-serializable or convertible to strings.
+
+        Args:
+            *parts (Any): Values that fully determine the rendered card.
+
+        Returns:
+            str: A hexadecimal SHA-256 digest of the parts.
+        """
+
+        serialized_parts = json.dumps(parts, sort_keys=True, default=str)
+
+        return hashlib.sha256(serialized_parts.encode("utf-8")).hexdigest()
+
+    @property
+    def memory_stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(**vars(self._memory_stats))
+
+    @property
+    def disk_stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(**vars(self._disk_stats))
+
+    def _disk_path(self, card_key: str) -> str:
+        return os.path.join(self._disk_dir, f"{card_key}.card")
+
+    def get(self, card_key: str) -> bytes | None:
+        """Returns the cached card, looking it up in memory first and then on disk.
+
+        Args:
+            card_key (str): The key built by `RenderedCardCache.key`.
+
+        Returns:
+            bytes | None: The card bytes, or None on a miss of both tiers.
+        """
+
+        with self._lock:
+            if (card := self._memory_entries.get(card_key)) is not None:
+                self._memory_entries.move_to_end(card_key)
+                self._memory_stats.hits += 1
+                return card
+
+            self._memory_stats.misses += 1
+
+            if self._disk_dir is None:
+                return None
+
+            if card_key not in self._disk_entries:
+                self._disk_stats.misses += 1
+                return None
+
+            try:
+                with open(self._disk_path(card_key), "rb") as card_file:
+                    card = card_file.read()
+
+                os.utime(self._disk_path(card_key))
+            except OSError:
+                del self._disk_entries[card_key]
+                self._disk_stats.misses += 1
+                return None
+
+            self._disk_entries.move_to_end(card_key)
+            self._disk_stats.hits += 1
+            self._put_memory(card_key, card)
+
+        return card
+
+    def put(self, card_key: str, card: bytes) -> None:
+        """Adds the card to both tiers, evicting the least recently used cards above limits.
+
+        Args:
+            card_key (str): The key built by `RenderedCardCache.key`.
+            card (bytes): The rendered card.
+        """
+
+        with self._lock:
+            self._put_memory(card_key, card)
+
+            if self._disk_dir is None:
+                return
+
+            # The card is written to a temporary file first, so readers never see a partial card
+            temporary_path = f"{self._disk_path(card_key)}.{os.getpid()}.tmp"
+
+            with open(temporary_path, "wb") as card_file:
+                card_file.write(card)
+
+            os.replace(temporary_path, self._disk_path(card_key))
+
+            self._disk_entries[card_key] = None
+            self._disk_entries.move_to_end(card_key)
+
+            while len(self._disk_entries) > self._disk_max_entries:
+                evicted_key, _ = self._disk_entries.popitem(last=False)
+                self._disk_stats.evictions += 1
+
+                try:
+                    os.remove(self._disk_path(evicted_key))
+                except FileNotFoundError:
+                    pass
+
+    def _put_memory(self, card_key: str, card: bytes) -> None:
+        if len(card) > self._memory_limit:
+            return
+
+        if (previous_card := self._memory_entries.pop(card_key, None)) is not None:
+            self._memory_size -= len(previous_card)
+
+        self._memory_entries[card_key] = card
+        self._memory_size += len(card)
+
+        while self._memory_size > self._memory_limit:
+            _, evicted_card = self._memory_entries.popitem(last=False)
+            self._memory_size -= len(evicted_card)
+            self._memory_stats.evictions += 1
+
+
+class FileIdRegistry:
+    def __init__(self, max_entries: int = 4096) -> None:
+        """A registry of Telegram `file_id` values of uploaded files, keyed by the hash of file
+        contents. Files with a known `file_id` can be sent again without uploading their bytes.
+        The registry keeps at most `max_entries` ids and evicts the least recently used ones.
+
+        Args:
+            max_entries (int): The maximum number of registered ids.
+        """
+
+        self._max_entries = max_entries
+        self._file_ids: OrderedDict[str, str] = OrderedDict()
+        self._stats = CacheStats()
+
+    @staticmethod
+    def content_hash(content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(**vars(self._stats))
+
+    def get(self, content_hash: str) -> str | None:
+        if (file_id := self._file_ids.get(content_hash)) is None:
+            self._stats.misses += 1
+            return None
+
+        self._file_ids.move_to_end(content_hash)
+        self._stats.hits += 1
+
+        return file_id
+
+    def put(self, content_hash: str, file_id: str) -> None:
+        self._file_ids[content_hash] = file_id
+        self._file_ids.move_to_end(content_hash)
+
+        while len(self._file_ids) > self._max_entries:
+            self._file_ids.popitem(last=False)
+            self._stats.evictions += 1
+
+    def discard(self, content_hash: str) -> None:
+        self._file_ids.pop(content_hash, None)
@@ -0,0 +1,99 @@
+import csv
+import os
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Iterable, List, Mapping, Tuple
+
+
+class CountryCatalog:
+    __slots__ = ("_codes", "_names", "_code_index", "_name_index")
+
+    def __init__(self, countries: Iterable[Tuple[str, str]]) -> None:
+        codes, names = [], []
+
+        for country_code, country_name in countries:
+            codes.append(country_code)
+            names.append(country_name)
+
+        self._codes: Tuple[str, ...] = tuple(codes)
+        self._names: Tuple[str, ...] = tuple(names)
+        self._code_index: Mapping[str, int] = MappingProxyType(
+            {country_code: index for index, country_code in enumerate(self._codes)}
+        )
+        self._name_index: Mapping[str, int] = MappingProxyType(
+            {country_name: index for index, country_name in enumerate(self._names)}
+        )
+
+    @classmethod
+    def from_csv(cls, csv_path: str | os.PathLike) -> "CountryCatalog":
+        """Reads the list of countries from a CSV file, where every row has the format
+        `id,code,name`. Countries are stored in the order of rows in the file.
+
+        Args:
+            csv_path (str | os.PathLike): The path to the CSV file with countries.
+
+        Returns:
+            CountryCatalog: A catalog instance with all countries from the file.
+        """
+
+        with open(csv_path, encoding="utf-8", newline="") as countries_file:
+            reader = csv.reader(countries_file, delimiter=",", quotechar='"')
+
+            return cls((code, name) for _, code, name in reader)
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    @property
+    def codes(self) -> Tuple[str, ...]:
+        return self._codes
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        return self._names
+
+    def index(self, country_code: str) -> int:
+        return self._code_index[country_code]
+
+    def name_index(self, country_name: str) -> int:
+        return self._name_index[country_name]
+
+    def code(self, index: int) -> str:
+        return self._codes[index]
+
+    def name(self, country_code: str) -> str:
+        """Looks up the country name by its code.
+
+        Args:
+            country_code (str): The ISO 3166-1 alpha-2 code of the country.
+
+        Returns:
+            str: The name of the country.
+
+        Raises:
+            KeyError: If the country is not in the catalog.
+        """
+
+        return self._names[self._code_index[country_code]]
+
+    def countries(self, indices: Iterable[int]) -> List[Tuple[str, str]]:
+        return [(self._codes[index], self._names[index]) for index in indices]
+
+
+@lru_cache(maxsize=None)
+def _load_country_catalog(csv_path: str) -> CountryCatalog:
+    return CountryCatalog.from_csv(csv_path)
+
+
+def load_country_catalog(csv_path: str | os.PathLike) -> CountryCatalog:
+    """Returns a process-wide catalog instance for the CSV file with countries. The file is read
+    only on the first call.
+
+    Args:
+        csv_path (str | os.PathLike): The path to the CSV file with countries.
+
+    Returns:
+        CountryCatalog: A shared catalog instance.
+    """
+
+    return _load_country_catalog(os.path.abspath(csv_path))
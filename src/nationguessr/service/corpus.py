@@ -0,0 +1,186 @@
+import csv
+import io
+import os
+import random
+import zipfile
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+CategoriesIndex = Dict[str, Tuple[int, ...]]
+
+
+def _shuffled(items: Sequence[int], k: int) -> Iterator[int]:
+    yield from random.sample(items, k=min(k, len(items)))
+
+
+class FactsCorpus:
+    def __init__(
+        self,
+        facts: Dict[str, Tuple[str, ...]],
+        categories: Dict[str, CategoriesIndex] | None = None,
+    ) -> None:
+        self._facts = facts
+        self._categories = categories or {}
+
+    @classmethod
+    def from_zip(cls, zip_path: str | os.PathLike) -> "FactsCorpus":
+        """Decompresses and parses every country file of the facts archive into memory. Each member
+        of the archive is a CSV file named after the country code, where every row has the format
+        `id,categories,fact`. While parsing, an inverted index from the fact category to the fact
+        indices is built for every country, where categories are taken from the pipe-separated
+        category column.
+
+        Args:
+            zip_path (str | os.PathLike): The path to the archive with country facts.
+
+        Returns:
+            FactsCorpus: A corpus instance with facts of all countries from the archive.
+        """
+
+        facts = {}
+        categories = {}
+
+        with zipfile.ZipFile(zip_path) as facts_zip:
+            for member in facts_zip.infolist():
+                country_code, _ = os.path.splitext(member.filename)
+
+                with facts_zip.open(member) as facts_file:
+                    reader = csv.reader(
+                        io.TextIOWrapper(facts_file, encoding="utf-8"),
+                        delimiter=",",
+                        quotechar='"',
+                    )
+                    country_facts = []
+                    country_categories: Dict[str, List[int]] = {}
+
+                    for _, fact_categories, fact in reader:
+                        for category in fact_categories.split("|"):
+                            if category := category.strip().lower():
+                                country_categories.setdefault(category, []).append(
+                                    len(country_facts)
+                                )
+
+                        country_facts.append(fact)
+
+                facts[country_code] = tuple(country_facts)
+                categories[country_code] = {
+                    category: tuple(fact_ids)
+                    for category, fact_ids in country_categories.items()
+                }
+
+        return cls(facts, categories)
+
+    @property
+    def country_codes(self) -> List[str]:
+        return list(self._facts.keys())
+
+    def facts(self, country_code: str) -> Tuple[str, ...]:
+        return self._facts[country_code]
+
+    def facts_num(self, country_code: str) -> int:
+        return len(self._facts[country_code])
+
+    def categories(self, country_code: str) -> List[str]:
+        return list(self._categories.get(country_code, {}).keys())
+
+    def sample(self, country_code: str, k: int) -> List[str]:
+        """Selects `k` random unique facts about the country. If the country has fewer facts than
+        requested, all of them are returned in random order.
+
+        Args:
+            country_code (str): The ISO 3166-1 alpha-2 code of the country.
+            k (int): The number of facts to select.
+
+        Returns:
+            List[str]: A list of randomly selected facts.
+
+        Raises:
+            KeyError: If there are no facts about the country in the corpus.
+        """
+
+        country_facts = self._facts[country_code]
+
+        return random.sample(country_facts, k=min(k, len(country_facts)))
+
+    def sample_balanced(
+        self, country_code: str, k: int, categories: Iterable[str] | None = None
+    ) -> List[str]:
+        """Selects `k` random unique facts about the country, spread evenly across fact categories.
+        Categories are visited in random order, and each visit picks one not yet selected fact from
+        the category, so the round takes O(k) category lookups instead of a country facts rescan.
+        If `categories` are provided, only facts from these categories are considered, therefore
+        fewer than `k` facts can be returned.
+
+        Args:
+            country_code (str): The ISO 3166-1 alpha-2 code of the country.
+            k (int): The number of facts to select.
+            categories (Iterable[str] | None, optional): Fact categories to select facts from.
+                If not provided, all categories of the country are used.
+
+        Returns:
+            List[str]: A list of randomly selected facts.
+
+        Raises:
+            KeyError: If there are no facts about the country in the corpus.
+        """
+
+        country_facts = self._facts[country_code]
+        country_categories = self._categories.get(country_code, {})
+
+        selected_categories = (
+            list(country_categories.keys())
+            if categories is None
+            else [
+                category
+                for category in dict.fromkeys(c.lower() for c in categories)
+                if category in country_categories
+            ]
+        )
+        random.shuffle(selected_categories)
+
+        candidates = [
+            _shuffled(country_categories[category], k)
+            for category in selected_categories
+        ]
+        selected_fact_ids: Dict[int, None] = {}
+
+        while candidates and len(selected_fact_ids) < k:
+            remaining_candidates = []
+
+            for category_fact_ids in candidates:
+                fact_id = next(
+                    (i for i in category_fact_ids if i not in selected_fact_ids), None
+                )
+
+                if fact_id is None:
+                    continue
+
+                selected_fact_ids[fact_id] = None
+                remaining_candidates.append(category_fact_ids)
+
+                if len(selected_fact_ids) == k:
+                    break
+
+            candidates = remaining_candidates
+
+        return [country_facts[fact_id] for fact_id in selected_fact_ids]
+
+
+@lru_cache(maxsize=None)
+def _load_facts_corpus(zip_path: str) -> FactsCorpus:
+    return FactsCorpus.from_zip(zip_path)
+
+
+def load_facts_corpus(zip_path: str | os.PathLike) -> FactsCorpus:
+    """Returns a process-wide corpus instance for the facts archive. The archive is decompressed
+    and parsed only on the first call, subsequent calls (e.g., on warm Lambda invocations) reuse the
+    already loaded corpus.
+
+    Args:
+        zip_path (str | os.PathLike): The path to the archive with country facts.
+
+    Returns:
+        FactsCorpus: A shared corpus instance.
+    """
+
+    return _load_facts_corpus(os.path.abspath(zip_path))
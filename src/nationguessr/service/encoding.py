@@ -0,0 +1,156 @@
+import io
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Sequence, Tuple
+
+from PIL import Image
+
+from ..settings import CardEncodingFormat, Settings
+from .image import load_image_asset
+
+# The last palette index is reserved for transparent pixels of palette-quantised images
+PALETTE_COLORS_NUM = 255
+TRANSPARENT_INDEX = 255
+
+
+@lru_cache(maxsize=16)
+def _load_image_palette(image_paths: Tuple[str, ...]) -> Image.Image:
+    palette_sources = [
+        load_image_asset(image_path, mode="RGB") for image_path in image_paths
+    ]
+    palette_source = Image.new(
+        "RGB",
+        (
+            max(image.width for image in palette_sources),
+            sum(image.height for image in palette_sources),
+        ),
+    )
+
+    y = 0
+
+    for image in palette_sources:
+        palette_source.paste(image, (0, y))
+        y += image.height
+
+    return palette_source.quantize(PALETTE_COLORS_NUM)
+
+
+def load_image_palette(image_paths: Sequence[str | os.PathLike]) -> Image.Image:
+    """Returns a process-wide palette image with up to 255 colors, which is quantised from all
+    listed images at once, e.g., a card template and icons drawn on it.
+
+    Args:
+        image_paths (Sequence[str | os.PathLike]): Paths to images the palette is built from.
+
+    Returns:
+        Image.Image: A shared image in `P` mode carrying the palette.
+    """
+
+    return _load_image_palette(
+        tuple(os.path.abspath(image_path) for image_path in image_paths)
+    )
+
+
+@dataclass(frozen=True)
+class EncodingProfile:
+    format: CardEncodingFormat = CardEncodingFormat.PNG
+    compression_level: int = 6
+    quality: int = 85
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "EncodingProfile":
+        return cls(
+            format=settings.card_encoding_format,
+            compression_level=settings.card_compression_level,
+            quality=settings.card_quality,
+        )
+
+    @property
+    def extension(self) -> str:
+        match self.format:
+            case CardEncodingFormat.JPEG:
+                return "jpg"
+            case CardEncodingFormat.WEBP:
+                return "webp"
+            case _:
+                return "png"
+
+    def encode(
+        self, image: Image.Image, palette_paths: Sequence[str | os.PathLike] = ()
+    ) -> bytes:
+        """Encodes the image with the profile. JPEG images lose transparency and are flattened on
+        a white background, palette-quantised PNG images keep only fully transparent pixels.
+
+        Args:
+            image (Image.Image): The image to encode.
+            palette_paths (Sequence[str | os.PathLike]): Paths to images the palette of
+                `CardEncodingFormat.PNG_PALETTE` is precomputed from. If empty, the palette is
+                quantised from the image itself.
+
+        Returns:
+            bytes: The encoded image.
+        """
+
+        with io.BytesIO() as output_img_buffer:
+            match self.format:
+                case CardEncodingFormat.PNG:
+                    image.save(
+                        output_img_buffer,
+                        format="PNG",
+                        compress_level=self.compression_level,
+                    )
+                case CardEncodingFormat.PNG_PALETTE:
+                    self._quantize(image, palette_paths).save(
+                        output_img_buffer,
+                        format="PNG",
+                        compress_level=self.compression_level,
+                        transparency=TRANSPARENT_INDEX,
+                    )
+                case CardEncodingFormat.JPEG:
+                    self._flatten(image).save(
+                        output_img_buffer, format="JPEG", quality=self.quality
+                    )
+                case CardEncodingFormat.WEBP:
+                    image.save(output_img_buffer, format="WEBP", quality=self.quality)
+
+            return output_img_buffer.getvalue()
+
+    @staticmethod
+    def _quantize(
+        image: Image.Image, palette_paths: Sequence[str | os.PathLike]
+    ) -> Image.Image:
+        rgb_image = image.convert("RGB")
+
+        # Dithering is disabled, since flat card colors compress better without it
+        if palette_paths:
+            quantized_image = rgb_image.quantize(
+                palette=load_image_palette(palette_paths), dither=Image.Dither.NONE
+            )
+        else:
+            quantized_image = rgb_image.quantize(
+                PALETTE_COLORS_NUM, dither=Image.Dither.NONE
+            )
+
+        palette = quantized_image.getpalette()
+        quantized_image.putpalette(
+            palette + [0] * (3 * (TRANSPARENT_INDEX + 1) - len(palette))
+        )
+
+        if "A" in image.getbands():
+            quantized_image.paste(
+                TRANSPARENT_INDEX,
+                mask=image.getchannel("A").point(lambda alpha: 255 * (alpha < 128)),
+            )
+
+        return quantized_image
+
+    @staticmethod
+    def _flatten(image: Image.Image) -> Image.Image:
+        if "A" not in image.getbands():
+            return image.convert("RGB")
+
+        flattened_image = Image.new("RGB", image.size, (255, 255, 255))
+        flattened_image.paste(image, mask=image.getchannel("A"))
+
+        return flattened_image
@@ -0,0 +1,127 @@
+import os
+
+from ..settings import FactsGenerationStrategy, FsmDataLayout, Settings
+from .cache import FactsCache
+from .catalog import load_country_catalog
+from .fsm.codec import SessionCodec
+from .fsm.storage import DynamoDBStorage
+from .game import (
+    FactGenerationStrategy,
+    GenerationFromCacheStrategy,
+    GenerationFromFactStoreStrategy,
+    GenerationFromGptStrategy,
+    GenerationFromZipStrategy,
+    GenerationWithDeadlineStrategy,
+    GenerationWithFallbackStrategy,
+)
+from .prefetch import FactsPrefetchPool, GenerationFromPrefetchPoolStrategy
+from .resilience import CircuitBreaker, GenerationWithCircuitBreakerStrategy
+
+
+def create_fact_generation_strategy(settings: Settings) -> FactGenerationStrategy:
+    """Builds the fact generation strategy selected in the application settings, including
+    its fallback strategies.
+
+    Args:
+        settings (Settings): An application settings instance.
+
+    Returns:
+        FactGenerationStrategy: The configured fact generation strategy.
+
+    Raises:
+        ValueError: If the selected fact generation strategy is not supported.
+    """
+
+    match settings.fact_generation_strategy:
+        case FactsGenerationStrategy.LOCAL_ZIPFILE:
+            return GenerationFromZipStrategy(settings)
+        case FactsGenerationStrategy.LOCAL_FACTSTORE:
+            return GenerationFromFactStoreStrategy(settings)
+        case FactsGenerationStrategy.GENERATIVE_AI:
+            fallback_strategy = GenerationFromZipStrategy(settings)
+            gpt_strategy = GenerationFromGptStrategy(settings)
+            source_strategy = GenerationWithCircuitBreakerStrategy(
+                gpt_strategy,
+                CircuitBreaker(
+                    failure_rate_threshold=settings.openai_breaker_failure_rate,
+                    slow_call_duration=settings.openai_breaker_slow_call_duration,
+                    window_size=settings.openai_breaker_window_size,
+                    min_calls=settings.openai_breaker_min_calls,
+                    open_duration=settings.openai_breaker_open_duration,
+                ),
+                max_concurrency=settings.openai_max_concurrency,
+                max_queue_size=settings.openai_max_queue_size,
+            )
+
+            if settings.facts_cache_dir:
+                facts_cache = FactsCache(
+                    os.path.join(settings.facts_cache_dir, "generated_facts.sqlite3"),
+                    ttl=settings.facts_cache_ttl,
+                    max_entries=settings.facts_cache_max_entries,
+                    sets_per_entry=settings.facts_cache_sets_per_entry,
+                )
+                source_strategy = GenerationFromCacheStrategy(
+                    source_strategy, facts_cache, gpt_strategy.prompt_version
+                )
+
+            if settings.facts_prefetch_depth:
+                catalog = load_country_catalog(
+                    os.path.join(settings.assets_folder, "data", "countries.csv")
+                )
+                prefetch_pool = FactsPrefetchPool(
+                    source_strategy,
+                    catalog.codes,
+                    depth=settings.facts_prefetch_depth,
+                    low_watermark=settings.facts_prefetch_low_watermark,
+                    concurrency=settings.facts_prefetch_concurrency,
+                    # Larger batches would be split into several requests within a single
+                    # concurrency slot of the circuit breaker
+                    batch_size=min(
+                        settings.facts_prefetch_batch_size, gpt_strategy.max_batch_size
+                    ),
+                )
+
+                return GenerationFromPrefetchPoolStrategy(
+                    prefetch_pool, fallback_strategy
+                )
+
+            if settings.facts_generation_deadline:
+                return GenerationWithDeadlineStrategy(
+                    source_strategy,
+                    fallback_strategy,
+                    deadline=settings.facts_generation_deadline,
+                    cancel_late=not settings.facts_cache_dir,
+                )
+
+            return GenerationWithFallbackStrategy(source_strategy, fallback_strategy)
+        case _:
+            raise ValueError("Unsupported fact generation strategy")
+
+
+def create_fsm_storage(settings: Settings) -> DynamoDBStorage:
+    """Builds the FSM storage with the data layout selected in the application settings.
+
+    Args:
+        settings (Settings): An application settings instance.
+
+    Returns:
+        DynamoDBStorage: The configured FSM storage.
+    """
+
+    # The codec is kept for every layout, so binary items stay readable after switching back
+    data_codec = SessionCodec(
+        load_country_catalog(
+            os.path.join(settings.assets_folder, "data", "countries.csv")
+        ),
+        settings.aws_fsm_data_compression_level,
+    )
+
+    return DynamoDBStorage(
+        settings.aws_access_key,
+        settings.aws_secret_key,
+        settings.aws_fsm_table_name,
+        settings.aws_region,
+        settings.aws_fsm_write_behind,
+        data_codec,
+        settings.aws_fsm_data_layout == FsmDataLayout.BINARY,
+    )
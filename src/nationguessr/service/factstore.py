@@ -0,0 +1,187 @@
+import mmap
+import os
+import random
+import struct
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from .corpus import FactsCorpus
+
+# Binary layout of the compiled facts store (all integers are little-endian):
+#
+#   header         | magic (4s) | version (H) | reserved (H) | countries num (I) | facts num (I) |
+#   country table  | country code (4s) | first fact index (I) | facts num (I) |  x countries num
+#   offset table   | absolute offset of the fact record (I) |                     x facts num
+#   fact records   | length in bytes (I) | UTF-8 encoded fact |                 x facts num
+FACT_STORE_MAGIC = b"NGFS"
+FACT_STORE_VERSION = 1
+
+_HEADER = struct.Struct("<4sHHII")
+_COUNTRY_ENTRY = struct.Struct("<4sII")
+_OFFSET = struct.Struct("<I")
+
+
+class FactStoreException(Exception):
+    pass
+
+
+def compile_fact_store(
+    zip_path: str | os.PathLike, output_path: str | os.PathLike
+) -> Tuple[int, int]:
+    """Compiles the facts archive into a single binary file, which can be memory-mapped and read
+    without decompression and CSV parsing. Countries are stored in the order of their codes.
+
+    Args:
+        zip_path (str | os.PathLike): The path to the archive with country facts.
+        output_path (str | os.PathLike): The path to the output binary file.
+
+    Returns:
+        Tuple[int, int]: The number of compiled countries and facts.
+    """
+
+    corpus = FactsCorpus.from_zip(zip_path)
+    country_codes = sorted(corpus.country_codes)
+    country_facts = [
+        [fact.encode("utf-8") for fact in corpus.facts(code)] for code in country_codes
+    ]
+    facts_num = sum(len(facts) for facts in country_facts)
+
+    country_table = bytearray()
+    offset_table = bytearray()
+    fact_records = bytearray()
+
+    records_start = (
+        _HEADER.size
+        + _COUNTRY_ENTRY.size * len(country_codes)
+        + _OFFSET.size * facts_num
+    )
+    first_fact_index = 0
+
+    for country_code, facts in zip(country_codes, country_facts, strict=True):
+        country_table += _COUNTRY_ENTRY.pack(
+            country_code.encode("ascii"), first_fact_index, len(facts)
+        )
+        first_fact_index += len(facts)
+
+        for fact in facts:
+            offset_table += _OFFSET.pack(records_start + len(fact_records))
+            fact_records += _OFFSET.pack(len(fact)) + fact
+
+    with open(output_path, "wb") as output_file:
+        output_file.write(
+            _HEADER.pack(
+                FACT_STORE_MAGIC, FACT_STORE_VERSION, 0, len(country_codes), facts_num
+            )
+        )
+        output_file.write(country_table)
+        output_file.write(offset_table)
+        output_file.write(fact_records)
+
+    return len(country_codes), facts_num
+
+
+class FactStore:
+    def __init__(self, store_path: str | os.PathLike) -> None:
+        with open(store_path, "rb") as store_file:
+            self._buffer = mmap.mmap(store_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, _, countries_num, _ = _HEADER.unpack_from(self._buffer, 0)
+        except struct.error as ex:
+            raise FactStoreException("Facts store file is truncated") from ex
+
+        if magic != FACT_STORE_MAGIC or version != FACT_STORE_VERSION:
+            err_msg = (
+                f"Unsupported facts store format (magic={magic!r}, version={version})"
+            )
+            raise FactStoreException(err_msg)
+
+        self._view = memoryview(self._buffer)
+        self._offsets_start = _HEADER.size + _COUNTRY_ENTRY.size * countries_num
+        self._countries: Dict[str, Tuple[int, int]] = {}
+
+        country_table = self._view[_HEADER.size : self._offsets_start]
+
+        for code, first_fact_index, facts_num in _COUNTRY_ENTRY.iter_unpack(
+            country_table
+        ):
+            country_code = code.rstrip(b"\x00").decode("ascii")
+            self._countries[country_code] = (first_fact_index, facts_num)
+
+    @property
+    def country_codes(self) -> List[str]:
+        return list(self._countries.keys())
+
+    def facts_num(self, country_code: str) -> int:
+        return self._countries[country_code][1]
+
+    def fact_view(self, country_code: str, index: int) -> memoryview:
+        """Returns a zero-copy view of the UTF-8 encoded fact in the memory-mapped file.
+
+        Args:
+            country_code (str): The ISO 3166-1 alpha-2 code of the country.
+            index (int): The index of the fact among facts of the country.
+
+        Returns:
+            memoryview: A read-only view of the encoded fact.
+
+        Raises:
+            KeyError: If there are no facts about the country in the store.
+            IndexError: If the fact index is out of the country facts range.
+        """
+
+        first_fact_index, country_facts_num = self._countries[country_code]
+
+        if not 0 <= index < country_facts_num:
+            raise IndexError("Fact index is out of range")
+
+        (record_offset,) = _OFFSET.unpack_from(
+            self._buffer,
+            self._offsets_start + _OFFSET.size * (first_fact_index + index),
+        )
+        (fact_length,) = _OFFSET.unpack_from(self._buffer, record_offset)
+        fact_start = record_offset + _OFFSET.size
+
+        return self._view[fact_start : fact_start + fact_length]
+
+    def sample(self, country_code: str, k: int) -> List[str]:
+        """Selects `k` random unique facts about the country, decoding only the selected ones.
+
+        Args:
+            country_code (str): The ISO 3166-1 alpha-2 code of the country.
+            k (int): The number of facts to select.
+
+        Returns:
+            List[str]: A list of randomly selected facts.
+
+        Raises:
+            KeyError: If there are no facts about the country in the store.
+        """
+
+        country_facts_num = self.facts_num(country_code)
+
+        return [
+            str(self.fact_view(country_code, index), "utf-8")
+            for index in random.sample(
+                range(country_facts_num), k=min(k, country_facts_num)
+            )
+        ]
+
+
+@lru_cache(maxsize=None)
+def _load_fact_store(store_path: str) -> FactStore:
+    return FactStore(store_path)
+
+
+def load_fact_store(store_path: str | os.PathLike) -> FactStore:
+    """Returns a process-wide memory-mapped facts store. Processes that map the same file share
+    its pages through the OS page cache.
+
+    Args:
+        store_path (str | os.PathLike): The path to the compiled facts store.
+
+    Returns:
+        FactStore: A shared facts store instance.
+    """
+
+    return _load_fact_store(os.path.abspath(store_path))
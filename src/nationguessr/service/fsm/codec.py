@@ -0,0 +1,220 @@
+import json
+import struct
+import zlib
+from datetime import date
+from typing import Any, Dict
+
+from ...data.game import GameSession
+from ..catalog import CountryCatalog
+
+# Version 1 stored options as positions of countries in the catalog, which changed with the catalog
+CODEC_VERSION = 2
+
+# The layout of the body is stored in the low bits of the flags byte
+JSON_LAYOUT = 0
+SESSION_LAYOUT = 1
+COMPRESSED_FLAG = 0x80
+
+_HEADER = struct.Struct("<BB")
+# Lives remained, current score, number of options and the position of the correct option
+_SESSION_HEADER = struct.Struct("<HIBB")
+_SCORE_BOARD_HEADER = struct.Struct("<B")
+# Score and the date of the score achievement in days since the Unix epoch
+_SCORE_ENTRY = struct.Struct("<IH")
+_SESSION_FIELDS = frozenset(GameSession.model_fields)
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _parse_score_date(score_date: str) -> int:
+    # Dates of scores have the `%d/%m/%Y` format and are parsed without `strptime`, which is
+    # several times slower. Dates in other formats would not be decoded back unchanged
+    day, month, year = score_date.split("/")
+
+    if not (
+        len(day) == len(month) == 2
+        and len(year) == 4
+        and f"{day}{month}{year}".isascii()
+        and f"{day}{month}{year}".isdigit()
+    ):
+        err_msg = f"Score date '{score_date}' has an unsupported format"
+        raise ValueError(err_msg)
+
+    return date(int(year), int(month), int(day)).toordinal() - _EPOCH_ORDINAL
+
+
+def _format_score_date(days: int) -> str:
+    score_date = date.fromordinal(_EPOCH_ORDINAL + days)
+
+    return f"{score_date.day:02d}/{score_date.month:02d}/{score_date.year:04d}"
+
+
+class SessionCodec:
+    def __init__(self, catalog: CountryCatalog, compression_level: int = 6) -> None:
+        """A compact binary codec of FSM data. Data of a game session is packed into a fixed
+        struct layout, where options are stored as ISO 3166-1 alpha-2 codes of countries and
+        dates of scores as days since the Unix epoch. Codes rather than positions in the catalog
+        keep payloads valid when the catalog is reordered or extended. Other data falls back to
+        compact JSON. The body is compressed with zlib if it gets smaller. Every payload starts
+        with the codec version and a flags byte with the layout and the compression flag.
+
+        Args:
+            catalog (CountryCatalog): The catalog of countries, whose names are used as options.
+            compression_level (int): The zlib compression level (compression is disabled if 0).
+        """
+
+        self._catalog = catalog
+        self._compression_level = compression_level
+
+    def encode(self, data: Dict[str, Any]) -> bytes:
+        """Encodes FSM data into a binary payload.
+
+        Args:
+            data (Dict[str, Any]): JSON-compatible FSM data.
+
+        Returns:
+            bytes: The encoded payload.
+        """
+
+        if (body := self._encode_session(data)) is not None:
+            flags = SESSION_LAYOUT
+        else:
+            body = json.dumps(data, separators=(",", ":")).encode("utf-8")
+            flags = JSON_LAYOUT
+
+        if self._compression_level:
+            compressed_body = zlib.compress(body, self._compression_level)
+
+            if len(compressed_body) < len(body):
+                body, flags = compressed_body, flags | COMPRESSED_FLAG
+
+        return _HEADER.pack(CODEC_VERSION, flags) + body
+
+    def decode(self, payload: bytes) -> Dict[str, Any]:
+        """Decodes FSM data from a binary payload.
+
+        Args:
+            payload (bytes): The payload built by `SessionCodec.encode`.
+
+        Returns:
+            Dict[str, Any]: The decoded FSM data.
+
+        Raises:
+            ValueError: If the payload is corrupted or has an unsupported version or layout.
+        """
+
+        try:
+            version, flags = _HEADER.unpack_from(payload)
+            body = payload[_HEADER.size :]
+
+            if version != CODEC_VERSION:
+                err_msg = f"Session codec version {version} is not supported"
+                raise ValueError(err_msg)
+
+            if flags & COMPRESSED_FLAG:
+                body = zlib.decompress(body)
+
+            layout = flags & ~COMPRESSED_FLAG
+
+            if layout == JSON_LAYOUT:
+                return json.loads(body)
+            elif layout == SESSION_LAYOUT:
+                return self._decode_session(body)
+
+            err_msg = f"Session codec layout {layout} is not supported"
+            raise ValueError(err_msg)
+        except (struct.error, zlib.error, IndexError, KeyError) as ex:
+            err_msg = f"Session payload is corrupted: '{ex}'"
+            raise ValueError(err_msg) from ex
+
+    def _encode_session(self, data: Dict[str, Any]) -> bytes | None:
+        if data.keys() != _SESSION_FIELDS:
+            return None
+
+        options, correct_option = data["options"], data["correct_option"]
+        score_board = data["score_board"]
+
+        # Only values, which are decoded back unchanged, are packed into the struct layout
+        if not (
+            isinstance(options, list)
+            and all(isinstance(option, str) for option in options)
+            and isinstance(correct_option, str)
+            and correct_option in options
+            and isinstance(score_board, dict)
+            and all(
+                isinstance(value, int) and not isinstance(value, bool)
+                for value in (
+                    data["lives_remained"],
+                    data["current_score"],
+                    *score_board,
+                )
+            )
+        ):
+            return None
+
+        try:
+            option_codes = b"".join(
+                self._catalog.code(self._catalog.name_index(option)).encode("ascii")
+                for option in options
+            )
+
+            if len(option_codes) != 2 * len(options):
+                return None
+
+            score_days = [
+                _parse_score_date(score_date) for score_date in score_board.values()
+            ]
+
+            return b"".join(
+                (
+                    _SESSION_HEADER.pack(
+                        data["lives_remained"],
+                        data["current_score"],
+                        len(options),
+                        options.index(correct_option),
+                    ),
+                    option_codes,
+                    _SCORE_BOARD_HEADER.pack(len(score_board)),
+                    *(
+                        _SCORE_ENTRY.pack(score, days)
+                        for score, days in zip(score_board, score_days)
+                    ),
+                )
+            )
+        except (AttributeError, KeyError, TypeError, ValueError, struct.error):
+            return None
+
+    def _decode_session(self, body: bytes) -> Dict[str, Any]:
+        lives_remained, current_score, options_num, correct_option_position = (
+            _SESSION_HEADER.unpack_from(body)
+        )
+        offset = _SESSION_HEADER.size
+
+        option_codes = body[offset : offset + 2 * options_num].decode("ascii")
+        offset += 2 * options_num
+
+        if len(option_codes) != 2 * options_num:
+            err_msg = "Session payload has truncated options"
+            raise ValueError(err_msg)
+
+        (scores_num,) = _SCORE_BOARD_HEADER.unpack_from(body, offset)
+        offset += _SCORE_BOARD_HEADER.size
+
+        score_board = {}
+
+        for _ in range(scores_num):
+            score, days = _SCORE_ENTRY.unpack_from(body, offset)
+            offset += _SCORE_ENTRY.size
+            score_board[score] = _format_score_date(days)
+
+        options = [
+            self._catalog.name(option_codes[i : i + 2])
+            for i in range(0, len(option_codes), 2)
+        ]
+
+        return {
+            "score_board": score_board,
+            "lives_remained": lives_remained,
+            "current_score": current_score,
+            "options": options,
+            "correct_option": options[correct_option_position],
+        }
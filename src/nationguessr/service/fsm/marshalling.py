@@ -0,0 +1,74 @@
+import math
+from typing import Any, Dict, Mapping
+
+
+def marshal_value(value: Any) -> Dict[str, Any]:
+    """Converts a JSON-compatible value to a native DynamoDB attribute value. Strings become `S`,
+    numbers `N`, booleans `BOOL`, None `NULL`, lists and tuples `L`, and mappings `M`. Keys of
+    mappings are converted to strings, like `json.dumps` does.
+
+    Args:
+        value (Any): The value to convert.
+
+    Returns:
+        Dict[str, Any]: The attribute value in the DynamoDB JSON format.
+
+    Raises:
+        TypeError: If the value or one of its items has an unsupported type.
+        ValueError: If the value or one of its items is a non-finite number.
+    """
+
+    # Booleans are checked first, since they are integers as well
+    if value is None:
+        return {"NULL": True}
+    elif isinstance(value, bool):
+        return {"BOOL": value}
+    elif isinstance(value, str):
+        return {"S": value}
+    elif isinstance(value, int):
+        return {"N": str(value)}
+    elif isinstance(value, float):
+        if not math.isfinite(value):
+            err_msg = f"Non-finite number {value} cannot be stored in DynamoDB"
+            raise ValueError(err_msg)
+
+        return {"N": repr(value)}
+    elif isinstance(value, (list, tuple)):
+        return {"L": [marshal_value(item) for item in value]}
+    elif isinstance(value, Mapping):
+        return {"M": {str(k): marshal_value(v) for k, v in value.items()}}
+
+    err_msg = f"Value of type '{type(value).__name__}' cannot be stored in DynamoDB"
+    raise TypeError(err_msg)
+
+
+def unmarshal_value(attribute_value: Mapping[str, Any]) -> Any:
+    """Converts a native DynamoDB attribute value back to a Python value. Numbers without
+    a fractional part or an exponent become integers, other numbers floats.
+
+    Args:
+        attribute_value (Mapping[str, Any]): The attribute value in the DynamoDB JSON format.
+
+    Returns:
+        Any: The converted value.
+
+    Raises:
+        ValueError: If the attribute value has an unsupported type.
+    """
+
+    match attribute_value:
+        case {"NULL": _}:
+            return None
+        case {"BOOL": value}:
+            return value
+        case {"S": value}:
+            return value
+        case {"N": value}:
+            return int(value) if value.lstrip("-").isdigit() else float(value)
+        case {"L": items}:
+            return [unmarshal_value(item) for item in items]
+        case {"M": items}:
+            return {k: unmarshal_value(v) for k, v in items.items()}
+
+    err_msg = f"Attribute value {attribute_value} has an unsupported type"
+    raise ValueError(err_msg)
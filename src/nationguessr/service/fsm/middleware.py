@@ -0,0 +1,28 @@
+from typing import Any, Awaitable, Callable, Dict
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject
+
+from .storage import DynamoDBStorage
+
+
+class ItemScopeMiddleware(BaseMiddleware):
+    def __init__(self, storage: DynamoDBStorage) -> None:
+        """Processes every update within an item scope of the storage, so the FSM item of the user
+        is fetched once per update. The middleware must be registered as an outer middleware of
+        updates before the FSM middleware of the dispatcher.
+
+        Args:
+            storage (DynamoDBStorage): The FSM storage of the dispatcher.
+        """
+
+        self._storage = storage
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        async with self._storage.item_scope():
+            return await handler(event, data)
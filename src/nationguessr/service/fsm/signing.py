@@ -0,0 +1,116 @@
+import hashlib
+import hmac
+import time
+from typing import Callable, Dict, Tuple
+
+ALGORITHM = "AWS4-HMAC-SHA256"
+CONTENT_TYPE = "application/x-amz-json-1.0"
+SIGNED_HEADERS = "content-type;host;x-amz-date;x-amz-target"
+
+
+class SigV4Signer:
+    def __init__(
+        self,
+        access_key: str,
+        secret_key: str,
+        region: str,
+        service: str,
+        host: str,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Signs JSON `POST` requests to an AWS service with the Signature Version 4 algorithm.
+        Parts of the canonical request, which do not depend on the request, are built once.
+        The signing key is derived once per date stamp, and the timestamp is formatted once
+        per second, so signing a request costs two SHA-256 hashes and one HMAC.
+
+        Args:
+            access_key (str): The AWS access key id.
+            secret_key (str): The AWS secret access key.
+            region (str): The AWS region of the service.
+            service (str): The name of the service in the credential scope, e.g., `dynamodb`.
+            host (str): The host of the service endpoint.
+            clock (Callable[[], float]): A function returning the current UNIX time in seconds.
+        """
+
+        self._access_key = access_key
+        self._secret_key = secret_key
+        self._region = region
+        self._service = service
+        self._clock = clock
+
+        self._canonical_headers_prefix = (
+            f"POST\n/\n\ncontent-type:{CONTENT_TYPE}\nhost:{host}\nx-amz-date:"
+        )
+        self._scope_suffix = f"/{region}/{service}/aws4_request"
+
+        self._timestamp: Tuple[int, str, str] | None = None
+        self._date_stamp: str | None = None
+        self._signing_hmac: hmac.HMAC | None = None
+        self._authorization_prefix = ""
+        self._string_to_sign_scope = ""
+
+    def _format_timestamp(self) -> Tuple[str, str]:
+        second = int(self._clock())
+
+        if self._timestamp is None or self._timestamp[0] != second:
+            t = time.gmtime(second)
+            self._timestamp = (
+                second,
+                time.strftime("%Y%m%dT%H%M%SZ", t),
+                time.strftime("%Y%m%d", t),
+            )
+
+        return self._timestamp[1], self._timestamp[2]
+
+    def _derive_signing_key(self, date_stamp: str) -> None:
+        signing_key = ("AWS4" + self._secret_key).encode("utf-8")
+
+        for message in (date_stamp, self._region, self._service, "aws4_request"):
+            signing_key = hmac.digest(signing_key, message.encode("utf-8"), "sha256")
+
+        credential_scope = f"{date_stamp}{self._scope_suffix}"
+
+        # The keyed HMAC state is copied for every request instead of hashing the key again
+        self._signing_hmac = hmac.new(signing_key, digestmod=hashlib.sha256)
+        self._authorization_prefix = (
+            f"{ALGORITHM} Credential={self._access_key}/{credential_scope},"
+            f" SignedHeaders={SIGNED_HEADERS}, Signature="
+        )
+        self._string_to_sign_scope = f"\n{credential_scope}\n"
+        self._date_stamp = date_stamp
+
+    def sign(self, request_body: str, amz_target: str) -> Dict[str, str]:
+        """Builds headers of a signed request.
+
+        Args:
+            request_body (str): The JSON body of the request.
+            amz_target (str): The target operation, e.g., `DynamoDB_20120810.GetItem`.
+
+        Returns:
+            Dict[str, str]: Headers of the request, including the `Authorization` header.
+        """
+
+        amz_date, date_stamp = self._format_timestamp()
+
+        if date_stamp != self._date_stamp:
+            self._derive_signing_key(date_stamp)
+
+        payload_hash = hashlib.sha256(request_body.encode("utf-8")).hexdigest()
+        canonical_request = (
+            f"{self._canonical_headers_prefix}{amz_date}\nx-amz-target:{amz_target}\n"
+            f"\n{SIGNED_HEADERS}\n{payload_hash}"
+        )
+        string_to_sign = (
+            f"{ALGORITHM}\n{amz_date}{self._string_to_sign_scope}"
+            f"{hashlib.sha256(canonical_request.encode('utf-8')).hexdigest()}"
+        )
+
+        signature_hmac = self._signing_hmac.copy()
+        signature_hmac.update(string_to_sign.encode("utf-8"))
+
+        return {
+            "Content-Type": CONTENT_TYPE,
+            "X-Amz-Date": amz_date,
+            "X-Amz-Target": amz_target,
+            "Authorization": f"{self._authorization_prefix}{signature_hmac.hexdigest()}",
+        }
@@ -1,16 +1,25 @@
 import asyncio
-import datetime
-import hashlib
-import hmac
+import base64
 import json
 import logging
-from functools import reduce
-from typing import Any, Dict, Optional, cast
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, Optional, cast
 
 import aiohttp
 from aiogram.fsm.state import State
 from aiogram.fsm.storage.base import BaseStorage, StateType, StorageKey
 
+from .codec import SessionCodec
+from .marshalling import marshal_value, unmarshal_value
+from .signing import SigV4Signer
+
+# Version 1 stores data values as JSON strings, version 2 as native attribute values,
+# and version 3 as a single binary attribute encoded by `SessionCodec`
+DATA_VERSION = 2
+BINARY_DATA_VERSION = 3
+
 
 class FsmStorageException(Exception):
     def __init__(self, message: str, status_code: Optional[int] = None) -> None:
@@ -27,6 +36,14 @@ class FsmStorageException(Exception):
         )
 
 
+@dataclass
+class _ItemScope:
+    # Items fetched within the scope, which are keyed by storage keys and hold raw attribute values
+    items: Dict[StorageKey, Dict[str, Any]] = field(default_factory=dict)
+    # Attribute values written within the scope and not flushed to the table yet
+    pending_writes: Dict[StorageKey, Dict[str, Any]] = field(default_factory=dict)
+
+
 class DynamoDBStorage(BaseStorage):
     def __init__(
         self,
@@ -34,6 +51,9 @@ class DynamoDBStorage(BaseStorage):
         secret_key: str,
         table_name: str,
         region: str = "eu-central-1",
+        write_behind: bool = False,
+        data_codec: SessionCodec | None = None,
+        binary_data: bool = False,
     ) -> None:
         if not access_key or not secret_key:
             raise AttributeError("No AWS credentials available")
@@ -42,67 +62,73 @@ class DynamoDBStorage(BaseStorage):
         self._secret_key = secret_key
         self._table_name = table_name
         self._region = region
+        self._write_behind = write_behind
+        self._data_codec = data_codec
+        self._binary_data = binary_data
+
+        if binary_data and data_codec is None:
+            raise AttributeError("Binary data layout requires a data codec")
 
         self._service = "dynamodb"
         self._host = f"{self._service}.{self._region}.amazonaws.com"
         self._endpoint = f"https://{self._host}"
+        self._signer = SigV4Signer(
+            access_key, secret_key, region, self._service, self._host
+        )
         self._logger = logging.getLogger(self.__class__.__name__)
         self._session_lock = asyncio.Lock()
         self._session = None
 
-    def _build_authorization_header(
-        self, request_body: str, amz_target: str
-    ) -> Dict[str, str]:
-        t = datetime.datetime.utcnow()
-        amz_date, date_stamp = t.strftime("%Y%m%dT%H%M%SZ"), t.strftime("%Y%m%d")
-
-        method = "POST"
-        content_type = "application/x-amz-json-1.0"
-        canonical_uri, canonical_querystring = "/", ""
-        canonical_headers = (
-            f"content-type:{content_type}\nhost:{self._host}\n"
-            f"x-amz-date:{amz_date}\nx-amz-target:{amz_target}\n"
+        self._item_scope: ContextVar[_ItemScope | None] = ContextVar(
+            f"{self.__class__.__name__}.item_scope", default=None
         )
-        signed_headers = "content-type;host;x-amz-date;x-amz-target"
 
-        payload_hash = hashlib.sha256(request_body.encode("utf-8")).hexdigest()
-        canonical_request = (
-            f"{method}\n{canonical_uri}\n{canonical_querystring}\n"
-            f"{canonical_headers}\n{signed_headers}\n{payload_hash}"
-        )
+    @asynccontextmanager
+    async def item_scope(self) -> AsyncIterator[None]:
+        """Scopes reads and writes of the storage to the block, e.g., the processing of a single
+        update. Within the scope, an item is fetched from the table once, and later reads of its
+        state and data are served from the fetched item, which is kept in sync with writes.
+        In the write-behind mode, writes are buffered and flushed when the block exits, so all
+        changes of an item are sent with a single `UpdateItem` request. Failed flushes are logged
+        and not raised, since replies to the update are already sent at that point.
+        """
+
+        item_scope = _ItemScope()
+        token = self._item_scope.set(item_scope)
+
+        try:
+            yield
+        finally:
+            self._item_scope.reset(token)
+
+            # Changes are flushed even if the block failed, like writes made without buffering
+            pending_keys = list(item_scope.pending_writes)
+            flush_results = await asyncio.gather(
+                *(
+                    self._update_item(key, item_scope.pending_writes[key])
+                    for key in pending_keys
+                ),
+                return_exceptions=True,
+            )
 
-        algorithm = "AWS4-HMAC-SHA256"
-        credential_scope = f"{date_stamp}/{self._region}/{self._service}/aws4_request"
-        string_to_sign = (
-            f"{algorithm}\n{amz_date}\n{credential_scope}\n"
-            f"{hashlib.sha256(canonical_request.encode('utf-8')).hexdigest()}"
-        )
+            cancellation = None
 
-        signing_key = reduce(
-            lambda k, msg: hmac.digest(k, msg.encode("utf-8"), hashlib.sha256),
-            [date_stamp, self._region, self._service, "aws4_request"],
-            ("AWS4" + self._secret_key).encode("utf-8"),
-        )
-        signature = hmac.new(
-            signing_key, string_to_sign.encode("utf-8"), hashlib.sha256
-        ).hexdigest()
+            for key, flush_result in zip(pending_keys, flush_results):
+                if isinstance(flush_result, BaseException):
+                    self._logger.error(
+                        f"Failed to flush buffered changes of user id={key.user_id}"
+                        f" (chat_id={key.chat_id}) to the FSM storage: {flush_result!r}"
+                    )
 
-        authorization_header = (
-            f"{algorithm} Credential={self._access_key}/{credential_scope},"
-            f" SignedHeaders={signed_headers}, Signature={signature}"
-        )
+                    if isinstance(flush_result, asyncio.CancelledError):
+                        cancellation = flush_result
 
-        return {
-            "Content-Type": content_type,
-            "X-Amz-Date": amz_date,
-            "X-Amz-Target": amz_target,
-            "Authorization": authorization_header,
-        }
+            # Cancellation is propagated after every failed flush is logged
+            if cancellation is not None:
+                raise cancellation
 
     async def _request_table(self, amz_target: str, request_parameters: str) -> str:
-        request_headers = self._build_authorization_header(
-            request_parameters, amz_target
-        )
+        request_headers = self._signer.sign(request_parameters, amz_target)
 
         if not self._session:
             async with self._session_lock:
@@ -147,37 +173,11 @@ class DynamoDBStorage(BaseStorage):
 
         await self._request_table(amz_target, request_parameters)
 
-    async def set_state(self, key: StorageKey, state: StateType = None) -> None:
-        self._logger.debug(
-            f"User id={key.user_id} (chat_id={key.chat_id}) requested a state update"
-        )
+    async def _get_item(self, key: StorageKey) -> Dict[str, Any]:
+        item_scope = self._item_scope.get()
 
-        amz_target = "DynamoDB_20120810.UpdateItem"
-        state_parsed = cast(str, state.state if isinstance(state, State) else state)
-        request_parameters = json.dumps(
-            {
-                "TableName": self._table_name,
-                "Key": {
-                    "chat_id": {"S": str(key.chat_id)},
-                    "user_id": {"S": str(key.user_id)},
-                },
-                "UpdateExpression": "set state_value = :val1",
-                "ExpressionAttributeValues": {
-                    ":val1": (
-                        {"S": state_parsed}
-                        if state_parsed is not None
-                        else {"NULL": True}
-                    ),
-                },
-            }
-        )
-
-        await self._request_table(amz_target, request_parameters)
-
-    async def get_state(self, key: StorageKey) -> Optional[str]:
-        self._logger.debug(
-            f"User id={key.user_id} (chat_id={key.chat_id}) requested a state read"
-        )
+        if item_scope is not None and key in item_scope.items:
+            return item_scope.items[key]
 
         amz_target = "DynamoDB_20120810.GetItem"
         request_parameters = json.dumps(
@@ -187,7 +187,7 @@ class DynamoDBStorage(BaseStorage):
                     "chat_id": {"S": str(key.chat_id)},
                     "user_id": {"S": str(key.user_id)},
                 },
-                "ProjectionExpression": "state_value",
+                "ProjectionExpression": "state_value, data_value, data_version",
                 "ConsistentRead": True,
             }
         )
@@ -195,23 +195,21 @@ class DynamoDBStorage(BaseStorage):
         response = await self._request_table(amz_target, request_parameters)
         response_body = json.loads(response)
 
-        if "Item" not in response_body:
+        if "Item" in response_body:
+            item = response_body.get("Item")
+        else:
             await self._create_empty_state(key)
-            return None
+            item = {"state_value": {"NULL": True}, "data_value": {"M": {}}}
 
-        state_val = response_body.get("Item").get("state_value")
+        if item_scope is not None:
+            item.update(item_scope.pending_writes.get(key, {}))
+            item_scope.items[key] = item
 
-        if state_val is None:
-            raise FsmStorageException("State attribute value cannot be empty")
-
-        return state_val.get("S")
-
-    async def set_data(self, key: StorageKey, data: Dict[str, Any]) -> None:
-        self._logger.debug(
-            f"User id={key.user_id} (chat_id={key.chat_id}) requested a data update"
-        )
+        return item
 
+    async def _update_item(self, key: StorageKey, attributes: Dict[str, Any]) -> None:
         amz_target = "DynamoDB_20120810.UpdateItem"
+        attribute_names = list(attributes)
         request_parameters = json.dumps(
             {
                 "TableName": self._table_name,
@@ -219,41 +217,93 @@ class DynamoDBStorage(BaseStorage):
                     "chat_id": {"S": str(key.chat_id)},
                     "user_id": {"S": str(key.user_id)},
                 },
-                "UpdateExpression": "set data_value = :val1",
+                "UpdateExpression": "set "
+                + ", ".join(
+                    f"{attribute_name} = :val{i + 1}"
+                    for i, attribute_name in enumerate(attribute_names)
+                ),
                 "ExpressionAttributeValues": {
-                    ":val1": {"M": {k: {"S": json.dumps(v)} for k, v in data.items()}},
+                    f":val{i + 1}": attributes[attribute_name]
+                    for i, attribute_name in enumerate(attribute_names)
                 },
             }
         )
 
         await self._request_table(amz_target, request_parameters)
 
-    async def get_data(self, key: StorageKey) -> Dict[str, Any]:
+    async def _set_attributes(
+        self, key: StorageKey, attributes: Dict[str, Any]
+    ) -> None:
+        item_scope = self._item_scope.get()
+
+        if item_scope is not None and self._write_behind:
+            item_scope.pending_writes.setdefault(key, {}).update(attributes)
+        else:
+            try:
+                await self._update_item(key, attributes)
+            except BaseException:
+                # The outcome of a failed write is unknown, so the item is fetched again on next read
+                if item_scope is not None:
+                    item_scope.items.pop(key, None)
+
+                raise
+
+        if item_scope is not None and key in item_scope.items:
+            item_scope.items[key].update(attributes)
+
+    async def set_state(self, key: StorageKey, state: StateType = None) -> None:
         self._logger.debug(
-            f"User id={key.user_id} (chat_id={key.chat_id}) requested a data read"
+            f"User id={key.user_id} (chat_id={key.chat_id}) requested a state update"
         )
 
-        amz_target = "DynamoDB_20120810.GetItem"
-        request_parameters = json.dumps(
+        state_parsed = cast(str, state.state if isinstance(state, State) else state)
+
+        await self._set_attributes(
+            key,
             {
-                "TableName": self._table_name,
-                "Key": {
-                    "chat_id": {"S": str(key.chat_id)},
-                    "user_id": {"S": str(key.user_id)},
-                },
-                "ProjectionExpression": "data_value",
-                "ConsistentRead": True,
-            }
+                "state_value": (
+                    {"S": state_parsed} if state_parsed is not None else {"NULL": True}
+                )
+            },
         )
 
-        response = await self._request_table(amz_target, request_parameters)
-        response_body = json.loads(response)
+    async def get_state(self, key: StorageKey) -> Optional[str]:
+        self._logger.debug(
+            f"User id={key.user_id} (chat_id={key.chat_id}) requested a state read"
+        )
 
-        if "Item" not in response_body:
-            await self._create_empty_state(key)
-            return {}
+        state_val = (await self._get_item(key)).get("state_value")
+
+        if state_val is None:
+            raise FsmStorageException("State attribute value cannot be empty")
+
+        return state_val.get("S")
 
-        data_val = response_body.get("Item").get("data_value")
+    async def set_data(self, key: StorageKey, data: Dict[str, Any]) -> None:
+        self._logger.debug(
+            f"User id={key.user_id} (chat_id={key.chat_id}) requested a data update"
+        )
+
+        if self._binary_data:
+            data_value = {
+                "B": base64.b64encode(self._data_codec.encode(data)).decode("ascii")
+            }
+            data_version = BINARY_DATA_VERSION
+        else:
+            data_value, data_version = marshal_value(data), DATA_VERSION
+
+        await self._set_attributes(
+            key,
+            {"data_value": data_value, "data_version": {"N": str(data_version)}},
+        )
+
+    async def get_data(self, key: StorageKey) -> Dict[str, Any]:
+        self._logger.debug(
+            f"User id={key.user_id} (chat_id={key.chat_id}) requested a data read"
+        )
+
+        item = await self._get_item(key)
+        data_val = item.get("data_value")
 
         if data_val is None:
             raise FsmStorageException("Data attribute value cannot be empty")
@@ -262,7 +312,23 @@ class DynamoDBStorage(BaseStorage):
                 "Data attribute type is invalid or value is corrupted"
             )
 
-        return {k: json.loads(v.get("S")) for k, v in data_val.get("M").items()}
+        data_version = int(item.get("data_version", {"N": "1"}).get("N"))
+
+        # Items written before native attribute values were introduced have no data version
+        if data_version == 1:
+            return {k: json.loads(v.get("S")) for k, v in data_val.get("M").items()}
+        elif data_version == DATA_VERSION:
+            return unmarshal_value(data_val)
+        elif data_version == BINARY_DATA_VERSION and self._data_codec is not None:
+            try:
+                return self._data_codec.decode(base64.b64decode(data_val.get("B")))
+            except ValueError as ex:
+                raise FsmStorageException(
+                    "Data attribute type is invalid or value is corrupted"
+                ) from ex
+
+        err_msg = f"Data version {data_version} is not supported"
+        raise FsmStorageException(err_msg)
 
     async def close(self) -> None:
         self._logger.debug("Closing HTTP client session")
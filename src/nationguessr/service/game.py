@@ -1,21 +1,40 @@
-import csv
+import asyncio
+import hashlib
 import json
 import logging
 import math
 import os
 import random
-import zipfile
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
-from io import BytesIO, StringIO
-from typing import List, Tuple
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    NamedTuple,
+    Sequence,
+    Set,
+    Tuple,
+)
 
-import aiofiles
 import aiohttp
 
 from ..data.game import FactsGuessingGameRound, GameSession
-from ..service.utils import reservoir_sampling
-from ..settings import Settings
+from ..settings import FactsSamplingMode, Settings
+from .cache import FactsCache
+from .catalog import load_country_catalog
+from .corpus import load_facts_corpus
+from .factstore import load_fact_store
+from .utils import batched
+
+# The number of output tokens reserved for facts of a single country
+FACTS_MAX_TOKENS = 1024
 
 
 def number_as_character(
@@ -139,163 +158,573 @@ def record_new_score(session: GameSession, settings: Settings) -> GameSession:
     return new_session
 
 
+class FactGenerationException(Exception):
+    pass
+
+
 class FactGenerationStrategy(ABC):
     @abstractmethod
     async def generate_facts(self, country_code: str) -> List[str]:
         raise NotImplementedError("Facts generation is available for subclasses only.")
 
+    async def generate_facts_batch(
+        self, country_codes: Sequence[str]
+    ) -> Dict[str, List[str]]:
+        """Generates facts for several countries at once. By default, facts are generated
+        concurrently for every country, and countries that failed are omitted from the result.
+
+        Args:
+            country_codes (Sequence[str]): Codes of countries to generate facts for.
+
+        Returns:
+            Dict[str, List[str]]: Generated facts keyed by the country code.
+        """
+
+        generated_facts = await asyncio.gather(
+            *(self.generate_facts(country_code) for country_code in country_codes),
+            return_exceptions=True,
+        )
+
+        return {
+            country_code: facts
+            for country_code, facts in zip(country_codes, generated_facts, strict=True)
+            if not isinstance(facts, BaseException)
+        }
+
+    async def close(self) -> None:
+        """Releases resources held by the strategy, e.g., network connections."""
+
+        return None
+
 
 class GenerationFromZipStrategy(FactGenerationStrategy):
     def __init__(self, settings: Settings) -> None:
         self._settings = settings
+        self._corpus = load_facts_corpus(
+            os.path.join(settings.assets_folder, "data", "country_facts.zip")
+        )
 
     async def generate_facts(self, country_code: str) -> List[str]:
-        async with aiofiles.open(
-            os.path.join(self._settings.assets_folder, "data", "country_facts.zip"),
-            mode="rb",
-        ) as file:
-            with zipfile.ZipFile(BytesIO(await file.read())) as facts_zip:
-                with facts_zip.open(f"{country_code}.csv") as facts_file:
-                    facts_content = (
-                        line.decode("utf-8") for line in facts_file.readlines()
-                    )
-                    reader = csv.reader(facts_content, delimiter=",", quotechar='"')
-                    selected_facts = [
-                        fact
-                        for _, _, fact in reservoir_sampling(
-                            reader, self._settings.default_facts_num
-                        )
-                    ]
+        if self._settings.fact_sampling_mode == FactsSamplingMode.BALANCED:
+            return self._corpus.sample_balanced(
+                country_code,
+                self._settings.default_facts_num,
+                self._settings.fact_categories,
+            )
+
+        return self._corpus.sample(country_code, self._settings.default_facts_num)
+
 
-        return selected_facts
+class GenerationFromFactStoreStrategy(FactGenerationStrategy):
+    def __init__(self, settings: Settings) -> None:
+        self._settings = settings
+        self._store = load_fact_store(
+            os.path.join(settings.assets_folder, "data", "country_facts.bin")
+        )
+
+    async def generate_facts(self, country_code: str) -> List[str]:
+        return self._store.sample(country_code, self._settings.default_facts_num)
 
 
 class GenerationFromGptStrategy(FactGenerationStrategy):
     def __init__(
-        self, settings: Settings, fallback_strategy: FactGenerationStrategy
+        self,
+        settings: Settings,
+        fallback_strategy: FactGenerationStrategy | None = None,
     ) -> None:
         if not settings.openai_api_token:
             raise AttributeError("No OpenAI API credentials available")
 
         self._settings = settings
         self._ai_model_name = "gpt-4o"
+        facts_guidelines = (
+            "Your facts should be interesting and cover culture, its ancient history, unique places to visit and "
+            "about its people. Each fact should be a one sentence long. Do not include obvious facts, such as the "
+            "name of the capital or the name of the currency. Do not write a name of the country directly in the "
+            "facts, instead substitute the name with phrase 'this country'. You must not provide facts that "
+            "somewhat related to politics, war or other sensitive topics."
+        )
         self._system_prompt = (
             "You are a Nationguessr AI, an artificial intelligence that is specialized in interesting facts about "
             f"counties worldwide. Your goal is to generate {settings.default_facts_num} interesting facts about a "
-            "particular country, based on the name provided, so the user will try to guess this country. Your facts "
-            "should be interesting and cover culture, its ancient history, unique places to visit and about its "
-            "people. Each fact should be a one sentence long. Do not include obvious facts, such as the name of "
-            "the capital or the name of the currency. Do not write a name of the country directly in the facts, "
-            "instead substitute the name with phrase 'this country'. You must not provide facts that somewhat "
-            "related to politics, war or other sensitive topics. When writing output facts, you must always follow "
-            "a template structure, which is a JSON object with a key being an index of generated fact (starting from "
-            '1) and a value being a fact itself:\n\n{\n    "1": "1st fact",\n    "2": "2nd fact",\n    ...\n}'
+            "particular country, based on the name provided, so the user will try to guess this country. "
+            f"{facts_guidelines} When writing output facts, you must always follow a template structure, which is "
+            "a JSON object with a key being an index of generated fact (starting from 1) and a value being a fact "
+            'itself:\n\n{\n    "1": "1st fact",\n    "2": "2nd fact",\n    ...\n}'
+        )
+        self._batch_system_prompt = (
+            "You are a Nationguessr AI, an artificial intelligence that is specialized in interesting facts about "
+            f"counties worldwide. Your goal is to generate {settings.default_facts_num} interesting facts about "
+            "each of the countries provided in a JSON object, where a key is a country code and a value is a name "
+            f"of the country, so the user will try to guess these countries. {facts_guidelines} When writing "
+            "output facts, you must always follow a template structure, which is a JSON object with a key being "
+            "a country code from the input and a value being a JSON object with a key being an index of generated "
+            'fact about this country (starting from 1) and a value being a fact itself:\n\n{\n    "FR": {\n'
+            '        "1": "1st fact",\n        "2": "2nd fact",\n        ...\n    },\n    ...\n}'
         )
+        self._prompt_version = hashlib.sha256(
+            f"{self._ai_model_name}\n{self._system_prompt}\n{self._batch_system_prompt}".encode()
+        ).hexdigest()[:16]
         self._logger = logging.getLogger(self.__class__.__name__)
         self._headers = {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {settings.openai_api_token}",
         }
         self._fallback_strategy = fallback_strategy
-
-    async def generate_facts(self, country_code: str) -> List[str]:
-        async with aiofiles.open(
-            os.path.join(self._settings.assets_folder, "data", "countries.csv"),
-            mode="r",
-        ) as file:
-            reader = csv.reader(
-                StringIO(await file.read()), delimiter=",", quotechar='"'
-            )
-            selected_country = next(
-                _name for _, _code, _name in reader if _code == country_code
-            )
-
+        self._catalog = load_country_catalog(
+            os.path.join(settings.assets_folder, "data", "countries.csv")
+        )
+        self._completions_url = (
+            f"{settings.openai_api_base_url.rstrip('/')}/chat/completions"
+        )
+        self._session_lock = asyncio.Lock()
+        self._session = None
+
+    @property
+    def prompt_version(self) -> str:
+        """A short digest of the model name and the system prompts, which changes whenever
+        the generated facts are no longer comparable with the previously generated ones.
+        """
+
+        return self._prompt_version
+
+    @property
+    def max_batch_size(self) -> int:
+        """The maximum number of countries, whose facts fit into the output token limit of
+        the model in a single chat completion.
+        """
+
+        return max(self._settings.openai_max_output_tokens // FACTS_MAX_TOKENS, 1)
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Returns a long-lived HTTP client session shared by all requests to the OpenAI API. The
+        session keeps connections alive between requests and caches DNS lookups, so only the first
+        request (or the first request after the idle connection is closed) pays for the DNS, TCP
+        and TLS setup. On AWS Lambda the session lives across warm invocations of the container.
+        """
+
+        async with self._session_lock:
+            if self._session is None or self._session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=self._settings.openai_connection_limit,
+                    keepalive_timeout=self._settings.openai_keepalive_timeout,
+                    use_dns_cache=True,
+                    ttl_dns_cache=self._settings.openai_dns_cache_ttl,
+                )
+                timeout = aiohttp.ClientTimeout(
+                    total=self._settings.openai_request_timeout,
+                    connect=self._settings.openai_connect_timeout,
+                )
+                self._session = aiohttp.ClientSession(
+                    connector=connector, timeout=timeout, headers=self._headers
+                )
+
+        return self._session
+
+    async def close(self) -> None:
+        self._logger.debug("Closing HTTP client session")
+
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+        if self._fallback_strategy is not None:
+            await self._fallback_strategy.close()
+
+    async def _fallback(self, country_code: str) -> List[str]:
+        if self._fallback_strategy is None:
+            err_msg = f"Failed to generate facts for the country '{country_code}'"
+            raise FactGenerationException(err_msg)
+
+        return await self._fallback_strategy.generate_facts(country_code)
+
+    async def _request_completion(
+        self, system_prompt: str, user_content: str, max_tokens: int
+    ) -> str:
         request_body = {
             "model": self._ai_model_name,
             "messages": [
-                {"role": "system", "content": self._system_prompt},
-                {"role": "user", "content": selected_country},
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_content},
             ],
             "temperature": 1.0,
-            "max_tokens": 1024,
+            "max_tokens": max_tokens,
         }
 
-        async with aiohttp.ClientSession() as client:
+        client = await self._get_session()
+
+        try:
             async with client.post(
-                "https://api.openai.com/v1/chat/completions",
-                data=json.dumps(request_body),
-                headers=self._headers,
+                self._completions_url, data=json.dumps(request_body)
             ) as response:
                 response_body = await response.text()
 
                 if response.status != 200:
-                    err_response = json.loads(response_body).get("error", {})
-                    err_msg = err_response.get("message", "")
-
-                    self._logger.error(
-                        f"An error occurred while sending the request to OpenAI API: '{err_msg}'"
+                    # Error bodies of proxies and gateways (e.g., 502 pages) are not JSON
+                    try:
+                        err_response = json.loads(response_body).get("error", {})
+                        err_details = err_response.get("message", "")
+                    except (ValueError, AttributeError):
+                        err_details = response_body[:200]
+
+                    err_msg = (
+                        "An error occurred while sending the request to OpenAI API "
+                        f"(HTTP status code: {response.status}): '{err_details}'"
                     )
-                    return await self._fallback_strategy.generate_facts(country_code)
+                    raise FactGenerationException(err_msg)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+            err_msg = (
+                f"Failed to connect to OpenAI API or the request timed out: '{ex}'"
+            )
+            raise FactGenerationException(err_msg) from ex
 
-        assistant_choices = json.loads(response_body).get("choices")
+        try:
+            assistant_choices = json.loads(response_body).get("choices")
+        except (ValueError, AttributeError) as ex:
+            err_msg = f"The OpenAI API returned a response, which is not a JSON object: '{ex}'"
+            raise FactGenerationException(err_msg) from ex
 
         if not assistant_choices:
-            self._logger.error(
-                f"The OpenAI API returned an invalid response for the chosen country "
-                f"'{selected_country}': {assistant_choices}"
+            err_msg = (
+                f"The OpenAI API returned an invalid response: {assistant_choices}"
             )
-            return await self._fallback_strategy.generate_facts(country_code)
+            raise FactGenerationException(err_msg)
 
-        generated_facts = assistant_choices[0].get("message")
+        generated_message = assistant_choices[0].get("message")
 
-        if not generated_facts:
-            self._logger.error(
-                f"Received an empty generated list of facts for the country '{selected_country}' from "
-                f"the OpenAI API"
+        if not generated_message or not generated_message.get("content"):
+            raise FactGenerationException(
+                "Received an empty generated message from the OpenAI API"
             )
-            return await self._fallback_strategy.generate_facts(country_code)
 
-        parsed_facts = list(json.loads(generated_facts.get("content", "{}")).values())
+        return generated_message["content"]
+
+    def _parse_facts(self, generated_facts: Any) -> List[str]:
+        if not isinstance(generated_facts, dict):
+            raise FactGenerationException("Generated facts are not a JSON object")
+
+        parsed_facts = list(generated_facts.values())
+
+        if len(parsed_facts) != self._settings.default_facts_num or not all(
+            isinstance(fact, str) for fact in parsed_facts
+        ):
+            err_msg = (
+                f"Received a generated list of facts with invalid number of facts. Expected "
+                f"{self._settings.default_facts_num}, received {len(parsed_facts)}"
+            )
+            raise FactGenerationException(err_msg)
 
-        if len(parsed_facts) != self._settings.default_facts_num:
+        return parsed_facts
+
+    async def generate_facts(self, country_code: str) -> List[str]:
+        selected_country = self._catalog.name(country_code)
+
+        try:
+            generated_content = await self._request_completion(
+                self._system_prompt, selected_country, max_tokens=FACTS_MAX_TOKENS
+            )
+            return self._parse_facts(json.loads(generated_content))
+        except (FactGenerationException, ValueError) as ex:
             self._logger.error(
-                f"Received a generated list of facts for the country '{selected_country}' with invalid "
-                f"number of facts. Expected {self._settings.default_facts_num}, received "
-                f"{len(parsed_facts)}"
+                f"Failed to generate facts for the country '{selected_country}' with "
+                f"OpenAI API: {ex}"
+            )
+            return await self._fallback(country_code)
+
+    async def generate_facts_batch(
+        self, country_codes: Sequence[str]
+    ) -> Dict[str, List[str]]:
+        """Generates facts for several countries in a single chat completion, so the system
+        prompt and the request overhead are shared by all countries of the batch. Batches above
+        `max_batch_size` are split into several chat completions, which are sent one after another,
+        so a batch never takes more than one concurrent request. Facts of every country are
+        validated separately, and countries with invalid facts or failed sub-batches are omitted
+        from the result. The fallback strategy is not used for batches.
+
+        Args:
+            country_codes (Sequence[str]): Codes of countries to generate facts for.
+
+        Returns:
+            Dict[str, List[str]]: Generated facts keyed by the country code.
+
+        Raises:
+            FactGenerationException: If the request fails or the response is not a JSON object.
+                For split batches, only if all sub-batches fail.
+        """
+
+        if len(country_codes) > self.max_batch_size:
+            batch_facts, last_exception = {}, None
+
+            for batch_country_codes in batched(country_codes, self.max_batch_size):
+                try:
+                    batch_facts.update(
+                        await self.generate_facts_batch(batch_country_codes)
+                    )
+                except FactGenerationException as ex:
+                    self._logger.warning(
+                        f"Failed to generate facts for the sub-batch of countries "
+                        f"{list(batch_country_codes)}: {ex}"
+                    )
+                    last_exception = ex
+
+            if not batch_facts and last_exception is not None:
+                raise last_exception
+
+            return batch_facts
+
+        countries = {code: self._catalog.name(code) for code in country_codes}
+
+        generated_content = await self._request_completion(
+            self._batch_system_prompt,
+            json.dumps(countries),
+            max_tokens=min(
+                FACTS_MAX_TOKENS * len(countries),
+                self._settings.openai_max_output_tokens,
+            ),
+        )
+
+        try:
+            generated_batch = json.loads(generated_content)
+        except ValueError as ex:
+            raise FactGenerationException("Generated batch is not valid JSON") from ex
+
+        if not isinstance(generated_batch, dict):
+            raise FactGenerationException("Generated batch is not a JSON object")
+
+        batch_facts = {}
+
+        for country_code, country_name in countries.items():
+            try:
+                batch_facts[country_code] = self._parse_facts(
+                    generated_batch.get(country_code)
+                )
+            except FactGenerationException as ex:
+                self._logger.warning(
+                    f"Dropped generated facts for the country '{country_name}' from the "
+                    f"batch: {ex}"
+                )
+
+        return batch_facts
+
+
+class GenerationWithFallbackStrategy(FactGenerationStrategy):
+    def __init__(
+        self,
+        primary_strategy: FactGenerationStrategy,
+        fallback_strategy: FactGenerationStrategy,
+    ) -> None:
+        self._primary_strategy = primary_strategy
+        self._fallback_strategy = fallback_strategy
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    async def generate_facts(self, country_code: str) -> List[str]:
+        try:
+            return await self._primary_strategy.generate_facts(country_code)
+        except Exception as ex:
+            self._logger.warning(
+                f"Failed to generate facts for the country '{country_code}', using "
+                f"fallback strategy: '{ex}'"
             )
             return await self._fallback_strategy.generate_facts(country_code)
 
-        return parsed_facts
+    async def close(self) -> None:
+        await self._primary_strategy.close()
+        await self._fallback_strategy.close()
+
+
+class GenerationWithDeadlineStrategy(FactGenerationStrategy):
+    def __init__(
+        self,
+        primary_strategy: FactGenerationStrategy,
+        fallback_strategy: FactGenerationStrategy,
+        deadline: float,
+        cancel_late: bool = True,
+    ) -> None:
+        """Hedges a slow primary strategy with a fast fallback one. If the primary strategy does
+        not return facts within `deadline` seconds, facts of the fallback strategy are returned
+        immediately, so the round creation latency is bounded regardless of the primary strategy.
+
+        Args:
+            primary_strategy (FactGenerationStrategy): The preferred, potentially slow strategy.
+            fallback_strategy (FactGenerationStrategy): The strategy used after the deadline or
+                when the primary strategy fails.
+            deadline (float): The time in seconds to wait for the primary strategy.
+            cancel_late (bool): Whether to cancel the primary strategy after the deadline. If not
+                cancelled, the late result is still produced in the background, which is useful
+                when the primary strategy caches its results.
+        """
+
+        self._primary_strategy = primary_strategy
+        self._fallback_strategy = fallback_strategy
+        self._deadline = deadline
+        self._cancel_late = cancel_late
+        self._late_tasks: Set[asyncio.Task] = set()
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    def _on_late_task_done(self, task: asyncio.Task) -> None:
+        self._late_tasks.discard(task)
+
+        if not task.cancelled() and (ex := task.exception()) is not None:
+            self._logger.warning(f"Late facts generation has failed: '{ex}'")
+
+    async def generate_facts(self, country_code: str) -> List[str]:
+        primary_task = asyncio.create_task(
+            self._primary_strategy.generate_facts(country_code)
+        )
+
+        try:
+            done, _ = await asyncio.wait({primary_task}, timeout=self._deadline)
+        except asyncio.CancelledError:
+            primary_task.cancel()
+            raise
+
+        if primary_task in done:
+            if (ex := primary_task.exception()) is None:
+                return primary_task.result()
+
+            self._logger.warning(
+                f"Failed to generate facts for the country '{country_code}', using "
+                f"fallback strategy: '{ex}'"
+            )
+        else:
+            self._logger.warning(
+                f"Facts generation for the country '{country_code}' exceeded the "
+                f"deadline of {self._deadline} seconds, using fallback strategy"
+            )
+
+            if self._cancel_late:
+                primary_task.cancel()
+            else:
+                self._late_tasks.add(primary_task)
+                primary_task.add_done_callback(self._on_late_task_done)
+
+        return await self._fallback_strategy.generate_facts(country_code)
+
+    async def close(self) -> None:
+        for late_task in list(self._late_tasks):
+            late_task.cancel()
+
+        await asyncio.gather(*self._late_tasks, return_exceptions=True)
+
+        await self._primary_strategy.close()
+        await self._fallback_strategy.close()
+
+
+class GenerationFromCacheStrategy(FactGenerationStrategy):
+    def __init__(
+        self,
+        source_strategy: FactGenerationStrategy,
+        cache: FactsCache,
+        prompt_version: str,
+    ) -> None:
+        self._source_strategy = source_strategy
+        self._cache = cache
+        self._prompt_version = prompt_version
+
+    async def generate_facts(self, country_code: str) -> List[str]:
+        cached_facts = await asyncio.to_thread(
+            self._cache.get, country_code, self._prompt_version
+        )
+
+        if cached_facts is not None:
+            return cached_facts
+
+        facts = await self._source_strategy.generate_facts(country_code)
+
+        await asyncio.to_thread(
+            self._cache.put, country_code, self._prompt_version, facts
+        )
+
+        return facts
+
+    async def generate_facts_batch(
+        self, country_codes: Sequence[str]
+    ) -> Dict[str, List[str]]:
+        batch_facts = {}
+
+        for country_code in country_codes:
+            cached_facts = await asyncio.to_thread(
+                self._cache.get, country_code, self._prompt_version
+            )
+
+            if cached_facts is not None:
+                batch_facts[country_code] = cached_facts
+
+        missing_country_codes = [
+            country_code
+            for country_code in country_codes
+            if country_code not in batch_facts
+        ]
+
+        if not missing_country_codes:
+            return batch_facts
+
+        generated_facts = await self._source_strategy.generate_facts_batch(
+            missing_country_codes
+        )
+
+        for country_code, facts in generated_facts.items():
+            await asyncio.to_thread(
+                self._cache.put, country_code, self._prompt_version, facts
+            )
+
+        return batch_facts | generated_facts
+
+    async def close(self) -> None:
+        await self._source_strategy.close()
+        self._cache.close()
+
+
+# Renders quiz cards of the round for every game session, which differ only in the HUD (score and lives)
+QuizCardRenderer = Callable[
+    [FactsGuessingGameRound, Sequence[GameSession]], Awaitable[List[bytes]]
+]
+GameOutcome = Tuple[int, int]
+
+
+class SpeculativeRound(NamedTuple):
+    game_round: FactsGuessingGameRound
+    # Rendered quiz cards keyed by the `(current_score, lives_remained)` outcome of the answer
+    cards: Dict[GameOutcome, bytes]
+
+
+@dataclass
+class _PendingRound:
+    task: asyncio.Task
+    created_at: float
+    size: int = 0
 
 
 class GuessingFactsGameService:
-    def __init__(self, strategy: FactGenerationStrategy, settings: Settings) -> None:
+    def __init__(
+        self,
+        strategy: FactGenerationStrategy,
+        settings: Settings,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         self._strategy = strategy
         self._settings = settings
+        self._catalog = load_country_catalog(
+            os.path.join(settings.assets_folder, "data", "countries.csv")
+        )
+        self._clock = clock
+
+        self._next_rounds: OrderedDict[Hashable, _PendingRound] = OrderedDict()
+        self._next_rounds_size = 0
+        self._logger = logging.getLogger(self.__class__.__name__)
 
-    async def _select_random_options(self) -> List[Tuple[str, str]]:
+    @property
+    def next_rounds_size(self) -> int:
+        return self._next_rounds_size
+
+    def _select_random_options(self) -> List[Tuple[str, str]]:
         selected_country_ids = random.sample(
-            list(range(1, self._settings.default_countries_num + 1)),
-            k=self._settings.default_options_num,
+            range(len(self._catalog)), k=self._settings.default_options_num
         )
 
-        async with aiofiles.open(
-            os.path.join(self._settings.assets_folder, "data", "countries.csv"),
-            mode="r",
-        ) as file:
-            reader = csv.reader(
-                StringIO(await file.read()), delimiter=",", quotechar='"'
-            )
-            selected_country = [
-                (country_code, country_name)
-                for country_id, country_code, country_name in reader
-                if int(country_id) in selected_country_ids
-            ]
-
-        return selected_country
+        return self._catalog.countries(sorted(selected_country_ids))
 
     async def new_game_round(self) -> FactsGuessingGameRound:
-        selected_countries = await self._select_random_options()
+        selected_countries = self._select_random_options()
         correct_country = random.choice(selected_countries)
         correct_country_code, correct_country_name = correct_country
 
@@ -306,3 +735,161 @@ class GuessingFactsGameService:
         return FactsGuessingGameRound(
             correct_option=correct_country_name, options=options, facts=facts
         )
+
+    def schedule_next_round(
+        self,
+        chat_key: Hashable,
+        game_session: GameSession,
+        render_card: QuizCardRenderer,
+    ) -> None:
+        """Starts building the next round of the chat in the background, while the player thinks
+        about the current one. The quiz card of the next round is rendered for both outcomes of
+        the current answer: the correct one (one more point) and the wrong one (one life less),
+        unless the wrong answer ends the game. A previously scheduled round of the chat is
+        discarded. Has no effect if speculative rounds are disabled in settings.
+
+        Args:
+            chat_key (Hashable): The key of the chat (and the player) the round is built for.
+            game_session (GameSession): The game session with the current round.
+            render_card (QuizCardRenderer): A coroutine function rendering quiz card bytes.
+        """
+
+        if not self._settings.speculative_rounds_enabled:
+            return
+
+        self.discard_next_round(chat_key)
+        self._expire_next_rounds()
+
+        # The session is deep-copied, since the caller may keep updating it after the round is scheduled
+        pending_round = _PendingRound(
+            task=asyncio.create_task(
+                self._build_next_round(game_session.model_copy(deep=True), render_card)
+            ),
+            created_at=self._clock(),
+        )
+        pending_round.task.add_done_callback(
+            lambda task: self._on_next_round_built(chat_key, pending_round)
+        )
+
+        self._next_rounds[chat_key] = pending_round
+
+    async def _build_next_round(
+        self, game_session: GameSession, render_card: QuizCardRenderer
+    ) -> SpeculativeRound:
+        game_round = await self.new_game_round()
+        outcomes = [(game_session.current_score + 1, game_session.lives_remained)]
+
+        if game_session.lives_remained > 1:
+            outcomes.append(
+                (game_session.current_score, game_session.lives_remained - 1)
+            )
+
+        outcome_sessions = [
+            game_session.model_copy(
+                update={
+                    "current_score": current_score,
+                    "lives_remained": lives_remained,
+                }
+            )
+            for current_score, lives_remained in outcomes
+        ]
+        cards = await render_card(game_round, outcome_sessions)
+
+        return SpeculativeRound(game_round=game_round, cards=dict(zip(outcomes, cards)))
+
+    def _on_next_round_built(
+        self, chat_key: Hashable, pending_round: _PendingRound
+    ) -> None:
+        if self._next_rounds.get(chat_key) is not pending_round:
+            return
+
+        if pending_round.task.cancelled():
+            self._pop_next_round(chat_key)
+            return
+
+        if (ex := pending_round.task.exception()) is not None:
+            self._logger.warning(
+                f"Failed to build the next round speculatively: '{ex}'"
+            )
+            self._pop_next_round(chat_key)
+            return
+
+        pending_round.size = sum(
+            len(card) for card in pending_round.task.result().cards.values()
+        )
+        self._next_rounds_size += pending_round.size
+
+        # The least recently scheduled built rounds are evicted first to fit into the memory budget
+        built_round_keys = [
+            key for key, built_round in self._next_rounds.items() if built_round.size
+        ]
+
+        for evicted_key in built_round_keys:
+            if self._next_rounds_size <= self._settings.speculative_rounds_memory_limit:
+                break
+
+            self.discard_next_round(evicted_key)
+
+    async def take_next_round(
+        self, chat_key: Hashable, game_session: GameSession
+    ) -> Tuple[FactsGuessingGameRound, bytes | None] | None:
+        """Takes the speculatively built next round of the chat. A round, which is still being
+        built, is awaited, since it is already ahead of building a new one from scratch.
+
+        Args:
+            chat_key (Hashable): The key of the chat (and the player) the round was built for.
+            game_session (GameSession): The game session after the current answer was applied.
+
+        Returns:
+            Tuple[FactsGuessingGameRound, bytes | None] | None: The next round with its rendered
+                quiz card for the outcome of the answer (None if the outcome was not rendered),
+                or None if there is no speculative round for the chat.
+        """
+
+        self._expire_next_rounds()
+
+        if (pending_round := self._pop_next_round(chat_key)) is None:
+            return None
+
+        try:
+            speculative_round = await pending_round.task
+        except Exception as ex:
+            self._logger.warning(
+                f"Failed to build the next round speculatively: '{ex}'"
+            )
+            return None
+
+        card = speculative_round.cards.get(
+            (game_session.current_score, game_session.lives_remained)
+        )
+
+        return speculative_round.game_round, card
+
+    def discard_next_round(self, chat_key: Hashable) -> None:
+        if (pending_round := self._pop_next_round(chat_key)) is not None:
+            pending_round.task.cancel()
+
+    def _pop_next_round(self, chat_key: Hashable) -> _PendingRound | None:
+        pending_round = self._next_rounds.pop(chat_key, None)
+
+        if pending_round is not None:
+            self._next_rounds_size -= pending_round.size
+
+        return pending_round
+
+    def _expire_next_rounds(self) -> None:
+        expired_at = self._clock() - self._settings.speculative_rounds_ttl
+
+        while self._next_rounds:
+            oldest_key, oldest_round = next(iter(self._next_rounds.items()))
+
+            if oldest_round.created_at > expired_at:
+                break
+
+            self.discard_next_round(oldest_key)
+
+    async def close(self) -> None:
+        for chat_key in list(self._next_rounds):
+            self.discard_next_round(chat_key)
+
+        await self._strategy.close()
@@ -1,13 +1,424 @@
 import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from textwrap import TextWrapper
-from typing import List, Tuple
+from typing import Dict, Iterable, List, NamedTuple, Sequence, Tuple
 
 from PIL import Image, ImageDraw, ImageFont
 
+from .cache import CacheStats
+
 FontRGBColor = Tuple[int, int, int]
 TextXYPosition = Tuple[int, int]
 
 
+class ImageAssetCache:
+    def __init__(self, check_modified: bool = True) -> None:
+        """A cache of decoded image assets (card templates, icons), which are read from disk and
+        decoded only once. Every image is stored already converted to the requested mode and is
+        handed out as a copy, so renders can draw on it freely.
+
+        Args:
+            check_modified (bool): Whether to compare the modification time of the file on every
+                load and decode the file again once it changes.
+        """
+
+        self._check_modified = check_modified
+        self._images: Dict[Tuple[str, str], Tuple[int, Image.Image]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+    def load(self, image_path: str | os.PathLike, mode: str = "RGBA") -> Image.Image:
+        """Returns a copy of the decoded image asset.
+
+        Args:
+            image_path (str | os.PathLike): The path to the image file.
+            mode (str): The mode the image is converted to, e.g., `RGBA`.
+
+        Returns:
+            Image.Image: A copy of the decoded image in the requested mode.
+
+        Raises:
+            OSError: If the file does not exist or cannot be decoded.
+        """
+
+        image_key = (os.path.abspath(image_path), mode)
+        modified_at = os.stat(image_key[0]).st_mtime_ns if self._check_modified else 0
+
+        with self._lock:
+            cached_image = self._images.get(image_key)
+
+        if cached_image is None or cached_image[0] != modified_at:
+            with Image.open(image_key[0]) as source_image:
+                decoded_image = source_image.convert(mode)
+
+            cached_image = (modified_at, decoded_image)
+
+            with self._lock:
+                self._images[image_key] = cached_image
+
+        return cached_image[1].copy()
+
+    def invalidate(self, image_path: str | os.PathLike | None = None) -> None:
+        """Drops the decoded image asset in all modes, or all cached assets if the path is not set.
+
+        Args:
+            image_path (str | os.PathLike | None): The path to the image file.
+        """
+
+        with self._lock:
+            if image_path is None:
+                self._images.clear()
+                return
+
+            absolute_path = os.path.abspath(image_path)
+
+            for image_key in [key for key in self._images if key[0] == absolute_path]:
+                del self._images[image_key]
+
+
+_image_asset_cache = ImageAssetCache()
+
+
+def load_image_asset(image_path: str | os.PathLike, mode: str = "RGBA") -> Image.Image:
+    """Returns a copy of the decoded image asset from the process-wide asset cache.
+
+    Args:
+        image_path (str | os.PathLike): The path to the image file.
+        mode (str): The mode the image is converted to, e.g., `RGBA`.
+
+    Returns:
+        Image.Image: A copy of the decoded image in the requested mode.
+    """
+
+    return _image_asset_cache.load(image_path, mode)
+
+
+@lru_cache(maxsize=32)
+def _load_font(font_path: str, text_size: int) -> ImageFont.FreeTypeFont:
+    return ImageFont.truetype(font_path, text_size)
+
+
+def load_font(font_path: str | os.PathLike, text_size: int) -> ImageFont.FreeTypeFont:
+    """Returns a process-wide font face of the given size. The font file is parsed only on the
+    first call for every size, and the least recently used faces are dropped above 32 faces.
+
+    Args:
+        font_path (str | os.PathLike): The path to the TrueType font file.
+        text_size (int): The font size in points.
+
+    Returns:
+        ImageFont.FreeTypeFont: A shared font face.
+    """
+
+    return _load_font(os.path.abspath(font_path), text_size)
+
+
+def loaded_font_faces() -> int:
+    return _load_font.cache_info().currsize
+
+
+# The spacing between lines of a multiline text used by `ImageDraw.multiline_textbbox`
+MULTILINE_SPACING = 4
+
+
+class LineLayout(NamedTuple):
+    text: str
+    # The advance width of the line
+    width: float
+    # The bottom of the line bounding box drawn at the top left corner
+    bottom: int
+
+
+class TextLayout(NamedTuple):
+    lines: Tuple[LineLayout, ...]
+    width: float
+    height: int
+
+    def origin(
+        self, image_size: Tuple[int, int], center: bool = False
+    ) -> Tuple[float, float]:
+        """Returns the top left corner of the text block on the image.
+
+        Args:
+            image_size (Tuple[int, int]): The width and the height of the image.
+            center (bool): Whether the text block is centered on the image.
+
+        Returns:
+            Tuple[float, float]: The top left corner of the text block.
+        """
+
+        if not center:
+            return 0, 0
+
+        image_width, image_height = image_size
+
+        return (image_width - self.width) / 2, (image_height - self.height) / 2
+
+
+@lru_cache(maxsize=16)
+def _line_spacing(font_path: str, text_size: int) -> int:
+    return load_font(font_path, text_size).getbbox("A")[3] + MULTILINE_SPACING
+
+
+@lru_cache(maxsize=8192)
+def _layout_paragraph(
+    font_path: str, text_size: int, wrap_width: int, paragraph: str
+) -> Tuple[LineLayout, ...]:
+    font = load_font(font_path, text_size)
+
+    return tuple(
+        LineLayout(line, font.getlength(line), font.getbbox(line)[3])
+        for line in TextWrapper(width=wrap_width).wrap(text=paragraph)
+    )
+
+
+def layout_text(
+    font_path: str | os.PathLike,
+    text_size: int,
+    wrap_width: int,
+    paragraphs: Sequence[str],
+) -> TextLayout:
+    """Wraps paragraphs into lines and measures every line once. Layouts of paragraphs are
+    memoised per (paragraph, font, size, wrap width), so recurring paragraphs (e.g., facts) are
+    laid out only once per process. The height of the text block matches
+    `ImageDraw.multiline_textbbox` of all lines joined with newlines.
+
+    Args:
+        font_path (str | os.PathLike): The path to the TrueType font file.
+        text_size (int): The font size in points.
+        wrap_width (int): The maximum number of characters in a line.
+        paragraphs (Sequence[str]): Paragraphs of the text.
+
+    Returns:
+        TextLayout: Measured lines of the text block.
+    """
+
+    font_path = os.path.abspath(font_path)
+    lines = tuple(
+        line
+        for paragraph in paragraphs
+        for line in _layout_paragraph(font_path, text_size, wrap_width, paragraph)
+    )
+    line_spacing = _line_spacing(font_path, text_size)
+
+    return TextLayout(
+        lines=lines,
+        width=max((line.width for line in lines), default=0),
+        height=max(
+            (i * line_spacing + line.bottom for i, line in enumerate(lines)),
+            default=0,
+        ),
+    )
+
+
+class TextTileCache:
+    def __init__(self, memory_limit: int) -> None:
+        """A cache of pre-rasterised text lines (tiles), which are stored as alpha masks cropped to
+        the bounding box of the line. Tiles are blitted onto images instead of rasterising the text
+        with FreeType again. Blitting a tile at integer coordinates is identical to drawing the text
+        with `ImageDraw.text` there. The cache is limited by the total size of masks in bytes and
+        evicts the least recently used tiles.
+
+        Args:
+            memory_limit (int): The maximum total size of tiles in bytes.
+        """
+
+        self._memory_limit = memory_limit
+        self._tiles: OrderedDict[Tuple[str, int, str], Tuple[Image.Image, int, int]] = (
+            OrderedDict()
+        )
+        self._memory_size = 0
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(**vars(self._stats))
+
+    @property
+    def memory_size(self) -> int:
+        return self._memory_size
+
+    @property
+    def full(self) -> bool:
+        return self._memory_size >= self._memory_limit
+
+    def tile(
+        self, font_path: str, text_size: int, line: str
+    ) -> Tuple[Image.Image, int, int]:
+        """Returns the tile of the text line, rasterising it on a miss.
+
+        Args:
+            font_path (str): The absolute path to the TrueType font file.
+            text_size (int): The font size in points.
+            line (str): The single-line text.
+
+        Returns:
+            Tuple[Image.Image, int, int]: The alpha mask of the line and its left and top offsets
+                from the text position.
+        """
+
+        tile_key = (font_path, text_size, line)
+
+        with self._lock:
+            if (tile := self._tiles.get(tile_key)) is not None:
+                self._tiles.move_to_end(tile_key)
+                self._stats.hits += 1
+                return tile
+
+            self._stats.misses += 1
+
+        font = load_font(font_path, text_size)
+        left, top, right, bottom = font.getbbox(line)
+
+        line_mask = Image.new("L", (max(right - left, 1), max(bottom - top, 1)))
+        ImageDraw.Draw(line_mask).text((-left, -top), line, font=font, fill=255)
+
+        tile = (line_mask, left, top)
+        tile_size = line_mask.width * line_mask.height
+
+        with self._lock:
+            if tile_size <= self._memory_limit and tile_key not in self._tiles:
+                self._tiles[tile_key] = tile
+                self._memory_size += tile_size
+
+                while self._memory_size > self._memory_limit:
+                    _, (evicted_mask, _, _) = self._tiles.popitem(last=False)
+                    self._memory_size -= evicted_mask.width * evicted_mask.height
+                    self._stats.evictions += 1
+
+        return tile
+
+    def draw(
+        self,
+        image: Image.Image,
+        font_path: str,
+        text_size: int,
+        line: str,
+        position: TextXYPosition,
+        color: FontRGBColor,
+    ) -> Image.Image:
+        line_mask, left, top = self.tile(font_path, text_size, line)
+        x, y = position
+
+        image.paste(color, (x + left, y + top), mask=line_mask)
+
+        return image
+
+
+@lru_cache(maxsize=None)
+def load_text_tile_cache(memory_limit: int) -> TextTileCache:
+    """Returns a process-wide cache of text tiles with the memory limit. The cache is shared by
+    all renders of the process, including renders in worker processes of a process pool, which
+    get their own instance.
+
+    Args:
+        memory_limit (int): The maximum total size of tiles in bytes.
+
+    Returns:
+        TextTileCache: A shared cache of text tiles.
+    """
+
+    return TextTileCache(memory_limit)
+
+
+class GlyphAtlas:
+    def __init__(self, font: ImageFont.FreeTypeFont, glyphs: str = "") -> None:
+        """A set of pre-rasterised glyph masks of a font face. Glyphs listed in `glyphs` are
+        rasterised upfront, other glyphs on their first use. A text is drawn by blitting glyph
+        masks one after another, which matches the basic layout of `ImageDraw.text` for fonts
+        with integer advances and without kerning (e.g., digits).
+
+        Args:
+            font (ImageFont.FreeTypeFont): The font face to rasterise glyphs with.
+            glyphs (str): Glyphs rasterised when the atlas is created.
+        """
+
+        self._font = font
+        self._tiles: Dict[str, Tuple[Image.Image, float]] = {}
+
+        for glyph in glyphs:
+            self._tile(glyph)
+
+    def _tile(self, glyph: str) -> Tuple[Image.Image, float]:
+        if (tile := self._tiles.get(glyph)) is None:
+            advance = self._font.getlength(glyph)
+            _, _, right, bottom = self._font.getbbox(glyph)
+
+            glyph_mask = Image.new("L", (max(right, 1), max(bottom, 1)))
+            ImageDraw.Draw(glyph_mask).text((0, 0), glyph, font=self._font, fill=255)
+
+            tile = self._tiles.setdefault(glyph, (glyph_mask, advance))
+
+        return tile
+
+    def draw(
+        self,
+        image: Image.Image,
+        text: str,
+        position: TextXYPosition,
+        color: FontRGBColor,
+    ) -> Image.Image:
+        x, y = position
+
+        for glyph in text:
+            glyph_mask, advance = self._tile(glyph)
+            image.paste(color, (int(x), int(y)), mask=glyph_mask)
+            x += advance
+
+        return image
+
+
+@lru_cache(maxsize=16)
+def _load_glyph_atlas(font_path: str, text_size: int, glyphs: str) -> GlyphAtlas:
+    return GlyphAtlas(load_font(font_path, text_size), glyphs)
+
+
+def load_glyph_atlas(
+    font_path: str | os.PathLike, text_size: int, glyphs: str = "0123456789"
+) -> GlyphAtlas:
+    return _load_glyph_atlas(os.path.abspath(font_path), text_size, glyphs)
+
+
+@lru_cache(maxsize=32)
+def _load_icon_strip(icon_path: str, count: int) -> Image.Image | None:
+    if count == 0:
+        return None
+
+    icon = _image_asset_cache.load(icon_path)
+    icon_strip = Image.new("RGBA", (icon.width * count, icon.height))
+
+    for i in range(count):
+        icon_strip.paste(icon, (i * icon.width, 0))
+
+    return icon_strip
+
+
+def load_icon_strip(icon_path: str | os.PathLike, count: int) -> Image.Image | None:
+    """Returns a process-wide strip of the icon repeated `count` times in a row, e.g., hearts
+    of remaining lives. The strip must not be modified.
+
+    Args:
+        icon_path (str | os.PathLike): The path to the icon file.
+        count (int): The number of icons in the strip.
+
+    Returns:
+        Image.Image | None: A shared strip of icons, or None if the count is 0.
+    """
+
+    return _load_icon_strip(os.path.abspath(icon_path), count)
+
+
+def preload_image_assets(image_paths: Iterable[str | os.PathLike]) -> None:
+    for image_path in image_paths:
+        _image_asset_cache.load(image_path)
+
+
 class ImageEditService:
     def __init__(
         self,
@@ -15,11 +426,22 @@ class ImageEditService:
         font_color: FontRGBColor,
         pad: int = 5,
         max_width: int = 55,
+        text_tiles_memory_limit: int = 0,
     ):
         self._font_path = font_path
         self._font_color = font_color
-        self._text_wrapper = TextWrapper(width=max_width)
+        self._max_width = max_width
         self._pad = pad
+        self._text_tiles_memory_limit = text_tiles_memory_limit
+
+    @property
+    def cache_key(self) -> Tuple[str, FontRGBColor, int, int]:
+        return (
+            os.path.basename(self._font_path),
+            self._font_color,
+            self._pad,
+            self._max_width,
+        )
 
     def add_text(
         self,
@@ -43,7 +465,7 @@ class ImageEditService:
         """
 
         draw = ImageDraw.Draw(image)
-        font = ImageFont.truetype(self._font_path, text_size)
+        font = load_font(self._font_path, text_size)
 
         _, _, text_width, text_height = draw.multiline_textbbox((0, 0), text, font=font)
 
@@ -56,6 +478,168 @@ class ImageEditService:
 
         return image
 
+    def add_numbered_text(
+        self,
+        image: Image,
+        text: List[str],
+        text_size: int = 14,
+        position: TextXYPosition = (0, 0),
+        center: bool = False,
+    ) -> Image:
+        """Draws paragraphs numbered from 1 like `add_multiline_text`. If text tiles are enabled,
+        numbers are blitted from the glyph atlas and lines from the shared cache of text tiles, so
+        recurring paragraphs are rasterised only once. With text tiles, the text block is aligned
+        to whole pixels.
+
+        Args:
+            image: The image to draw on.
+            text: Paragraphs to number and draw.
+            text_size: The font size in points.
+            position: The offset of the text block.
+            center: Whether the text block is centered on the image.
+
+        Returns:
+            The same image with the text drawn.
+        """
+
+        numbered_text = [f"{i + 1}. {paragraph}" for i, paragraph in enumerate(text)]
+
+        if not self._text_tiles_memory_limit:
+            return self.add_multiline_text(
+                image, numbered_text, text_size, position, center
+            )
+
+        font_path = os.path.abspath(self._font_path)
+        text_tile_cache = load_text_tile_cache(self._text_tiles_memory_limit)
+        number_glyphs = load_glyph_atlas(font_path, text_size, "0123456789. ")
+
+        text_layout = layout_text(font_path, text_size, self._max_width, numbered_text)
+        offset_x, offset_y = position
+        x, y = text_layout.origin(image.size, center)
+        x, y = round(x + offset_x), round(y + offset_y)
+
+        for i, paragraph in enumerate(numbered_text):
+            number = f"{i + 1}. "
+            paragraph_lines = _layout_paragraph(
+                font_path, text_size, self._max_width, paragraph
+            )
+
+            for j, line in enumerate(paragraph_lines):
+                line_text, line_x = line.text, x
+
+                # Numbers are drawn separately, so lines of a paragraph are shared by all its positions.
+                # A number with a fractional width is kept in the line, since the rest of the line
+                # could not be blitted at the whole-pixel offset it is drawn at
+                number_width = load_font(font_path, text_size).getlength(number)
+
+                if (
+                    j == 0
+                    and line_text.startswith(number)
+                    and number_width.is_integer()
+                ):
+                    number_glyphs.draw(image, number, (x, y), self._font_color)
+                    line_text = line_text[len(number) :]
+                    line_x += int(number_width)
+
+                text_tile_cache.draw(
+                    image,
+                    font_path,
+                    text_size,
+                    line_text,
+                    (line_x, y),
+                    self._font_color,
+                )
+                y += line.bottom + self._pad
+
+        return image
+
+    def warm_up_text_tiles(self, text: Iterable[str], text_size: int = 14) -> int:
+        """Rasterises lines of paragraphs numbered with a single digit into the shared cache of
+        text tiles, until the cache is full.
+
+        Args:
+            text: Paragraphs to rasterise.
+            text_size: The font size in points.
+
+        Returns:
+            The number of rasterised paragraphs.
+        """
+
+        if not self._text_tiles_memory_limit:
+            return 0
+
+        font_path = os.path.abspath(self._font_path)
+        text_tile_cache = load_text_tile_cache(self._text_tiles_memory_limit)
+        paragraphs_num = 0
+
+        for paragraph in text:
+            if text_tile_cache.full:
+                break
+
+            paragraph_lines = _layout_paragraph(
+                font_path, text_size, self._max_width, f"1. {paragraph}"
+            )
+
+            for j, line in enumerate(paragraph_lines):
+                line_text = line.text
+
+                if j == 0 and line_text.startswith("1. "):
+                    line_text = line_text[3:]
+
+                text_tile_cache.tile(font_path, text_size, line_text)
+
+            paragraphs_num += 1
+
+        return paragraphs_num
+
+    def add_glyph_text(
+        self,
+        image: Image,
+        text: str,
+        text_size: int = 14,
+        position: TextXYPosition = (0, 0),
+    ) -> Image:
+        """Draws a single-line text by blitting pre-rasterised glyphs from the shared atlas of
+        the font size. Suited for short texts from a small set of glyphs, such as scores.
+
+        Args:
+            image: The image to draw on.
+            text: The text to draw.
+            text_size: The font size in points.
+            position: The top left position of the text.
+
+        Returns:
+            The same image with the text drawn.
+        """
+
+        return load_glyph_atlas(self._font_path, text_size).draw(
+            image, text, position, self._font_color
+        )
+
+    def add_icon_strip(
+        self,
+        image: Image,
+        icon_path: str | os.PathLike,
+        count: int,
+        position: TextXYPosition = (0, 0),
+    ) -> Image:
+        """Blits the icon repeated `count` times in a row with a single paste.
+
+        Args:
+            image: The image to draw on.
+            icon_path: The path to the icon file.
+            count: The number of icons.
+            position: The top left position of the first icon.
+
+        Returns:
+            The same image with icons drawn.
+        """
+
+        if (icon_strip := load_icon_strip(icon_path, count)) is not None:
+            image.paste(icon_strip, position, mask=icon_strip)
+
+        return image
+
     def add_multiline_text(
         self,
         image: Image,
@@ -78,28 +662,19 @@ class ImageEditService:
         """
 
         draw = ImageDraw.Draw(image)
-        font = ImageFont.truetype(self._font_path, text_size)
-
-        multiline_text = [
-            chunk for line in text for chunk in self._text_wrapper.wrap(text=line)
-        ]
-        concatenated_text = "\n".join(multiline_text)
-
-        _, _, text_width, text_height = draw.multiline_textbbox(
-            (0, 0), concatenated_text, font=font
-        )
+        font = load_font(self._font_path, text_size)
 
-        max_width = max(draw.textlength(line, font=font) for line in multiline_text)
+        text_layout = layout_text(self._font_path, text_size, self._max_width, text)
         offset_x, offset_y = position
+        x, y = text_layout.origin(image.size, center)
 
-        x = (image.width - max_width) / 2 if center else 0
-        y = (image.height - text_height) / 2 if center else 0
-
-        for line in multiline_text:
-            _, _, line_width, line_height = draw.textbbox((0, 0), line, font=font)
+        for line in text_layout.lines:
             draw.text(
-                (x + offset_x, y + offset_y), line, font=font, fill=self._font_color
+                (x + offset_x, y + offset_y),
+                line.text,
+                font=font,
+                fill=self._font_color,
             )
-            y += line_height + self._pad
+            y += line.bottom + self._pad
 
         return image
@@ -0,0 +1,197 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Set
+
+from .game import FactGenerationStrategy
+
+
+class FactsPrefetchPool:
+    def __init__(
+        self,
+        source_strategy: FactGenerationStrategy,
+        country_codes: Iterable[str],
+        depth: int,
+        low_watermark: int = 1,
+        concurrency: int = 1,
+        batch_size: int = 1,
+        warm_up: bool = True,
+    ) -> None:
+        """A bounded pool of pre-generated fact sets per country, which is refilled by background
+        asyncio tasks. Every country keeps up to `depth` fact sets. Once the number of fact sets
+        of the country drops below `low_watermark`, the country is queued for a refill up to the
+        full `depth`.
+
+        Args:
+            source_strategy (FactGenerationStrategy): The strategy used to generate fact sets.
+                It should raise an exception instead of falling back to another strategy, so only
+                valid fact sets get into the pool.
+            country_codes (Iterable[str]): Codes of countries to keep fact sets for.
+            depth (int): The maximum number of fact sets per country (high watermark).
+            low_watermark (int): The number of fact sets per country below which a refill starts.
+            concurrency (int): The number of background tasks refilling the pool.
+            batch_size (int): The maximum number of countries refilled with a single batch call
+                of the source strategy.
+            warm_up (bool): Whether to queue all countries for a refill when the pool starts.
+        """
+
+        if depth < 1:
+            raise ValueError("Prefetch depth must be at least 1")
+
+        if not 0 < low_watermark <= depth:
+            raise ValueError("Low watermark must be between 1 and prefetch depth")
+
+        self._source_strategy = source_strategy
+        self._depth = depth
+        self._low_watermark = low_watermark
+        self._concurrency = concurrency
+        self._batch_size = batch_size
+        self._warm_up = warm_up
+
+        self._pool: Dict[str, Deque[List[str]]] = {
+            country_code: deque(maxlen=depth) for country_code in country_codes
+        }
+        self._pending: Set[str] = set()
+        self._refill_queue: asyncio.Queue | None = None
+        self._workers: List[asyncio.Task] = []
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def started(self) -> bool:
+        return bool(self._workers)
+
+    def size(self, country_code: str) -> int:
+        return len(self._pool[country_code])
+
+    def start(self) -> None:
+        """Starts background refill tasks in the running event loop. Calling the method on an
+        already started pool has no effect.
+        """
+
+        if self.started:
+            return
+
+        self._refill_queue = asyncio.Queue()
+        self._workers = [
+            asyncio.create_task(self._refill_worker()) for _ in range(self._concurrency)
+        ]
+
+        if self._warm_up:
+            for country_code in self._pool:
+                self._schedule_refill(country_code)
+
+    def take(self, country_code: str) -> List[str] | None:
+        """Takes the oldest pre-generated fact set of the country from the pool and schedules
+        a refill if the country falls below the low watermark.
+
+        Args:
+            country_code (str): The ISO 3166-1 alpha-2 code of the country.
+
+        Returns:
+            List[str] | None: A fact set, or None if the pool of the country is empty.
+        """
+
+        country_pool = self._pool.get(country_code)
+
+        if country_pool is None:
+            return None
+
+        facts = country_pool.popleft() if country_pool else None
+
+        if len(country_pool) < self._low_watermark:
+            self._schedule_refill(country_code)
+
+        return facts
+
+    def _schedule_refill(self, country_code: str) -> None:
+        if self._refill_queue is None or country_code in self._pending:
+            return
+
+        self._pending.add(country_code)
+        self._refill_queue.put_nowait(country_code)
+
+    async def _refill(self, country_codes: List[str]) -> None:
+        missing_country_codes = [
+            country_code
+            for country_code in country_codes
+            if len(self._pool[country_code]) < self._depth
+        ]
+
+        while missing_country_codes:
+            if self._batch_size > 1:
+                generated_facts = await self._source_strategy.generate_facts_batch(
+                    missing_country_codes
+                )
+            else:
+                generated_facts = {
+                    country_code: await self._source_strategy.generate_facts(
+                        country_code
+                    )
+                    for country_code in missing_country_codes
+                }
+
+            for country_code, facts in generated_facts.items():
+                self._pool[country_code].append(facts)
+
+            # Countries dropped from the batch are not retried until their next refill
+            missing_country_codes = [
+                country_code
+                for country_code in missing_country_codes
+                if country_code in generated_facts
+                and len(self._pool[country_code]) < self._depth
+            ]
+
+    async def _refill_worker(self) -> None:
+        while True:
+            country_codes = [await self._refill_queue.get()]
+
+            while len(country_codes) < self._batch_size:
+                try:
+                    country_codes.append(self._refill_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            try:
+                await self._refill(country_codes)
+            except asyncio.CancelledError:
+                raise
+            except Exception as ex:
+                self._logger.warning(
+                    f"Failed to prefetch facts for countries {country_codes}: '{ex}'"
+                )
+            finally:
+                for country_code in country_codes:
+                    self._pending.discard(country_code)
+                    self._refill_queue.task_done()
+
+    async def close(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+
+        await asyncio.gather(*self._workers, return_exceptions=True)
+
+        self._workers = []
+        self._refill_queue = None
+        self._pending.clear()
+
+        await self._source_strategy.close()
+
+
+class GenerationFromPrefetchPoolStrategy(FactGenerationStrategy):
+    def __init__(
+        self, pool: FactsPrefetchPool, fallback_strategy: FactGenerationStrategy
+    ) -> None:
+        self._pool = pool
+        self._fallback_strategy = fallback_strategy
+
+    async def generate_facts(self, country_code: str) -> List[str]:
+        self._pool.start()
+
+        if (facts := self._pool.take(country_code)) is not None:
+            return facts
+
+        return await self._fallback_strategy.generate_facts(country_code)
+
+    async def close(self) -> None:
+        await self._pool.close()
+        await self._fallback_strategy.close()
@@ -0,0 +1,122 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Iterable, List, TypeVar
+
+from ..settings import RenderingExecutor
+from .cache import RenderedCardCache
+from .image import preload_image_assets
+
+T = TypeVar("T")
+
+
+def _initialize_worker(
+    image_paths: List[str | os.PathLike], warm_up: Callable[[], Any] | None
+) -> None:
+    preload_image_assets(image_paths)
+
+    if warm_up is not None:
+        warm_up()
+
+
+class RenderExecutor:
+    def __init__(
+        self,
+        mode: RenderingExecutor = RenderingExecutor.INLINE,
+        max_workers: int | None = None,
+        preload_image_paths: Iterable[str | os.PathLike] = (),
+        card_cache: RenderedCardCache | None = None,
+        warm_up: Callable[[], Any] | None = None,
+    ) -> None:
+        """Runs synchronous rendering functions inline, in a thread pool or in a process pool.
+        Pillow releases the GIL in most of its heavy operations (e.g., PNG encoding), so a thread
+        pool already renders cards in parallel, while a process pool avoids the GIL completely.
+        Every worker process has its own asset caches, which are filled with the listed images
+        and the warm-up function when the worker starts. Otherwise, the warm-up function runs in
+        a background thread. Functions and arguments sent to a process pool must be picklable.
+
+        Args:
+            mode (RenderingExecutor): The kind of executor.
+            max_workers (int | None): The number of workers, defaults to the number of CPU cores.
+            preload_image_paths (Iterable[str | os.PathLike]): Images decoded by every worker
+                process on its start.
+            card_cache (RenderedCardCache | None): The cache of rendered cards used by
+                `run_cached`.
+            warm_up (Callable[[], Any] | None): A function filling process-wide render caches.
+        """
+
+        self._mode = mode
+        self._card_cache = card_cache
+        self._executor: Executor | None = None
+
+        match mode:
+            case RenderingExecutor.THREAD:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max_workers or os.cpu_count(),
+                    thread_name_prefix="render",
+                )
+            case RenderingExecutor.PROCESS:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_initialize_worker,
+                    initargs=(list(preload_image_paths), warm_up),
+                )
+
+        if warm_up is not None and mode != RenderingExecutor.PROCESS:
+            threading.Thread(target=warm_up, name="render-warm-up", daemon=True).start()
+
+    @property
+    def mode(self) -> RenderingExecutor:
+        return self._mode
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """Runs the rendering function with the given arguments and waits for its result without
+        blocking the event loop, unless the executor is inline.
+
+        Args:
+            func (Callable[..., T]): The synchronous rendering function.
+            *args (Any): Positional arguments of the function.
+
+        Returns:
+            T: The result of the function.
+        """
+
+        if self._executor is None:
+            return func(*args)
+
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, partial(func, *args)
+        )
+
+    async def run_cached(
+        self, cache_key: str, func: Callable[..., bytes], *args: Any
+    ) -> bytes:
+        """Returns the rendered card from the card cache, or renders it with `run` and caches it.
+        Without a card cache, the card is always rendered.
+
+        Args:
+            cache_key (str): The key of the card, which covers everything the card depends on.
+            func (Callable[..., bytes]): The synchronous rendering function.
+            *args (Any): Positional arguments of the function.
+
+        Returns:
+            bytes: The rendered card.
+        """
+
+        if self._card_cache is None:
+            return await self.run(func, *args)
+
+        if (card := self._card_cache.get(cache_key)) is not None:
+            return card
+
+        card = await self.run(func, *args)
+        self._card_cache.put(cache_key, card)
+
+        return card
+
+    async def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
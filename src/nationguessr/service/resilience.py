@@ -0,0 +1,202 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from enum import Enum
+from typing import Awaitable, Callable, Deque, Dict, List, Sequence, TypeVar
+
+from .game import FactGenerationException, FactGenerationStrategy
+
+T = TypeVar("T")
+
+
+class CircuitState(str, Enum):
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        slow_call_duration: float = 20.0,
+        window_size: int = 20,
+        min_calls: int = 5,
+        open_duration: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """A circuit breaker driven by the rate of failed and slow calls. In the closed state,
+        outcomes of the last `window_size` calls are tracked, and the circuit opens once at least
+        `min_calls` calls are recorded and the share of failed or slow calls reaches
+        `failure_rate_threshold`. The open circuit rejects all calls for `open_duration` seconds
+        and then turns half-open, letting through up to `half_open_max_calls` probe calls.
+        A successful probe closes the circuit, while a failed one opens it again.
+
+        Args:
+            failure_rate_threshold (float): The share of failed or slow calls, which opens the circuit.
+            slow_call_duration (float): The call duration in seconds, from which a successful call
+                is counted as a failed one.
+            window_size (int): The number of last calls used to calculate the failure rate.
+            min_calls (int): The minimum number of recorded calls to calculate the failure rate.
+            open_duration (float): The time in seconds the circuit stays open.
+            half_open_max_calls (int): The number of concurrent probe calls in the half-open state.
+            clock (Callable[[], float]): A function returning the monotonic time in seconds.
+        """
+
+        if not 0 < failure_rate_threshold <= 1:
+            raise ValueError("Failure rate threshold must be between 0 and 1")
+
+        self._failure_rate_threshold = failure_rate_threshold
+        self._slow_call_duration = slow_call_duration
+        self._min_calls = min_calls
+        self._open_duration = open_duration
+        self._half_open_max_calls = half_open_max_calls
+        self._clock = clock
+
+        self._state = CircuitState.CLOSED
+        self._outcomes: Deque[bool] = deque(maxlen=window_size)
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def state(self) -> CircuitState:
+        if (
+            self._state == CircuitState.OPEN
+            and self._clock() - self._opened_at >= self._open_duration
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+
+        return self._state
+
+    def _transition(self, state: CircuitState) -> None:
+        self._logger.info(f"Circuit state changed from {self._state} to {state}")
+
+        self._state = state
+        self._outcomes.clear()
+        self._half_open_calls = 0
+
+        if state == CircuitState.OPEN:
+            self._opened_at = self._clock()
+
+    def allow_request(self) -> bool:
+        """Checks whether a call is allowed in the current state. Every allowed call must be
+        followed by `record_success` or `record_failure`.
+
+        Returns:
+            bool: True if the call is allowed, otherwise False.
+        """
+
+        match self.state:
+            case CircuitState.CLOSED:
+                return True
+            case CircuitState.HALF_OPEN if (
+                self._half_open_calls < self._half_open_max_calls
+            ):
+                self._half_open_calls += 1
+                return True
+            case _:
+                return False
+
+    def record_success(self, duration: float = 0.0) -> None:
+        self._record(failed=duration >= self._slow_call_duration)
+
+    def record_failure(self) -> None:
+        self._record(failed=True)
+
+    def _record(self, failed: bool) -> None:
+        match self._state:
+            case CircuitState.HALF_OPEN:
+                self._transition(CircuitState.OPEN if failed else CircuitState.CLOSED)
+            case CircuitState.CLOSED:
+                self._outcomes.append(failed)
+
+                if (
+                    len(self._outcomes) >= self._min_calls
+                    and sum(self._outcomes) / len(self._outcomes)
+                    >= self._failure_rate_threshold
+                ):
+                    self._transition(CircuitState.OPEN)
+
+
+class GenerationWithCircuitBreakerStrategy(FactGenerationStrategy):
+    def __init__(
+        self,
+        primary_strategy: FactGenerationStrategy,
+        circuit_breaker: CircuitBreaker,
+        max_concurrency: int,
+        max_queue_size: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Guards the primary strategy with a circuit breaker and limits the number of concurrent
+        calls. Up to `max_concurrency` calls run at once, and up to `max_queue_size` calls wait for
+        a free slot. Calls above the queue size and calls rejected by the open circuit fail
+        immediately with `FactGenerationException`, so an outer strategy can fall back without
+        waiting for the degraded upstream.
+
+        Args:
+            primary_strategy (FactGenerationStrategy): The guarded strategy.
+            circuit_breaker (CircuitBreaker): The circuit breaker recording call outcomes.
+            max_concurrency (int): The maximum number of concurrent calls.
+            max_queue_size (int): The maximum number of calls waiting for a free slot.
+            clock (Callable[[], float]): A function returning the monotonic time in seconds.
+        """
+
+        self._primary_strategy = primary_strategy
+        self._circuit_breaker = circuit_breaker
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_queue_size = max_queue_size
+        self._queue_size = 0
+        self._clock = clock
+
+    @property
+    def queue_size(self) -> int:
+        return self._queue_size
+
+    async def _guarded_call(self, call: Callable[[], Awaitable[T]]) -> T:
+        if self._semaphore.locked() and self._queue_size >= self._max_queue_size:
+            raise FactGenerationException("Too many concurrent facts generation calls")
+
+        self._queue_size += 1
+
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._queue_size -= 1
+
+        try:
+            if not self._circuit_breaker.allow_request():
+                raise FactGenerationException("Facts generation circuit is open")
+
+            started_at = self._clock()
+
+            try:
+                result = await call()
+            except BaseException:
+                # Cancelled calls (e.g., after a deadline) are counted as failed ones, so a probe
+                # call of the half-open circuit always gets its outcome recorded
+                self._circuit_breaker.record_failure()
+                raise
+
+            self._circuit_breaker.record_success(self._clock() - started_at)
+
+            return result
+        finally:
+            self._semaphore.release()
+
+    async def generate_facts(self, country_code: str) -> List[str]:
+        return await self._guarded_call(
+            lambda: self._primary_strategy.generate_facts(country_code)
+        )
+
+    async def generate_facts_batch(
+        self, country_codes: Sequence[str]
+    ) -> Dict[str, List[str]]:
+        return await self._guarded_call(
+            lambda: self._primary_strategy.generate_facts_batch(country_codes)
+        )
+
+    async def close(self) -> None:
+        await self._primary_strategy.close()
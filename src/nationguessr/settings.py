@@ -1,7 +1,8 @@
 import os
 from enum import Enum
+from typing import List
 
-from pydantic import Field, NonNegativeInt
+from pydantic import Field, NonNegativeInt, PositiveFloat, PositiveInt
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from .service.image import FontRGBColor
@@ -18,9 +19,33 @@ class LoggingLevel(Enum):
 
 class FactsGenerationStrategy(str, Enum):
     LOCAL_ZIPFILE = "LOCAL_ZIPFILE"
+    LOCAL_FACTSTORE = "LOCAL_FACTSTORE"
     GENERATIVE_AI = "GENERATIVE_AI"
 
 
+class FactsSamplingMode(str, Enum):
+    UNIFORM = "UNIFORM"
+    BALANCED = "BALANCED"
+
+
+class RenderingExecutor(str, Enum):
+    INLINE = "INLINE"
+    THREAD = "THREAD"
+    PROCESS = "PROCESS"
+
+
+class CardEncodingFormat(str, Enum):
+    PNG = "PNG"
+    PNG_PALETTE = "PNG_PALETTE"
+    JPEG = "JPEG"
+    WEBP = "WEBP"
+
+
+class FsmDataLayout(str, Enum):
+    NATIVE = "NATIVE"
+    BINARY = "BINARY"
+
+
 class Settings(BaseSettings):
     # General settings
     model_config = SettingsConfigDict(env_prefix="VAR_", case_sensitive=False)
@@ -41,19 +66,98 @@ class Settings(BaseSettings):
     default_init_lives: NonNegativeInt = Field(default=5)
     default_facts_num: NonNegativeInt = Field(default=5)
     default_options_num: NonNegativeInt = Field(default=4)
-    default_countries_num: NonNegativeInt = Field(default=194)
 
     default_text_color: FontRGBColor = Field(default=(66, 68, 110))
 
+    # Executor rendering game cards, which keeps the event loop free during rendering if it's a thread or
+    # a process pool. The number of workers defaults to the number of CPU cores
+    rendering_executor: RenderingExecutor = Field(default=RenderingExecutor.INLINE)
+    rendering_workers: PositiveInt | None = Field(default=None)
+
+    # Encoding of game cards sent to Telegram. The compression level applies to PNG formats, the quality applies
+    # to JPEG and WebP formats. `CardEncodingFormat.PNG_PALETTE` quantises cards to a palette precomputed from
+    # the card template
+    card_encoding_format: CardEncodingFormat = Field(default=CardEncodingFormat.PNG)
+    card_compression_level: int = Field(default=6, ge=0, le=9)
+    card_quality: int = Field(default=85, ge=1, le=100)
+
+    # Rendered cards cache settings for cards depending only on small inputs (game over and scoreboard cards).
+    # The memory tier is disabled if the limit is 0, the disk tier is disabled if the directory is not set.
+    # On AWS Lambda, the cache directory should point to the writable `/tmp` folder
+    card_cache_memory_limit: NonNegativeInt = Field(default=8 * 1024 * 1024)
+    card_cache_dir: str | os.PathLike | None = Field(default=None)
+    card_cache_disk_max_entries: PositiveInt = Field(default=1024)
+
+    # The maximum number of Telegram file ids of uploaded cards, which are sent again without uploading
+    file_id_registry_max_entries: PositiveInt = Field(default=4096)
+
+    # Pre-rasterised text tiles of facts shared by quiz card renders of a process (disabled if the limit is 0).
+    # Tiles align the facts block to whole pixels, so quiz cards differ slightly from cards drawn without them.
+    # Tiles pay off when facts recur, e.g., with a small corpus or a warm-up, which rasterises facts of the local
+    # facts archive in the background on start (about 75 KB of tiles per fact)
+    text_tiles_memory_limit: NonNegativeInt = Field(default=0)
+    text_tiles_warm_up: bool = Field(default=False)
+
     fact_generation_strategy: FactsGenerationStrategy = Field(
         FactsGenerationStrategy.LOCAL_ZIPFILE
     )
 
+    # Facts sampling settings (applicable only to `FactsGenerationStrategy.LOCAL_ZIPFILE`)
+    fact_sampling_mode: FactsSamplingMode = Field(default=FactsSamplingMode.UNIFORM)
+    # Restricts `FactsSamplingMode.BALANCED` to the listed fact categories, e.g., '["culture", "history"]'
+    fact_categories: List[str] | None = Field(default=None)
+
     # OpenAI API settings (required only if `FactsGenerationStrategy.GENERATIVE_AI` is selected)
     openai_api_token: str | None = Field(default=None)
+    openai_api_base_url: str = Field(default="https://api.openai.com/v1")
+    openai_connection_limit: PositiveInt = Field(default=10)
+    openai_keepalive_timeout: PositiveFloat = Field(default=60.0)
+    openai_dns_cache_ttl: PositiveInt = Field(default=300)
+    openai_connect_timeout: PositiveFloat = Field(default=5.0)
+    openai_request_timeout: PositiveFloat = Field(default=60.0)
+    # The output token limit of the model. Batches of facts above the limit are split into several requests
+    openai_max_output_tokens: PositiveInt = Field(default=16384)
+
+    # OpenAI API circuit breaker and concurrency limiter settings
+    openai_max_concurrency: PositiveInt = Field(default=8)
+    openai_max_queue_size: NonNegativeInt = Field(default=32)
+    openai_breaker_failure_rate: float = Field(default=0.5, gt=0, le=1)
+    openai_breaker_slow_call_duration: PositiveFloat = Field(default=20.0)
+    openai_breaker_window_size: PositiveInt = Field(default=20)
+    openai_breaker_min_calls: PositiveInt = Field(default=5)
+    openai_breaker_open_duration: PositiveFloat = Field(default=30.0)
+
+    # Time in seconds to wait for generated facts before falling back to local facts (disabled if not set)
+    facts_generation_deadline: PositiveFloat | None = Field(default=None)
+
+    # Facts prefetching settings (applicable only to `FactsGenerationStrategy.GENERATIVE_AI`, disabled if depth is 0)
+    facts_prefetch_depth: NonNegativeInt = Field(default=0)
+    facts_prefetch_low_watermark: PositiveInt = Field(default=1)
+    facts_prefetch_concurrency: PositiveInt = Field(default=2)
+    facts_prefetch_batch_size: PositiveInt = Field(default=1)
+
+    # Generated facts cache settings (applicable only to `FactsGenerationStrategy.GENERATIVE_AI`, disabled if
+    # the directory is not set). On AWS Lambda, the cache directory should point to the writable `/tmp` folder
+    facts_cache_dir: str | os.PathLike | None = Field(default=None)
+    facts_cache_ttl: PositiveInt = Field(default=7 * 24 * 60 * 60)
+    facts_cache_max_entries: PositiveInt = Field(default=1024)
+    facts_cache_sets_per_entry: PositiveInt = Field(default=3)
+
+    # Speculative rounds settings. The next round and its quiz card are built in the background while the player
+    # thinks, which requires a long-running event loop (polling mode), so it's not recommended for AWS Lambda
+    speculative_rounds_enabled: bool = Field(default=False)
+    speculative_rounds_memory_limit: PositiveInt = Field(default=32 * 1024 * 1024)
+    speculative_rounds_ttl: PositiveFloat = Field(default=10 * 60.0)
 
     # AWS services and API settings
     aws_access_key: str = Field(...)
     aws_secret_key: str = Field(...)
     aws_fsm_table_name: str = Field(...)
     aws_region: str = Field(...)
+    # Buffers FSM state and data changes of an update and writes them with a single request at the end of the update.
+    # Changes are written after replies are sent, so a failed write is only logged and the player keeps the old state
+    aws_fsm_write_behind: bool = Field(default=False)
+    # Layout of FSM data items. `FsmDataLayout.BINARY` stores data as a single compact binary attribute,
+    # which is compressed with zlib at the compression level (disabled if the level is 0)
+    aws_fsm_data_layout: FsmDataLayout = Field(default=FsmDataLayout.NATIVE)
+    aws_fsm_data_compression_level: int = Field(default=6, ge=0, le=9)
@@ -0,0 +1,180 @@
+import pytest
+from nationguessr.service.cache import (
+    CacheStats,
+    FactsCache,
+    FileIdRegistry,
+    RenderedCardCache,
+)
+
+
+class TestFactsCache:
+    @pytest.fixture(autouse=True)
+    def _facts_cache(self, tmp_path, fake_clock):
+        self._clock = fake_clock
+        self._cache = FactsCache(
+            tmp_path / "generated_facts.sqlite3",
+            ttl=60,
+            max_entries=2,
+            sets_per_entry=2,
+            clock=self._clock,
+        )
+
+        yield
+
+        self._cache.close()
+
+    def test_should_create_missing_cache_directory(self, tmp_path):
+        # arrange
+        db_path = tmp_path / "facts" / "generated_facts.sqlite3"
+
+        # act
+        facts_cache = FactsCache(db_path, ttl=60, max_entries=2)
+        facts_cache.put("AD", "v1", ["A1"])
+        facts_cache.close()
+
+        # assert
+        assert db_path.is_file()
+
+    def test_should_miss_until_entry_holds_all_fact_sets(self):
+        # act
+        first_facts = self._cache.get("AD", "v1")
+        self._cache.put("AD", "v1", ["A1"])
+        second_facts = self._cache.get("AD", "v1")
+        self._cache.put("AD", "v1", ["A2"])
+        third_facts = self._cache.get("AD", "v1")
+
+        # assert
+        assert first_facts is None
+        assert second_facts is None
+        assert third_facts in (["A1"], ["A2"])
+        assert self._cache.stats == CacheStats(hits=1, misses=2, evictions=0)
+
+    def test_should_keep_entries_of_prompt_versions_apart(self):
+        # arrange
+        self._cache.put("AD", "v1", ["A1"])
+        self._cache.put("AD", "v1", ["A2"])
+
+        # act
+        actual_facts = self._cache.get("AD", "v2")
+
+        # assert
+        assert actual_facts is None
+
+    def test_should_expire_fact_sets_after_ttl(self):
+        # arrange
+        self._cache.put("AD", "v1", ["A1"])
+        self._clock.now += 30
+        self._cache.put("AD", "v1", ["A2"])
+
+        # act
+        self._clock.now += 45
+        actual_facts = self._cache.get("AD", "v1")
+
+        # assert
+        assert actual_facts is None
+
+    def test_should_rotate_out_oldest_fact_sets_of_entry(self):
+        # arrange
+        for i in range(3):
+            self._clock.now += 1
+            self._cache.put("AD", "v1", [f"A{i}"])
+
+        # act
+        actual_facts = {tuple(self._cache.get("AD", "v1")) for _ in range(20)}
+
+        # assert
+        assert actual_facts <= {("A1",), ("A2",)}
+
+    def test_should_evict_least_recently_used_entries(self):
+        # arrange
+        for country_code in ("AD", "BA"):
+            self._clock.now += 1
+            self._cache.put(country_code, "v1", [f"{country_code}1"])
+            self._cache.put(country_code, "v1", [f"{country_code}2"])
+
+        self._clock.now += 1
+        self._cache.get("AD", "v1")
+
+        # act
+        self._clock.now += 1
+        self._cache.put("ZW", "v1", ["ZW1"])
+
+        # assert
+        assert self._cache.get("AD", "v1") is not None
+        assert self._cache.get("BA", "v1") is None
+        assert self._cache.stats.evictions == 1
+
+
+class TestRenderedCardCache:
+    def test_should_build_same_key_for_same_render_inputs(self):
+        # act
+        first_key = RenderedCardCache.key("game_over_card", 1, {"b": 2, "a": 1})
+        second_key = RenderedCardCache.key("game_over_card", 1, {"a": 1, "b": 2})
+        other_key = RenderedCardCache.key("game_over_card", 2, {"a": 1, "b": 2})
+
+        # assert
+        assert first_key == second_key
+        assert first_key != other_key
+
+    def test_should_evict_least_recently_used_cards_above_memory_limit(self):
+        # arrange
+        card_cache = RenderedCardCache(memory_limit=8)
+        card_cache.put("first", b"1111")
+        card_cache.put("second", b"2222")
+        card_cache.get("first")
+
+        # act
+        card_cache.put("third", b"3333")
+
+        # assert
+        assert card_cache.get("second") is None
+        assert card_cache.get("first") == b"1111"
+        assert card_cache.get("third") == b"3333"
+        assert card_cache.memory_stats == CacheStats(hits=3, misses=1, evictions=1)
+
+    def test_should_promote_card_from_disk_to_memory(self, tmp_path):
+        # arrange
+        RenderedCardCache(memory_limit=8, disk_dir=tmp_path).put("first", b"1111")
+        card_cache = RenderedCardCache(memory_limit=8, disk_dir=tmp_path)
+
+        # act
+        first_card = card_cache.get("first")
+        second_card = card_cache.get("first")
+
+        # assert
+        assert first_card == second_card == b"1111"
+        assert card_cache.memory_stats == CacheStats(hits=1, misses=1, evictions=0)
+        assert card_cache.disk_stats == CacheStats(hits=1, misses=0, evictions=0)
+
+    def test_should_evict_least_recently_used_cards_above_disk_limit(self, tmp_path):
+        # arrange
+        card_cache = RenderedCardCache(
+            memory_limit=0, disk_dir=tmp_path, disk_max_entries=1
+        )
+        card_cache.put("first", b"1111")
+
+        # act
+        card_cache.put("second", b"2222")
+
+        # assert
+        assert card_cache.get("first") is None
+        assert card_cache.get("second") == b"2222"
+        assert card_cache.disk_stats == CacheStats(hits=1, misses=1, evictions=1)
+        assert len(list(tmp_path.iterdir())) == 1
+
+
+class TestFileIdRegistry:
+    def test_should_evict_least_recently_used_file_ids(self):
+        # arrange
+        file_id_registry = FileIdRegistry(max_entries=2)
+        file_id_registry.put("first", "first-id")
+        file_id_registry.put("second", "second-id")
+        file_id_registry.get("first")
+
+        # act
+        file_id_registry.put("third", "third-id")
+
+        # assert
+        assert file_id_registry.get("second") is None
+        assert file_id_registry.get("first") == "first-id"
+        assert file_id_registry.stats == CacheStats(hits=2, misses=1, evictions=1)
@@ -0,0 +1,48 @@
+import pytest
+from nationguessr.service.catalog import CountryCatalog
+
+
+class TestCountryCatalog:
+    @pytest.fixture(autouse=True)
+    def _countries_csv_path(self, tmp_path):
+        self._csv_path = tmp_path / "countries.csv"
+        self._csv_path.write_text(
+            '1,AD,Andorra\r\n2,BA,"Bosnia and Herzegovina"\r\n3,ZW,Zimbabwe'
+        )
+
+    def test_should_read_all_rows_if_last_row_has_no_line_break(self):
+        # act
+        catalog = CountryCatalog.from_csv(self._csv_path)
+
+        # assert
+        assert len(catalog) == 3
+        assert catalog.codes == ("AD", "BA", "ZW")
+        assert catalog.names == ("Andorra", "Bosnia and Herzegovina", "Zimbabwe")
+
+    def test_should_look_up_country_name_by_code(self):
+        # arrange
+        catalog = CountryCatalog.from_csv(self._csv_path)
+
+        # act
+        actual_name = catalog.name("BA")
+
+        # assert
+        assert actual_name == "Bosnia and Herzegovina"
+        assert catalog.index("ZW") == 2
+        assert catalog.name_index("Bosnia and Herzegovina") == 1
+
+    def test_should_raise_key_error_if_country_code_is_unknown(self):
+        catalog = CountryCatalog.from_csv(self._csv_path)
+
+        with pytest.raises(KeyError):
+            catalog.name("XX")
+
+    def test_should_select_countries_by_indices(self):
+        # arrange
+        catalog = CountryCatalog.from_csv(self._csv_path)
+
+        # act
+        actual_countries = catalog.countries([2, 0])
+
+        # assert
+        assert actual_countries == [("ZW", "Zimbabwe"), ("AD", "Andorra")]
@@ -0,0 +1,119 @@
+import json
+import zlib
+
+import pytest
+from nationguessr.service.catalog import CountryCatalog
+from nationguessr.service.fsm.codec import (
+    CODEC_VERSION,
+    COMPRESSED_FLAG,
+    JSON_LAYOUT,
+    SESSION_LAYOUT,
+    SessionCodec,
+)
+
+
+class TestSessionCodec:
+    @pytest.fixture(autouse=True)
+    def _codec(self):
+        self._catalog = CountryCatalog(
+            [("AD", "Andorra"), ("BA", "Bosnia and Herzegovina"), ("ZW", "Zimbabwe")]
+        )
+        self._codec = SessionCodec(self._catalog)
+        self._session_data = {
+            "score_board": {12: "05/03/2024", 7: "29/02/2024"},
+            "lives_remained": 2,
+            "current_score": 3,
+            "options": ["Zimbabwe", "Andorra", "Bosnia and Herzegovina"],
+            "correct_option": "Andorra",
+        }
+
+    def test_should_pack_game_session_into_struct_layout(self):
+        # act
+        payload = self._codec.encode(self._session_data)
+
+        # assert
+        assert payload[0] == CODEC_VERSION
+        assert payload[1] == SESSION_LAYOUT
+        assert len(payload) == 2 + 8 + 3 * 2 + 1 + 2 * 6
+        assert self._codec.decode(payload) == self._session_data
+
+    def test_should_decode_options_after_catalog_is_reordered(self):
+        # arrange
+        payload = self._codec.encode(self._session_data)
+        reordered_codec = SessionCodec(
+            CountryCatalog(
+                [
+                    ("AA", "Atlantis"),
+                    ("ZW", "Zimbabwe"),
+                    ("BA", "Bosnia and Herzegovina"),
+                    ("AD", "Andorra"),
+                ]
+            )
+        )
+
+        # act
+        actual_data = reordered_codec.decode(payload)
+
+        # assert
+        assert actual_data == self._session_data
+
+    def test_should_raise_value_error_if_option_is_not_in_catalog(self):
+        # arrange
+        payload = self._codec.encode(self._session_data)
+        reduced_codec = SessionCodec(CountryCatalog([("AD", "Andorra")]))
+
+        # act & assert
+        with pytest.raises(ValueError):
+            reduced_codec.decode(payload)
+
+    def test_should_fall_back_to_json_layout_if_data_is_not_a_game_session(self):
+        # arrange
+        unknown_option_data = {**self._session_data, "options": ["Atlantis"]}
+        unknown_option_data["correct_option"] = "Atlantis"
+        extra_field_data = {**self._session_data, "theme": "dark"}
+        string_score_data = {**self._session_data, "score_board": {"1": "01/01/2024"}}
+        score_date_data = {**self._session_data, "score_board": {1: "1/1/2024"}}
+
+        for data in (
+            unknown_option_data,
+            extra_field_data,
+            string_score_data,
+            score_date_data,
+            {},
+        ):
+            # act
+            payload = self._codec.encode(data)
+
+            # assert
+            assert payload[1] & ~COMPRESSED_FLAG == JSON_LAYOUT
+            assert self._codec.decode(payload) == json.loads(json.dumps(data))
+
+    def test_should_compress_body_only_if_it_gets_smaller(self):
+        # arrange
+        repetitive_data = {"facts": ["The same fact about the country"] * 20}
+
+        # act
+        compressed_payload = self._codec.encode(repetitive_data)
+        session_payload = self._codec.encode(self._session_data)
+
+        # assert
+        assert compressed_payload[1] == JSON_LAYOUT | COMPRESSED_FLAG
+        assert self._codec.decode(compressed_payload) == repetitive_data
+        assert not session_payload[1] & COMPRESSED_FLAG
+
+    def test_should_raise_value_error_if_payload_is_corrupted(self):
+        # arrange
+        payload = self._codec.encode(self._session_data)
+
+        # act & assert
+        with pytest.raises(ValueError):
+            self._codec.decode(bytes([CODEC_VERSION + 1]) + payload[1:])
+
+        with pytest.raises(ValueError):
+            self._codec.decode(payload[:-3])
+
+        with pytest.raises(ValueError):
+            self._codec.decode(
+                bytes([CODEC_VERSION, JSON_LAYOUT | COMPRESSED_FLAG])
+                + zlib.compress(b"{}")[:-1]
+            )
@@ -0,0 +1,126 @@
+import zipfile
+
+import pytest
+from nationguessr.service.corpus import FactsCorpus, load_facts_corpus
+
+
+@pytest.fixture
+def facts_zip_path(tmp_path):
+    zip_path = tmp_path / "country_facts.zip"
+
+    with zipfile.ZipFile(zip_path, "w") as facts_zip:
+        facts_zip.writestr(
+            "AD.csv",
+            '1,culture|history,"Fact A1, with a comma"\n'
+            "2,nature,Fact A2\n"
+            "3,culture|travel,Fact A3\n",
+        )
+        facts_zip.writestr("ZW.csv", "1,nature|wildlife,Fact Z1\n")
+
+    return zip_path
+
+
+class TestFactsCorpus:
+    def test_should_parse_all_country_files_from_archive(self, facts_zip_path):
+        # arrange
+        expected_country_codes = ["AD", "ZW"]
+
+        # act
+        corpus = FactsCorpus.from_zip(facts_zip_path)
+
+        # assert
+        assert sorted(corpus.country_codes) == expected_country_codes
+        assert corpus.facts_num("AD") == 3
+        assert corpus.facts_num("ZW") == 1
+
+    def test_should_sample_unique_facts_of_selected_country(self, facts_zip_path):
+        # arrange
+        corpus = FactsCorpus.from_zip(facts_zip_path)
+        expected_facts = {"Fact A1, with a comma", "Fact A2", "Fact A3"}
+
+        # act
+        actual_facts = corpus.sample("AD", 2)
+
+        # assert
+        assert len(actual_facts) == 2
+        assert len(set(actual_facts)) == 2
+        assert set(actual_facts) <= expected_facts
+
+    def test_should_sample_all_facts_if_country_has_fewer_than_requested(
+        self, facts_zip_path
+    ):
+        # arrange
+        corpus = FactsCorpus.from_zip(facts_zip_path)
+
+        # act
+        actual_facts = corpus.sample("ZW", 5)
+
+        # assert
+        assert actual_facts == ["Fact Z1"]
+
+    def test_should_raise_key_error_if_country_is_unknown(self, facts_zip_path):
+        corpus = FactsCorpus.from_zip(facts_zip_path)
+
+        with pytest.raises(KeyError):
+            corpus.sample("XX", 1)
+
+    def test_should_load_corpus_once_per_process(self, facts_zip_path):
+        # act
+        first_corpus = load_facts_corpus(facts_zip_path)
+        second_corpus = load_facts_corpus(str(facts_zip_path))
+
+        # assert
+        assert first_corpus is second_corpus
+
+
+class TestFactsCorpusBalancedSampling:
+    @pytest.fixture(autouse=True)
+    def _corpus(self):
+        self._corpus = FactsCorpus(
+            facts={"AD": ("C1", "C2", "C3", "H1", "N1")},
+            categories={
+                "AD": {
+                    "culture": (0, 1, 2),
+                    "history": (2, 3),
+                    "nature": (4,),
+                }
+            },
+        )
+
+    def test_should_build_categories_index_from_archive(self, facts_zip_path):
+        # act
+        corpus = FactsCorpus.from_zip(facts_zip_path)
+
+        # assert
+        assert sorted(corpus.categories("AD")) == [
+            "culture",
+            "history",
+            "nature",
+            "travel",
+        ]
+        assert corpus.categories("ZW") == ["nature", "wildlife"]
+
+    def test_should_pick_facts_from_every_category_first(self):
+        # act
+        actual_facts = self._corpus.sample_balanced("AD", 3)
+
+        # assert
+        assert len(set(actual_facts)) == 3
+        assert "N1" in actual_facts
+        assert {"H1", "C3"} & set(actual_facts)
+
+    def test_should_select_unique_facts_if_all_facts_requested(self):
+        # act
+        actual_facts = self._corpus.sample_balanced("AD", 10)
+
+        # assert
+        assert sorted(actual_facts) == ["C1", "C2", "C3", "H1", "N1"]
+
+    def test_should_limit_facts_to_selected_categories(self):
+        # act
+        actual_facts = self._corpus.sample_balanced(
+            "AD", 5, categories=["History", "unknown"]
+        )
+
+        # assert
+        assert sorted(actual_facts) == ["C3", "H1"]
@@ -0,0 +1,64 @@
+import io
+
+import pytest
+from nationguessr.service.encoding import EncodingProfile
+from nationguessr.settings import CardEncodingFormat
+from PIL import Image
+
+
+class TestEncodingProfile:
+    @pytest.fixture(autouse=True)
+    def _card_image(self, tmp_path):
+        self._template_path = tmp_path / "template.png"
+        self._card_image = Image.new("RGBA", (32, 32), (66, 68, 110, 255))
+        self._card_image.paste((255, 255, 255, 255), (16, 0, 32, 32))
+        self._card_image.paste((0, 0, 0, 0), (0, 0, 8, 8))
+        self._card_image.save(self._template_path)
+
+    @pytest.mark.parametrize(
+        "encoding_format, expected_format, expected_extension",
+        [
+            (CardEncodingFormat.PNG, "PNG", "png"),
+            (CardEncodingFormat.PNG_PALETTE, "PNG", "png"),
+            (CardEncodingFormat.JPEG, "JPEG", "jpg"),
+            (CardEncodingFormat.WEBP, "WEBP", "webp"),
+        ],
+    )
+    def test_should_encode_image_in_selected_format(
+        self, encoding_format, expected_format, expected_extension
+    ):
+        # arrange
+        profile = EncodingProfile(encoding_format)
+
+        # act
+        encoded_image = Image.open(io.BytesIO(profile.encode(self._card_image)))
+
+        # assert
+        assert encoded_image.format == expected_format
+        assert encoded_image.size == self._card_image.size
+        assert profile.extension == expected_extension
+
+    def test_should_quantize_image_to_template_palette_keeping_transparency(self):
+        # arrange
+        profile = EncodingProfile(CardEncodingFormat.PNG_PALETTE)
+
+        # act
+        encoded_image = Image.open(
+            io.BytesIO(profile.encode(self._card_image, [self._template_path]))
+        )
+
+        # assert
+        assert encoded_image.mode == "P"
+        assert encoded_image.convert("RGBA").getpixel((0, 0))[3] == 0
+        assert encoded_image.convert("RGBA").getpixel((8, 8)) == (66, 68, 110, 255)
+
+    def test_should_flatten_transparent_pixels_on_white_for_jpeg(self):
+        # arrange
+        profile = EncodingProfile(CardEncodingFormat.JPEG, quality=100)
+
+        # act
+        encoded_image = Image.open(io.BytesIO(profile.encode(self._card_image)))
+
+        # assert
+        assert encoded_image.mode == "RGB"
+        assert min(encoded_image.getpixel((2, 2))) > 200
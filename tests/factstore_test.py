@@ -0,0 +1,76 @@
+import zipfile
+
+import pytest
+from nationguessr.service.factstore import (
+    FactStore,
+    FactStoreException,
+    compile_fact_store,
+)
+
+
+@pytest.fixture
+def fact_store_path(tmp_path):
+    zip_path = tmp_path / "country_facts.zip"
+    store_path = tmp_path / "country_facts.bin"
+
+    with zipfile.ZipFile(zip_path, "w") as facts_zip:
+        facts_zip.writestr("ZW.csv", "1,nature|wildlife,Fact Z1\n")
+        facts_zip.writestr(
+            "AD.csv",
+            '1,culture|history,"Fact A1, with a comma"\n'
+            "2,nature,Fäct Â2\n"
+            "3,culture|travel,Fact A3\n",
+        )
+
+    compile_fact_store(zip_path, store_path)
+
+    return store_path
+
+
+class TestFactStore:
+    def test_should_read_country_table_of_compiled_store(self, fact_store_path):
+        # act
+        store = FactStore(fact_store_path)
+
+        # assert
+        assert store.country_codes == ["AD", "ZW"]
+        assert store.facts_num("AD") == 3
+        assert store.facts_num("ZW") == 1
+
+    def test_should_slice_encoded_facts_from_compiled_store(self, fact_store_path):
+        # arrange
+        store = FactStore(fact_store_path)
+
+        # act
+        actual_facts = [
+            str(store.fact_view("AD", index), "utf-8") for index in range(3)
+        ]
+
+        # assert
+        assert actual_facts == ["Fact A1, with a comma", "Fäct Â2", "Fact A3"]
+        assert str(store.fact_view("ZW", 0), "utf-8") == "Fact Z1"
+
+    def test_should_raise_index_error_if_fact_index_is_out_of_range(
+        self, fact_store_path
+    ):
+        store = FactStore(fact_store_path)
+
+        with pytest.raises(IndexError):
+            store.fact_view("ZW", 1)
+
+    def test_should_sample_unique_facts_of_selected_country(self, fact_store_path):
+        # arrange
+        store = FactStore(fact_store_path)
+
+        # act
+        actual_facts = store.sample("AD", 5)
+
+        # assert
+        assert sorted(actual_facts) == ["Fact A1, with a comma", "Fact A3", "Fäct Â2"]
+
+    def test_should_raise_exception_if_store_format_is_unsupported(self, tmp_path):
+        store_path = tmp_path / "country_facts.bin"
+        store_path.write_bytes(b"PK\x03\x04" + bytes(12))
+
+        with pytest.raises(FactStoreException):
+            FactStore(store_path)
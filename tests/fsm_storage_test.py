@@ -0,0 +1,369 @@
+import asyncio
+import base64
+import json
+
+import pytest
+from aiogram.fsm.storage.base import StorageKey
+from nationguessr.service.catalog import CountryCatalog
+from nationguessr.service.fsm.codec import SessionCodec
+from nationguessr.service.fsm.storage import DynamoDBStorage, FsmStorageException
+
+
+class TestDynamoDBStorageItemScope:
+    @pytest.fixture(autouse=True)
+    def _storage(self, mocker):
+        self._storage = DynamoDBStorage("access-key", "secret-key", "fsm-table")
+        self._key = StorageKey(bot_id=1, chat_id=2, user_id=3)
+        self._item = {
+            "state_value": {"S": "BotState:playing_guess_facts"},
+            "data_value": {"M": {"score": {"S": "3"}}},
+        }
+
+        async def request_table(amz_target, request_parameters):
+            if amz_target.endswith("GetItem"):
+                return json.dumps({"Item": self._item})
+
+            return "{}"
+
+        self._request_table = mocker.patch.object(
+            self._storage, "_request_table", side_effect=request_table
+        )
+
+    def _requested_targets(self):
+        return [call.args[0] for call in self._request_table.call_args_list]
+
+    @pytest.mark.asyncio
+    async def test_should_fetch_item_once_per_scope(self):
+        # act
+        async with self._storage.item_scope():
+            state = await self._storage.get_state(self._key)
+            data = await self._storage.get_data(self._key)
+            updated_data = await self._storage.update_data(self._key, {"lives": 2})
+
+        # assert
+        assert state == "BotState:playing_guess_facts"
+        assert data == {"score": 3}
+        assert updated_data == {"score": 3, "lives": 2}
+        assert self._requested_targets() == [
+            "DynamoDB_20120810.GetItem",
+            "DynamoDB_20120810.UpdateItem",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_should_serve_written_values_within_scope(self):
+        # act
+        async with self._storage.item_scope():
+            await self._storage.get_state(self._key)
+            await self._storage.set_state(self._key, None)
+            await self._storage.set_data(self._key, {"score": 4})
+            state = await self._storage.get_state(self._key)
+            data = await self._storage.get_data(self._key)
+
+        # assert
+        assert state is None
+        assert data == {"score": 4}
+        assert self._requested_targets().count("DynamoDB_20120810.GetItem") == 1
+
+    @pytest.mark.asyncio
+    async def test_should_fetch_item_again_after_failed_write(self):
+        # arrange
+        async with self._storage.item_scope():
+            await self._storage.get_data(self._key)
+            self._request_table.side_effect = FsmStorageException("Failed", 500)
+
+            # act
+            with pytest.raises(FsmStorageException):
+                await self._storage.set_data(self._key, {"score": 4})
+
+            self._request_table.side_effect = None
+            self._request_table.return_value = json.dumps({"Item": self._item})
+            data = await self._storage.get_data(self._key)
+
+        # assert
+        assert data == {"score": 3}
+        assert self._requested_targets().count("DynamoDB_20120810.GetItem") == 2
+
+    @pytest.mark.asyncio
+    async def test_should_fetch_item_on_every_read_outside_scope(self):
+        # act
+        await self._storage.get_state(self._key)
+        await self._storage.get_data(self._key)
+
+        # assert
+        assert self._requested_targets() == [
+            "DynamoDB_20120810.GetItem",
+            "DynamoDB_20120810.GetItem",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_should_create_empty_item_once_if_item_is_missing(self):
+        # arrange
+        self._request_table.side_effect = None
+        self._request_table.return_value = "{}"
+
+        # act
+        async with self._storage.item_scope():
+            state = await self._storage.get_state(self._key)
+            data = await self._storage.get_data(self._key)
+
+        # assert
+        assert state is None
+        assert data == {}
+        assert self._requested_targets() == [
+            "DynamoDB_20120810.GetItem",
+            "DynamoDB_20120810.PutItem",
+        ]
+
+
+class TestDynamoDBStorageWriteBehind:
+    @pytest.fixture(autouse=True)
+    def _storage(self, mocker):
+        self._storage = DynamoDBStorage(
+            "access-key", "secret-key", "fsm-table", write_behind=True
+        )
+        self._key = StorageKey(bot_id=1, chat_id=2, user_id=3)
+        self._request_table = mocker.patch.object(
+            self._storage,
+            "_request_table",
+            return_value=json.dumps(
+                {
+                    "Item": {
+                        "state_value": {"NULL": True},
+                        "data_value": {"M": {"score": {"S": "3"}}},
+                    }
+                }
+            ),
+        )
+
+    def _requested_updates(self):
+        return [
+            json.loads(call.args[1])
+            for call in self._request_table.call_args_list
+            if call.args[0] == "DynamoDB_20120810.UpdateItem"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_should_flush_state_and_data_with_single_update(self):
+        # act
+        async with self._storage.item_scope():
+            await self._storage.set_state(self._key, "BotState:select_game")
+            await self._storage.update_data(self._key, {"lives": 2})
+
+            updates_in_scope = self._requested_updates()
+
+        # assert
+        updates = self._requested_updates()
+
+        assert updates_in_scope == []
+        assert len(updates) == 1
+        assert (
+            updates[0]["UpdateExpression"]
+            == "set state_value = :val1, data_value = :val2, data_version = :val3"
+        )
+        assert updates[0]["ExpressionAttributeValues"] == {
+            ":val1": {"S": "BotState:select_game"},
+            ":val2": {"M": {"score": {"N": "3"}, "lives": {"N": "2"}}},
+            ":val3": {"N": "2"},
+        }
+
+    @pytest.mark.asyncio
+    async def test_should_read_buffered_changes_within_scope(self):
+        # act
+        async with self._storage.item_scope():
+            await self._storage.set_state(self._key, "BotState:select_game")
+            state = await self._storage.get_state(self._key)
+
+        # assert
+        assert state == "BotState:select_game"
+
+    @pytest.mark.asyncio
+    async def test_should_flush_changes_if_scope_fails(self):
+        # act
+        with pytest.raises(RuntimeError):
+            async with self._storage.item_scope():
+                await self._storage.set_state(self._key, None)
+                raise RuntimeError
+
+        # assert
+        assert len(self._requested_updates()) == 1
+
+    @pytest.mark.asyncio
+    async def test_should_log_failed_flush_instead_of_raising(self, caplog):
+        # arrange
+        self._request_table.side_effect = FsmStorageException("Failed", 500)
+
+        # act
+        async with self._storage.item_scope():
+            await self._storage.set_state(self._key, None)
+
+        # assert
+        assert "Failed to flush buffered changes" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_should_log_and_reraise_cancelled_flush(self, caplog):
+        # arrange
+        self._request_table.side_effect = asyncio.CancelledError
+
+        # act
+        with pytest.raises(asyncio.CancelledError):
+            async with self._storage.item_scope():
+                await self._storage.set_state(self._key, None)
+
+        # assert
+        assert "Failed to flush buffered changes" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_should_write_immediately_outside_scope(self):
+        # act
+        await self._storage.set_state(self._key, None)
+        await self._storage.set_data(self._key, {})
+
+        # assert
+        assert len(self._requested_updates()) == 2
+
+
+class TestDynamoDBStorageDataMarshalling:
+    @pytest.fixture(autouse=True)
+    def _storage(self, mocker):
+        self._storage = DynamoDBStorage("access-key", "secret-key", "fsm-table")
+        self._key = StorageKey(bot_id=1, chat_id=2, user_id=3)
+        self._request_table = mocker.patch.object(self._storage, "_request_table")
+
+    def _return_item(self, item):
+        self._request_table.return_value = json.dumps({"Item": item})
+
+    @pytest.mark.asyncio
+    async def test_should_read_data_written_as_json_strings(self):
+        # arrange
+        self._return_item(
+            {
+                "state_value": {"NULL": True},
+                "data_value": {
+                    "M": {
+                        "score_board": {"S": '{"3": "2024-01-01 12:00"}'},
+                        "options": {"S": '["Andorra", "Zimbabwe"]'},
+                    }
+                },
+            }
+        )
+
+        # act
+        data = await self._storage.get_data(self._key)
+
+        # assert
+        assert data == {
+            "score_board": {"3": "2024-01-01 12:00"},
+            "options": ["Andorra", "Zimbabwe"],
+        }
+
+    @pytest.mark.asyncio
+    async def test_should_write_and_read_native_attribute_values(self):
+        # arrange
+        data = {"score_board": {"3": "2024-01-01 12:00"}, "lives_remained": 2}
+        self._request_table.return_value = "{}"
+
+        # act
+        await self._storage.set_data(self._key, data)
+
+        update = json.loads(self._request_table.call_args.args[1])
+        self._return_item(
+            {
+                "state_value": {"NULL": True},
+                "data_value": update["ExpressionAttributeValues"][":val1"],
+                "data_version": update["ExpressionAttributeValues"][":val2"],
+            }
+        )
+        actual_data = await self._storage.get_data(self._key)
+
+        # assert
+        assert update["ExpressionAttributeValues"][":val1"] == {
+            "M": {
+                "score_board": {"M": {"3": {"S": "2024-01-01 12:00"}}},
+                "lives_remained": {"N": "2"},
+            }
+        }
+        assert actual_data == data
+
+    @pytest.mark.asyncio
+    async def test_should_raise_exception_if_data_version_is_unknown(self):
+        # arrange
+        self._return_item(
+            {
+                "state_value": {"NULL": True},
+                "data_value": {"M": {}},
+                "data_version": {"N": "99"},
+            }
+        )
+
+        # act & assert
+        with pytest.raises(FsmStorageException):
+            await self._storage.get_data(self._key)
+
+    @pytest.mark.asyncio
+    async def test_should_write_and_read_binary_data(self, mocker):
+        # arrange
+        storage = DynamoDBStorage(
+            "access-key",
+            "secret-key",
+            "fsm-table",
+            data_codec=SessionCodec(CountryCatalog([("AD", "Andorra")])),
+            binary_data=True,
+        )
+        request_table = mocker.patch.object(storage, "_request_table")
+        data = {
+            "score_board": {},
+            "lives_remained": 3,
+            "current_score": 0,
+            "options": ["Andorra"],
+            "correct_option": "Andorra",
+        }
+        request_table.return_value = "{}"
+
+        # act
+        await storage.set_data(self._key, data)
+
+        update = json.loads(request_table.call_args.args[1])
+        request_table.return_value = json.dumps(
+            {
+                "Item": {
+                    "state_value": {"NULL": True},
+                    "data_value": update["ExpressionAttributeValues"][":val1"],
+                    "data_version": update["ExpressionAttributeValues"][":val2"],
+                }
+            }
+        )
+        actual_data = await storage.get_data(self._key)
+
+        # assert
+        assert "B" in update["ExpressionAttributeValues"][":val1"]
+        assert update["ExpressionAttributeValues"][":val2"] == {"N": "3"}
+        assert actual_data == data
+
+    @pytest.mark.asyncio
+    async def test_should_read_binary_data_if_native_layout_is_selected(self):
+        # arrange
+        data_codec = SessionCodec(CountryCatalog([("AD", "Andorra")]))
+        storage = DynamoDBStorage(
+            "access-key", "secret-key", "fsm-table", data_codec=data_codec
+        )
+        storage._request_table = self._request_table
+        data = {"score_board": {}, "lives_remained": 3}
+        self._return_item(
+            {
+                "state_value": {"NULL": True},
+                "data_value": {
+                    "B": base64.b64encode(data_codec.encode(data)).decode("ascii")
+                },
+                "data_version": {"N": "3"},
+            }
+        )
+
+        # act
+        actual_data = await storage.get_data(self._key)
+        await storage.set_data(self._key, actual_data)
+
+        # assert
+        update = json.loads(self._request_table.call_args.args[1])
+
+        assert actual_data == data
+        assert update["ExpressionAttributeValues"][":val2"] == {"N": "2"}
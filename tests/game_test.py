@@ -1,9 +1,23 @@
+import asyncio
+import os
+from typing import List
+
 import pytest
 from nationguessr.data.game import GameSession
-from nationguessr.service.game import number_as_character, record_new_score
+from nationguessr.service.game import (
+    FactGenerationStrategy,
+    GuessingFactsGameService,
+    number_as_character,
+    record_new_score,
+)
 from nationguessr.settings import Settings
 
 
+class CountryCodeStrategy(FactGenerationStrategy):
+    async def generate_facts(self, country_code: str) -> List[str]:
+        return [country_code]
+
+
 class TestNumberAsCharacter:
     def test_should_raise_value_error_if_input_integer_is_negative(self):
         with pytest.raises(ValueError):
@@ -170,3 +184,113 @@ class TestRecordNewScore:
 
         # assert
         assert list(new_game_session.score_board.keys()) == expected_recorded_scores
+
+
+class TestGuessingFactsGameServiceSpeculativeRounds:
+    @pytest.fixture(autouse=True)
+    def _facts_game_service(self, fake_clock):
+        self._clock = fake_clock
+        self._settings = Settings(
+            assets_folder=os.path.join(
+                os.path.dirname(__file__), "..", "src", "assets"
+            ),
+            speculative_rounds_enabled=True,
+            speculative_rounds_memory_limit=64,
+            speculative_rounds_ttl=60,
+            token="",
+            aws_access_key="",
+            aws_secret_key="",
+            aws_fsm_table_name="",
+            aws_region="",
+        )
+        self._service = GuessingFactsGameService(
+            CountryCodeStrategy(), self._settings, clock=self._clock
+        )
+        self._game_session = GameSession(
+            score_board={},
+            lives_remained=3,
+            current_score=7,
+            options=[],
+            correct_option="",
+        )
+
+    @staticmethod
+    async def _render_card(game_round, game_sessions) -> List[bytes]:
+        return [
+            f"{session.current_score}:{session.lives_remained}".encode().ljust(16)
+            for session in game_sessions
+        ]
+
+    @pytest.mark.asyncio
+    async def test_should_render_next_round_card_for_both_answer_outcomes(self):
+        # arrange
+        self._service.schedule_next_round("chat", self._game_session, self._render_card)
+        self._game_session.lives_remained -= 1
+
+        # act
+        game_round, card = await self._service.take_next_round(
+            "chat", self._game_session
+        )
+
+        # assert
+        assert game_round.correct_option in game_round.options
+        assert card.strip() == b"7:2"
+        assert await self._service.take_next_round("chat", self._game_session) is None
+
+    @pytest.mark.asyncio
+    async def test_should_skip_wrong_answer_card_if_it_ends_the_game(self):
+        # arrange
+        self._game_session.lives_remained = 1
+        self._service.schedule_next_round("chat", self._game_session, self._render_card)
+        await asyncio.sleep(0)
+
+        # act
+        _, card = await self._service.take_next_round(
+            "chat", self._game_session.model_copy(update={"lives_remained": 0})
+        )
+
+        # assert
+        assert card is None
+
+    @pytest.mark.asyncio
+    async def test_should_discard_next_round_after_expiration(self):
+        # arrange
+        self._service.schedule_next_round("chat", self._game_session, self._render_card)
+        self._clock.now += 61
+
+        # act
+        next_round = await self._service.take_next_round("chat", self._game_session)
+
+        # assert
+        assert next_round is None
+
+    @pytest.mark.asyncio
+    async def test_should_evict_oldest_rounds_above_memory_budget(self):
+        # arrange
+        for chat_key in ("first", "second", "third"):
+            self._service.schedule_next_round(
+                chat_key, self._game_session, self._render_card
+            )
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+
+        # act
+        first_round = await self._service.take_next_round("first", self._game_session)
+        third_round = await self._service.take_next_round("third", self._game_session)
+
+        # assert
+        assert first_round is None
+        assert third_round is not None
+        assert self._service.next_rounds_size == 32
+
+    @pytest.mark.asyncio
+    async def test_should_not_schedule_rounds_if_disabled(self):
+        # arrange
+        self._settings.speculative_rounds_enabled = False
+        self._service.schedule_next_round("chat", self._game_session, self._render_card)
+
+        # act
+        next_round = await self._service.take_next_round("chat", self._game_session)
+
+        # assert
+        assert next_round is None
@@ -0,0 +1,324 @@
+import os
+
+import pytest
+from nationguessr.service.image import (
+    ImageAssetCache,
+    ImageEditService,
+    TextTileCache,
+    layout_text,
+    load_font,
+    loaded_font_faces,
+)
+from PIL import Image, ImageDraw
+
+
+class TestImageAssetCache:
+    @pytest.fixture(autouse=True)
+    def _image_path(self, tmp_path):
+        self._image_path = tmp_path / "template.png"
+        Image.new("RGB", (4, 4), (255, 0, 0)).save(self._image_path)
+
+    def test_should_decode_image_once_and_convert_it_to_requested_mode(self, mocker):
+        # arrange
+        asset_cache = ImageAssetCache()
+        open_spy = mocker.spy(Image, "open")
+
+        # act
+        first_image = asset_cache.load(self._image_path)
+        second_image = asset_cache.load(self._image_path)
+
+        # assert
+        assert open_spy.call_count == 1
+        assert first_image.mode == second_image.mode == "RGBA"
+
+    def test_should_return_independent_copies(self):
+        # arrange
+        asset_cache = ImageAssetCache()
+
+        # act
+        first_image = asset_cache.load(self._image_path)
+        first_image.putpixel((0, 0), (0, 0, 0, 0))
+        second_image = asset_cache.load(self._image_path)
+
+        # assert
+        assert second_image.getpixel((0, 0)) == (255, 0, 0, 255)
+
+    def test_should_decode_image_again_if_file_is_modified(self):
+        # arrange
+        asset_cache = ImageAssetCache()
+        asset_cache.load(self._image_path)
+
+        Image.new("RGB", (4, 4), (0, 255, 0)).save(self._image_path)
+        modified_at = os.stat(self._image_path).st_mtime_ns + 1_000_000_000
+        os.utime(self._image_path, ns=(modified_at, modified_at))
+
+        # act
+        actual_image = asset_cache.load(self._image_path)
+
+        # assert
+        assert actual_image.getpixel((0, 0)) == (0, 255, 0, 255)
+
+    def test_should_drop_all_modes_of_invalidated_image(self):
+        # arrange
+        asset_cache = ImageAssetCache()
+        asset_cache.load(self._image_path)
+        asset_cache.load(self._image_path, mode="L")
+
+        # act
+        asset_cache.invalidate(self._image_path)
+
+        # assert
+        assert len(asset_cache) == 0
+
+
+class TestLoadFont:
+    @pytest.fixture(autouse=True)
+    def _font_path(self):
+        self._font_path = os.path.join(
+            os.path.dirname(__file__),
+            "..",
+            "src",
+            "assets",
+            "fonts",
+            "Poppins-ExtraBold.ttf",
+        )
+
+    def test_should_share_font_face_of_the_same_size(self):
+        # act
+        first_font = load_font(self._font_path, 28)
+        second_font = load_font(os.path.abspath(self._font_path), 28)
+
+        # assert
+        assert first_font is second_font
+        assert first_font.size == 28
+
+    def test_should_count_loaded_font_faces_per_size(self):
+        # arrange
+        load_font(self._font_path, 28)
+        initial_faces = loaded_font_faces()
+
+        # act
+        load_font(self._font_path, 28)
+        load_font(self._font_path, 29)
+
+        # assert
+        assert loaded_font_faces() == initial_faces + 1
+
+
+class TestLayeredComposition:
+    @pytest.fixture(autouse=True)
+    def _image_edit_service(self):
+        self._assets_folder = os.path.join(
+            os.path.dirname(__file__), "..", "src", "assets"
+        )
+        self._font_path = os.path.join(
+            self._assets_folder, "fonts", "Poppins-ExtraBold.ttf"
+        )
+        self._image_edit_service = ImageEditService(self._font_path, (66, 68, 110))
+
+    def test_should_blit_glyphs_identically_to_drawn_text(self):
+        # arrange
+        expected_image = Image.new("RGBA", (400, 100), (255, 255, 255, 255))
+        ImageDraw.Draw(expected_image).text(
+            (13, 7), "01289", font=load_font(self._font_path, 64), fill=(66, 68, 110)
+        )
+
+        # act
+        actual_image = self._image_edit_service.add_glyph_text(
+            Image.new("RGBA", (400, 100), (255, 255, 255, 255)),
+            "01289",
+            text_size=64,
+            position=(13, 7),
+        )
+
+        # assert
+        assert actual_image.tobytes() == expected_image.tobytes()
+
+    def test_should_blit_icon_strip_identically_to_single_icons(self):
+        # arrange
+        heart_icon_path = os.path.join(self._assets_folder, "icons", "heart.png")
+        heart_icon = Image.open(heart_icon_path).convert("RGBA")
+        expected_image = Image.new("RGBA", (400, 100), (255, 255, 255, 255))
+
+        for i in range(3):
+            expected_image.paste(heart_icon, (10 + i * heart_icon.width, 5), heart_icon)
+
+        # act
+        actual_image = self._image_edit_service.add_icon_strip(
+            Image.new("RGBA", (400, 100), (255, 255, 255, 255)),
+            heart_icon_path,
+            3,
+            position=(10, 5),
+        )
+
+        # assert
+        assert actual_image.tobytes() == expected_image.tobytes()
+
+
+class TestLayoutText:
+    @pytest.fixture(autouse=True)
+    def _font_path(self):
+        self._font_path = os.path.join(
+            os.path.dirname(__file__),
+            "..",
+            "src",
+            "assets",
+            "fonts",
+            "Poppins-ExtraBold.ttf",
+        )
+
+    def test_should_measure_text_block_like_multiline_bounding_box(self):
+        # arrange
+        paragraphs = [
+            "1. A rather long fact about the country, which is wrapped into several lines",
+            "2. A short fact",
+        ]
+        font = load_font(self._font_path, 28)
+        draw = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+
+        # act
+        text_layout = layout_text(self._font_path, 28, 55, paragraphs)
+
+        # assert
+        joined_lines = "\n".join(line.text for line in text_layout.lines)
+        _, _, _, expected_height = draw.multiline_textbbox(
+            (0, 0), joined_lines, font=font
+        )
+
+        assert len(text_layout.lines) == 3
+        assert text_layout.height == expected_height
+        assert text_layout.width == max(
+            draw.textlength(line.text, font=font) for line in text_layout.lines
+        )
+
+    def test_should_center_text_block_on_image(self):
+        # arrange
+        text_layout = layout_text(self._font_path, 28, 55, ["Centered"])
+
+        # act
+        x, y = text_layout.origin((1024, 512), center=True)
+
+        # assert
+        assert x == (1024 - text_layout.width) / 2
+        assert y == (512 - text_layout.height) / 2
+
+    def test_should_reuse_layouts_of_recurring_paragraphs(self):
+        # arrange
+        first_layout = layout_text(self._font_path, 30, 55, ["A", "B"])
+
+        # act
+        second_layout = layout_text(self._font_path, 30, 55, ["B", "A"])
+
+        # assert
+        assert first_layout.lines[0] is second_layout.lines[1]
+        assert first_layout.lines[1] is second_layout.lines[0]
+
+
+class TestTextTileCache:
+    @pytest.fixture(autouse=True)
+    def _font_path(self):
+        self._font_path = os.path.abspath(
+            os.path.join(
+                os.path.dirname(__file__),
+                "..",
+                "src",
+                "assets",
+                "fonts",
+                "Poppins-ExtraBold.ttf",
+            )
+        )
+
+    def test_should_blit_tiles_identically_to_drawn_text(self):
+        # arrange
+        text_tile_cache = TextTileCache(memory_limit=1 << 20)
+        expected_image = Image.new("RGBA", (600, 100), (255, 255, 255, 255))
+        ImageDraw.Draw(expected_image).text(
+            (11, 17),
+            "Quite a tall, jagged line",
+            font=load_font(self._font_path, 28),
+            fill=(66, 68, 110),
+        )
+
+        # act
+        actual_image = text_tile_cache.draw(
+            Image.new("RGBA", (600, 100), (255, 255, 255, 255)),
+            self._font_path,
+            28,
+            "Quite a tall, jagged line",
+            (11, 17),
+            (66, 68, 110),
+        )
+
+        # assert
+        assert actual_image.tobytes() == expected_image.tobytes()
+
+    def test_should_evict_least_recently_used_tiles_above_memory_limit(self):
+        # arrange
+        first_mask, _, _ = TextTileCache(1 << 20).tile(self._font_path, 28, "First")
+        second_mask, _, _ = TextTileCache(1 << 20).tile(self._font_path, 28, "Second")
+        memory_limit = (
+            first_mask.width * first_mask.height
+            + second_mask.width * second_mask.height
+            - 1
+        )
+        text_tile_cache = TextTileCache(memory_limit)
+
+        # act
+        for line in ("First", "Second", "Second", "First"):
+            text_tile_cache.tile(self._font_path, 28, line)
+
+        # assert
+        stats = text_tile_cache.stats
+
+        assert stats.hits == 1
+        assert stats.misses == 3
+        assert stats.evictions == 2
+        assert text_tile_cache.memory_size <= memory_limit
+
+    def test_should_draw_numbered_text_identically_without_tiles_at_whole_pixels(
+        self,
+    ):
+        # arrange
+        paragraphs = [
+            "A rather long fact about the country, which is wrapped into several lines",
+            "A short fact",
+        ]
+        image_edit_service = ImageEditService(
+            self._font_path, (66, 68, 110), text_tiles_memory_limit=1 << 20
+        )
+        expected_image = ImageEditService(
+            self._font_path, (66, 68, 110)
+        ).add_numbered_text(
+            Image.new("RGBA", (1000, 300), (255, 255, 255, 255)),
+            paragraphs,
+            text_size=28,
+            position=(20, 30),
+        )
+
+        # act
+        actual_image = image_edit_service.add_numbered_text(
+            Image.new("RGBA", (1000, 300), (255, 255, 255, 255)),
+            paragraphs,
+            text_size=28,
+            position=(20, 30),
+        )
+
+        # assert
+        assert actual_image.tobytes() == expected_image.tobytes()
+
+    def test_should_stop_warm_up_once_cache_is_full(self):
+        # arrange
+        first_mask, _, _ = TextTileCache(1 << 20).tile(self._font_path, 29, "Fact A")
+        image_edit_service = ImageEditService(
+            self._font_path,
+            (66, 68, 110),
+            text_tiles_memory_limit=first_mask.width * first_mask.height,
+        )
+
+        # act
+        paragraphs_num = image_edit_service.warm_up_text_tiles(
+            ["Fact A", "Fact B", "Fact C"], text_size=29
+        )
+
+        # assert
+        assert paragraphs_num == 1
@@ -0,0 +1,59 @@
+import pytest
+from nationguessr.service.fsm.marshalling import marshal_value, unmarshal_value
+
+
+class TestMarshalValue:
+    def test_should_marshal_values_to_native_attribute_types(self):
+        # arrange
+        value = {
+            "score_board": {3: "2024-01-01 12:00"},
+            "lives_remained": 2,
+            "ratio": 0.5,
+            "options": ["Andorra", "Zimbabwe"],
+            "finished": False,
+            "correct_option": None,
+        }
+
+        # act
+        attribute_value = marshal_value(value)
+
+        # assert
+        assert attribute_value == {
+            "M": {
+                "score_board": {"M": {"3": {"S": "2024-01-01 12:00"}}},
+                "lives_remained": {"N": "2"},
+                "ratio": {"N": "0.5"},
+                "options": {"L": [{"S": "Andorra"}, {"S": "Zimbabwe"}]},
+                "finished": {"BOOL": False},
+                "correct_option": {"NULL": True},
+            }
+        }
+
+    def test_should_unmarshal_marshalled_values(self):
+        # arrange
+        value = {
+            "numbers": [0, -7, 1.25, -1e-07, 10**20],
+            "nested": {"empty": [], "text": ""},
+            "flag": True,
+            "nothing": None,
+        }
+
+        # act
+        actual_value = unmarshal_value(marshal_value(value))
+
+        # assert
+        assert actual_value == value
+        assert isinstance(actual_value["numbers"][0], int)
+        assert isinstance(actual_value["numbers"][2], float)
+
+    def test_should_raise_type_error_if_value_is_unsupported(self):
+        with pytest.raises(TypeError):
+            marshal_value({"options": {"Andorra"}})
+
+    def test_should_raise_value_error_if_number_is_not_finite(self):
+        with pytest.raises(ValueError):
+            marshal_value(float("nan"))
+
+    def test_should_raise_value_error_if_attribute_type_is_unsupported(self):
+        with pytest.raises(ValueError):
+            unmarshal_value({"SS": ["Andorra"]})
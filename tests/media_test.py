@@ -0,0 +1,95 @@
+import datetime
+from typing import List
+
+import pytest
+from aiogram import Bot
+from aiogram.client.session.base import BaseSession
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.methods import SendPhoto
+from aiogram.types import BufferedInputFile, Chat, Message, PhotoSize
+from nationguessr.app.media import send_card
+from nationguessr.service.cache import FileIdRegistry
+
+
+class FakeSession(BaseSession):
+    def __init__(self, stale_file_ids: List[str] | None = None) -> None:
+        super().__init__()
+        self.requests: List[SendPhoto] = []
+        self._stale_file_ids = stale_file_ids or []
+
+    async def make_request(self, bot, method, timeout=None):
+        self.requests.append(method)
+
+        if method.photo in self._stale_file_ids:
+            raise TelegramBadRequest(method, "Bad Request: wrong file identifier")
+
+        file_id = method.photo if isinstance(method.photo, str) else "uploaded-id"
+
+        return Message(
+            message_id=len(self.requests),
+            date=datetime.datetime.now(),
+            chat=Chat(id=method.chat_id, type="private"),
+            photo=[
+                PhotoSize(
+                    file_id="thumb-id", file_unique_id="thumb", width=90, height=90
+                ),
+                PhotoSize(
+                    file_id=file_id, file_unique_id="card", width=1024, height=1024
+                ),
+            ],
+        )
+
+    async def stream_content(self, *args, **kwargs):
+        yield b""
+
+    async def close(self) -> None:
+        pass
+
+
+class TestSendCard:
+    @pytest.fixture(autouse=True)
+    def _card(self):
+        self._card = BufferedInputFile(b"card", filename="game_over_card.png")
+
+    @pytest.mark.asyncio
+    async def test_should_send_registered_file_id_instead_of_uploading(self):
+        # arrange
+        session = FakeSession()
+        bot = Bot("42:TOKEN", session=session)
+        file_id_registry = FileIdRegistry()
+
+        # act
+        for _ in range(2):
+            await send_card(
+                self._card,
+                file_id_registry,
+                lambda photo: bot.send_photo(chat_id=1, photo=photo),
+            )
+
+        # assert
+        assert session.requests[0].photo is self._card
+        assert session.requests[1].photo == "uploaded-id"
+
+    @pytest.mark.asyncio
+    async def test_should_upload_card_again_if_file_id_is_stale(self):
+        # arrange
+        session = FakeSession(stale_file_ids=["stale-id"])
+        bot = Bot("42:TOKEN", session=session)
+        file_id_registry = FileIdRegistry()
+        file_id_registry.put(FileIdRegistry.content_hash(b"card"), "stale-id")
+
+        # act
+        await send_card(
+            self._card,
+            file_id_registry,
+            lambda photo: bot.send_photo(chat_id=1, photo=photo),
+        )
+
+        # assert
+        assert [request.photo for request in session.requests] == [
+            "stale-id",
+            self._card,
+        ]
+        assert (
+            file_id_registry.get(FileIdRegistry.content_hash(b"card")) == "uploaded-id"
+        )
@@ -0,0 +1,138 @@
+import asyncio
+from typing import List
+
+import pytest
+from nationguessr.service.game import FactGenerationException, FactGenerationStrategy
+from nationguessr.service.prefetch import (
+    FactsPrefetchPool,
+    GenerationFromPrefetchPoolStrategy,
+)
+
+
+class CountingStrategy(FactGenerationStrategy):
+    def __init__(self, fail: bool = False) -> None:
+        self.calls = 0
+        self._fail = fail
+
+    async def generate_facts(self, country_code: str) -> List[str]:
+        self.calls += 1
+
+        if self._fail:
+            raise FactGenerationException("Failed to generate facts")
+
+        return [f"{country_code} fact {self.calls}"]
+
+
+class BatchCountingStrategy(CountingStrategy):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches = []
+
+    async def generate_facts_batch(self, country_codes):
+        self.batches.append(list(country_codes))
+
+        return {
+            country_code: [f"{country_code} batch fact"]
+            for country_code in country_codes
+            if country_code != "BA"
+        }
+
+
+class TestFactsPrefetchPool:
+    def test_should_raise_value_error_if_low_watermark_exceeds_depth(self):
+        with pytest.raises(ValueError):
+            FactsPrefetchPool(CountingStrategy(), ["AD"], depth=1, low_watermark=2)
+
+    @pytest.mark.asyncio
+    async def test_should_fill_pool_up_to_depth_on_warm_up(self):
+        # arrange
+        source_strategy = CountingStrategy()
+        pool = FactsPrefetchPool(source_strategy, ["AD", "ZW"], depth=2)
+
+        # act
+        pool.start()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        # assert
+        assert pool.size("AD") == 2
+        assert pool.size("ZW") == 2
+        assert source_strategy.calls == 4
+
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_should_refill_country_if_pool_drops_below_low_watermark(self):
+        # arrange
+        source_strategy = CountingStrategy()
+        pool = FactsPrefetchPool(
+            source_strategy, ["AD"], depth=3, low_watermark=2, warm_up=False
+        )
+        pool.start()
+
+        # act
+        first_facts = pool.take("AD")
+        await asyncio.sleep(0)
+
+        # assert
+        assert first_facts is None
+        assert pool.size("AD") == 3
+        assert pool.take("AD") == ["AD fact 1"]
+        assert pool.size("AD") == 2
+
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_should_keep_pool_empty_if_source_strategy_fails(self):
+        # arrange
+        pool = FactsPrefetchPool(CountingStrategy(fail=True), ["AD"], depth=1)
+
+        # act
+        pool.start()
+        await asyncio.sleep(0)
+
+        # assert
+        assert pool.size("AD") == 0
+
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_should_refill_countries_in_batches(self):
+        # arrange
+        source_strategy = BatchCountingStrategy()
+        pool = FactsPrefetchPool(
+            source_strategy, ["AD", "BA", "ZW"], depth=2, batch_size=3
+        )
+
+        # act
+        pool.start()
+        await asyncio.sleep(0)
+
+        # assert
+        assert source_strategy.batches == [["AD", "BA", "ZW"], ["AD", "ZW"]]
+        assert pool.size("AD") == 2
+        assert pool.size("BA") == 0
+        assert pool.size("ZW") == 2
+        assert source_strategy.calls == 0
+
+        await pool.close()
+
+
+class TestGenerationFromPrefetchPoolStrategy:
+    @pytest.mark.asyncio
+    async def test_should_use_fallback_strategy_if_pool_is_empty(self):
+        # arrange
+        fallback_strategy = CountingStrategy()
+        pool = FactsPrefetchPool(
+            CountingStrategy(fail=True), ["AD"], depth=1, warm_up=False
+        )
+        strategy = GenerationFromPrefetchPoolStrategy(pool, fallback_strategy)
+
+        # act
+        actual_facts = await strategy.generate_facts("AD")
+
+        # assert
+        assert actual_facts == ["AD fact 1"]
+        assert fallback_strategy.calls == 1
+
+        await strategy.close()
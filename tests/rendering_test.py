@@ -0,0 +1,64 @@
+import os
+import threading
+
+import pytest
+from nationguessr.service.cache import RenderedCardCache
+from nationguessr.service.rendering import RenderExecutor
+from nationguessr.settings import RenderingExecutor
+
+
+def current_thread_name() -> str:
+    return threading.current_thread().name
+
+
+class TestRenderExecutor:
+    @pytest.mark.asyncio
+    async def test_should_render_inline_in_event_loop_thread(self):
+        # arrange
+        render_executor = RenderExecutor(RenderingExecutor.INLINE)
+
+        # act
+        actual_thread_name = await render_executor.run(current_thread_name)
+
+        # assert
+        assert actual_thread_name == threading.current_thread().name
+
+    @pytest.mark.asyncio
+    async def test_should_render_in_thread_pool(self):
+        # arrange
+        render_executor = RenderExecutor(RenderingExecutor.THREAD, max_workers=1)
+
+        # act
+        actual_thread_name = await render_executor.run(current_thread_name)
+        await render_executor.close()
+
+        # assert
+        assert actual_thread_name.startswith("render")
+
+    @pytest.mark.asyncio
+    async def test_should_render_in_process_pool(self):
+        # arrange
+        render_executor = RenderExecutor(RenderingExecutor.PROCESS, max_workers=1)
+
+        # act
+        actual_pid = await render_executor.run(os.getpid)
+        await render_executor.close()
+
+        # assert
+        assert actual_pid != os.getpid()
+
+
+class TestRenderExecutorCache:
+    @pytest.mark.asyncio
+    async def test_should_render_card_once_per_cache_key(self, mocker):
+        # arrange
+        render_card = mocker.Mock(return_value=b"card")
+        render_executor = RenderExecutor(card_cache=RenderedCardCache(memory_limit=64))
+
+        # act
+        first_card = await render_executor.run_cached("key", render_card, 42)
+        second_card = await render_executor.run_cached("key", render_card, 42)
+
+        # assert
+        assert first_card == second_card == b"card"
+        render_card.assert_called_once_with(42)
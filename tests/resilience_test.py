@@ -0,0 +1,139 @@
+import asyncio
+from typing import List
+
+import pytest
+from nationguessr.service.game import FactGenerationException, FactGenerationStrategy
+from nationguessr.service.resilience import (
+    CircuitBreaker,
+    CircuitState,
+    GenerationWithCircuitBreakerStrategy,
+)
+
+
+class BlockingStrategy(FactGenerationStrategy):
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def generate_facts(self, country_code: str) -> List[str]:
+        self.calls += 1
+        await self.release.wait()
+
+        return [country_code]
+
+
+class TestCircuitBreaker:
+    @pytest.fixture(autouse=True)
+    def _circuit_breaker(self, fake_clock):
+        self._clock = fake_clock
+        self._circuit_breaker = CircuitBreaker(
+            failure_rate_threshold=0.5,
+            slow_call_duration=10.0,
+            window_size=4,
+            min_calls=4,
+            open_duration=30.0,
+            clock=self._clock,
+        )
+
+    def test_should_stay_closed_until_minimum_number_of_calls(self):
+        # act
+        for _ in range(3):
+            self._circuit_breaker.record_failure()
+
+        # assert
+        assert self._circuit_breaker.state == CircuitState.CLOSED
+        assert self._circuit_breaker.allow_request()
+
+    def test_should_open_if_failure_rate_reaches_threshold(self):
+        # act
+        self._circuit_breaker.record_success(1.0)
+        self._circuit_breaker.record_success(1.0)
+        self._circuit_breaker.record_failure()
+        self._circuit_breaker.record_success(15.0)
+
+        # assert
+        assert self._circuit_breaker.state == CircuitState.OPEN
+        assert not self._circuit_breaker.allow_request()
+
+    def test_should_let_single_probe_call_through_if_half_open(self):
+        # arrange
+        for _ in range(4):
+            self._circuit_breaker.record_failure()
+
+        # act
+        self._clock.now += 30.0
+
+        # assert
+        assert self._circuit_breaker.state == CircuitState.HALF_OPEN
+        assert self._circuit_breaker.allow_request()
+        assert not self._circuit_breaker.allow_request()
+
+    def test_should_close_if_probe_call_succeeds(self):
+        # arrange
+        for _ in range(4):
+            self._circuit_breaker.record_failure()
+
+        self._clock.now += 30.0
+        self._circuit_breaker.allow_request()
+
+        # act
+        self._circuit_breaker.record_success(1.0)
+
+        # assert
+        assert self._circuit_breaker.state == CircuitState.CLOSED
+
+    def test_should_open_again_if_probe_call_fails(self):
+        # arrange
+        for _ in range(4):
+            self._circuit_breaker.record_failure()
+
+        self._clock.now += 30.0
+        self._circuit_breaker.allow_request()
+
+        # act
+        self._circuit_breaker.record_failure()
+
+        # assert
+        assert self._circuit_breaker.state == CircuitState.OPEN
+
+
+class TestGenerationWithCircuitBreakerStrategy:
+    @pytest.mark.asyncio
+    async def test_should_reject_calls_if_circuit_is_open(self):
+        # arrange
+        primary_strategy = BlockingStrategy()
+        circuit_breaker = CircuitBreaker(min_calls=1)
+        circuit_breaker.record_failure()
+        strategy = GenerationWithCircuitBreakerStrategy(
+            primary_strategy, circuit_breaker, max_concurrency=1
+        )
+
+        # act & assert
+        with pytest.raises(FactGenerationException):
+            await strategy.generate_facts("AD")
+
+        assert primary_strategy.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_should_reject_calls_if_queue_is_full(self):
+        # arrange
+        primary_strategy = BlockingStrategy()
+        strategy = GenerationWithCircuitBreakerStrategy(
+            primary_strategy, CircuitBreaker(), max_concurrency=1, max_queue_size=1
+        )
+
+        running_call = asyncio.create_task(strategy.generate_facts("AD"))
+        queued_call = asyncio.create_task(strategy.generate_facts("BA"))
+        await asyncio.sleep(0)
+
+        # act & assert
+        with pytest.raises(FactGenerationException):
+            await strategy.generate_facts("ZW")
+
+        assert strategy.queue_size == 1
+
+        primary_strategy.release.set()
+
+        assert await running_call == ["AD"]
+        assert await queued_call == ["BA"]
+        assert primary_strategy.calls == 2
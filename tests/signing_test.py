@@ -0,0 +1,114 @@
+import datetime
+import hashlib
+import hmac
+from functools import reduce
+
+import pytest
+from nationguessr.service.fsm.signing import SigV4Signer
+
+ACCESS_KEY = "AKIDEXAMPLE"
+SECRET_KEY = "wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY"
+REGION = "eu-central-1"
+SERVICE = "dynamodb"
+HOST = f"{SERVICE}.{REGION}.amazonaws.com"
+
+
+def sign_request_with_reference(
+    request_body: str, amz_target: str, t: datetime.datetime
+) -> dict:
+    # The straightforward implementation of the algorithm, which recomputes every part
+    amz_date, date_stamp = t.strftime("%Y%m%dT%H%M%SZ"), t.strftime("%Y%m%d")
+    content_type = "application/x-amz-json-1.0"
+    canonical_headers = (
+        f"content-type:{content_type}\nhost:{HOST}\n"
+        f"x-amz-date:{amz_date}\nx-amz-target:{amz_target}\n"
+    )
+    signed_headers = "content-type;host;x-amz-date;x-amz-target"
+    payload_hash = hashlib.sha256(request_body.encode("utf-8")).hexdigest()
+    canonical_request = (
+        f"POST\n/\n\n{canonical_headers}\n{signed_headers}\n{payload_hash}"
+    )
+    credential_scope = f"{date_stamp}/{REGION}/{SERVICE}/aws4_request"
+    string_to_sign = (
+        f"AWS4-HMAC-SHA256\n{amz_date}\n{credential_scope}\n"
+        f"{hashlib.sha256(canonical_request.encode('utf-8')).hexdigest()}"
+    )
+    signing_key = reduce(
+        lambda k, msg: hmac.digest(k, msg.encode("utf-8"), hashlib.sha256),
+        [date_stamp, REGION, SERVICE, "aws4_request"],
+        ("AWS4" + SECRET_KEY).encode("utf-8"),
+    )
+    signature = hmac.new(
+        signing_key, string_to_sign.encode("utf-8"), hashlib.sha256
+    ).hexdigest()
+
+    return {
+        "Content-Type": content_type,
+        "X-Amz-Date": amz_date,
+        "X-Amz-Target": amz_target,
+        "Authorization": (
+            f"AWS4-HMAC-SHA256 Credential={ACCESS_KEY}/{credential_scope},"
+            f" SignedHeaders={signed_headers}, Signature={signature}"
+        ),
+    }
+
+
+class TestSigV4Signer:
+    @pytest.fixture(autouse=True)
+    def _signer(self):
+        self._now = datetime.datetime(2024, 3, 5, 23, 59, 58).replace(
+            tzinfo=datetime.timezone.utc
+        )
+        self._signer = SigV4Signer(
+            ACCESS_KEY,
+            SECRET_KEY,
+            REGION,
+            SERVICE,
+            HOST,
+            clock=lambda: self._now.timestamp(),
+        )
+
+    def _sign_with_reference(self, request_body, amz_target):
+        return sign_request_with_reference(
+            request_body, amz_target, self._now.replace(tzinfo=None)
+        )
+
+    def test_should_sign_requests_like_reference_implementation(self):
+        # arrange
+        requests = [
+            ('{"TableName": "fsm-table"}', "DynamoDB_20120810.GetItem"),
+            ('{"TableName": "fsm-table", "Key": {}}', "DynamoDB_20120810.UpdateItem"),
+            ("", "DynamoDB_20120810.PutItem"),
+        ]
+
+        for request_body, amz_target in requests:
+            # act
+            headers = self._signer.sign(request_body, amz_target)
+
+            # assert
+            assert headers == self._sign_with_reference(request_body, amz_target)
+
+    def test_should_derive_signing_key_again_on_next_date(self):
+        # arrange
+        self._signer.sign("{}", "DynamoDB_20120810.GetItem")
+        self._now += datetime.timedelta(seconds=3)
+
+        # act
+        headers = self._signer.sign("{}", "DynamoDB_20120810.GetItem")
+
+        # assert
+        assert headers["X-Amz-Date"] == "20240306T000001Z"
+        assert headers == self._sign_with_reference("{}", "DynamoDB_20120810.GetItem")
+
+    def test_should_derive_signing_key_once_per_date(self, mocker):
+        # arrange
+        self._now = self._now.replace(hour=12)
+        digest = mocker.spy(hmac, "digest")
+
+        # act
+        for _ in range(3):
+            self._signer.sign("{}", "DynamoDB_20120810.GetItem")
+            self._now += datetime.timedelta(seconds=1)
+
+        # assert
+        assert digest.call_count == 4
@@ -0,0 +1,413 @@
+import asyncio
+import json
+import os
+from typing import List
+
+import pytest
+from aiohttp import web
+from nationguessr.service.game import (
+    FactGenerationException,
+    FactGenerationStrategy,
+    GenerationFromGptStrategy,
+    GenerationWithDeadlineStrategy,
+    GenerationWithFallbackStrategy,
+)
+from nationguessr.settings import Settings
+
+
+class StaticStrategy(FactGenerationStrategy):
+    def __init__(
+        self, facts: List[str], delay: float = 0.0, fail: bool = False
+    ) -> None:
+        self.completed = 0
+        self._facts = facts
+        self._delay = delay
+        self._fail = fail
+
+    async def generate_facts(self, country_code: str) -> List[str]:
+        await asyncio.sleep(self._delay)
+
+        if self._fail:
+            raise FactGenerationException("Failed to generate facts")
+
+        self.completed += 1
+
+        return self._facts
+
+
+class TestGenerationWithFallbackStrategy:
+    @pytest.mark.asyncio
+    async def test_should_return_primary_facts_if_generation_succeeds(self):
+        # arrange
+        strategy = GenerationWithFallbackStrategy(
+            StaticStrategy(["primary"]), StaticStrategy(["fallback"])
+        )
+
+        # act
+        actual_facts = await strategy.generate_facts("AD")
+
+        # assert
+        assert actual_facts == ["primary"]
+
+    @pytest.mark.asyncio
+    async def test_should_return_fallback_facts_if_generation_fails(self):
+        # arrange
+        strategy = GenerationWithFallbackStrategy(
+            StaticStrategy(["primary"], fail=True), StaticStrategy(["fallback"])
+        )
+
+        # act
+        actual_facts = await strategy.generate_facts("AD")
+
+        # assert
+        assert actual_facts == ["fallback"]
+
+
+class TestGenerationWithDeadlineStrategy:
+    @pytest.mark.asyncio
+    async def test_should_return_primary_facts_if_generated_before_deadline(self):
+        # arrange
+        strategy = GenerationWithDeadlineStrategy(
+            StaticStrategy(["primary"], delay=0.01),
+            StaticStrategy(["fallback"]),
+            deadline=1.0,
+        )
+
+        # act
+        actual_facts = await strategy.generate_facts("AD")
+
+        # assert
+        assert actual_facts == ["primary"]
+
+    @pytest.mark.asyncio
+    async def test_should_return_fallback_facts_if_primary_generation_fails(self):
+        # arrange
+        strategy = GenerationWithDeadlineStrategy(
+            StaticStrategy(["primary"], fail=True),
+            StaticStrategy(["fallback"]),
+            deadline=1.0,
+        )
+
+        # act
+        actual_facts = await strategy.generate_facts("AD")
+
+        # assert
+        assert actual_facts == ["fallback"]
+
+    @pytest.mark.asyncio
+    async def test_should_cancel_primary_generation_after_deadline(self):
+        # arrange
+        primary_strategy = StaticStrategy(["primary"], delay=0.05)
+        strategy = GenerationWithDeadlineStrategy(
+            primary_strategy, StaticStrategy(["fallback"]), deadline=0.01
+        )
+
+        # act
+        actual_facts = await strategy.generate_facts("AD")
+        await asyncio.sleep(0.1)
+
+        # assert
+        assert actual_facts == ["fallback"]
+        assert primary_strategy.completed == 0
+
+    @pytest.mark.asyncio
+    async def test_should_complete_late_primary_generation_if_not_cancelled(self):
+        # arrange
+        primary_strategy = StaticStrategy(["primary"], delay=0.05)
+        strategy = GenerationWithDeadlineStrategy(
+            primary_strategy,
+            StaticStrategy(["fallback"]),
+            deadline=0.01,
+            cancel_late=False,
+        )
+
+        # act
+        actual_facts = await strategy.generate_facts("AD")
+        await asyncio.sleep(0.1)
+
+        # assert
+        assert actual_facts == ["fallback"]
+        assert primary_strategy.completed == 1
+
+
+class TestGenerationFromGptStrategyBatch:
+    @pytest.fixture(autouse=True)
+    def _gpt_strategy(self):
+        settings = Settings(
+            default_facts_num=2,
+            openai_api_token="token",
+            assets_folder=os.path.join(
+                os.path.dirname(__file__), "..", "src", "assets"
+            ),
+            token="",
+            aws_access_key="",
+            aws_secret_key="",
+            aws_fsm_table_name="",
+            aws_region="",
+        )
+        self._strategy = GenerationFromGptStrategy(settings)
+
+    @pytest.mark.asyncio
+    async def test_should_request_facts_for_all_countries_at_once(self, mocker):
+        # arrange
+        mock_request_completion = mocker.patch.object(
+            self._strategy,
+            "_request_completion",
+            return_value=json.dumps(
+                {"AD": {"1": "A1", "2": "A2"}, "ZW": {"1": "Z1", "2": "Z2"}}
+            ),
+        )
+
+        # act
+        actual_facts = await self._strategy.generate_facts_batch(["AD", "ZW"])
+
+        # assert
+        assert actual_facts == {"AD": ["A1", "A2"], "ZW": ["Z1", "Z2"]}
+        assert mock_request_completion.call_count == 1
+        assert json.loads(mock_request_completion.call_args.args[1]) == {
+            "AD": "Andorra",
+            "ZW": "Zimbabwe",
+        }
+
+    @pytest.mark.asyncio
+    async def test_should_drop_countries_with_invalid_facts(self, mocker):
+        # arrange
+        mocker.patch.object(
+            self._strategy,
+            "_request_completion",
+            return_value=json.dumps({"AD": {"1": "A1"}, "ZW": {"1": "Z1", "2": "Z2"}}),
+        )
+
+        # act
+        actual_facts = await self._strategy.generate_facts_batch(["AD", "BA", "ZW"])
+
+        # assert
+        assert actual_facts == {"ZW": ["Z1", "Z2"]}
+
+    @pytest.mark.asyncio
+    async def test_should_split_batch_above_output_token_limit(self, mocker):
+        # arrange
+        self._strategy._settings.openai_max_output_tokens = 2048
+
+        async def request_completion(system_prompt, user_content, max_tokens):
+            return json.dumps(
+                {
+                    country_code: {"1": f"{country_code}1", "2": f"{country_code}2"}
+                    for country_code in json.loads(user_content)
+                }
+            )
+
+        mock_request_completion = mocker.patch.object(
+            self._strategy, "_request_completion", side_effect=request_completion
+        )
+
+        # act
+        actual_facts = await self._strategy.generate_facts_batch(["AD", "BA", "ZW"])
+
+        # assert
+        assert actual_facts == {
+            "AD": ["AD1", "AD2"],
+            "BA": ["BA1", "BA2"],
+            "ZW": ["ZW1", "ZW2"],
+        }
+        assert mock_request_completion.call_count == 2
+        assert all(
+            call.kwargs["max_tokens"] <= 2048
+            for call in mock_request_completion.call_args_list
+        )
+
+    @pytest.mark.asyncio
+    async def test_should_keep_successful_sub_batches_if_one_fails(self, mocker):
+        # arrange
+        self._strategy._settings.openai_max_output_tokens = 2048
+
+        async def request_completion(system_prompt, user_content, max_tokens):
+            countries = json.loads(user_content)
+            if "ZW" in countries:
+                err_msg = "Request failed"
+                raise FactGenerationException(err_msg)
+            return json.dumps(
+                {
+                    country_code: {"1": f"{country_code}1", "2": f"{country_code}2"}
+                    for country_code in countries
+                }
+            )
+
+        mocker.patch.object(
+            self._strategy, "_request_completion", side_effect=request_completion
+        )
+
+        # act
+        actual_facts = await self._strategy.generate_facts_batch(["AD", "BA", "ZW"])
+
+        # assert
+        assert actual_facts == {"AD": ["AD1", "AD2"], "BA": ["BA1", "BA2"]}
+
+    @pytest.mark.asyncio
+    async def test_should_raise_exception_if_all_sub_batches_fail(self, mocker):
+        # arrange
+        self._strategy._settings.openai_max_output_tokens = 2048
+        mocker.patch.object(
+            self._strategy,
+            "_request_completion",
+            side_effect=FactGenerationException("Request failed"),
+        )
+
+        # act & assert
+        with pytest.raises(FactGenerationException):
+            await self._strategy.generate_facts_batch(["AD", "BA", "ZW"])
+
+    @pytest.mark.asyncio
+    async def test_should_raise_exception_if_batch_is_not_json_object(self, mocker):
+        mocker.patch.object(
+            self._strategy, "_request_completion", return_value='["A1", "A2"]'
+        )
+
+        with pytest.raises(FactGenerationException):
+            await self._strategy.generate_facts_batch(["AD"])
+
+
+class TestGenerationFromGptStrategySession:
+    @pytest.fixture(autouse=True)
+    def _settings(self):
+        self._settings_kwargs = {
+            "default_facts_num": 2,
+            "openai_api_token": "token",
+            "openai_request_timeout": 0.5,
+            "assets_folder": os.path.join(
+                os.path.dirname(__file__), "..", "src", "assets"
+            ),
+            "token": "",
+            "aws_access_key": "",
+            "aws_secret_key": "",
+            "aws_fsm_table_name": "",
+            "aws_region": "",
+        }
+
+    async def _start_stub_server(
+        self, hang: bool = False, error_page: str | None = None
+    ) -> str:
+        self._client_ports = set()
+        self._released = asyncio.Event()
+
+        if not hang:
+            self._released.set()
+
+        async def complete_chat(request: web.Request) -> web.Response:
+            self._client_ports.add(request.transport.get_extra_info("peername")[1])
+            await self._released.wait()
+
+            if error_page is not None:
+                return web.Response(
+                    status=502, text=error_page, content_type="text/html"
+                )
+
+            return web.json_response(
+                {
+                    "choices": [
+                        {"message": {"content": json.dumps({"1": "F1", "2": "F2"})}}
+                    ]
+                }
+            )
+
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", complete_chat)
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+
+        _, port = self._runner.addresses[0]
+
+        return f"http://127.0.0.1:{port}/v1"
+
+    def _strategy(self, base_url: str) -> GenerationFromGptStrategy:
+        return GenerationFromGptStrategy(
+            Settings(openai_api_base_url=base_url, **self._settings_kwargs),
+            StaticStrategy(["fallback"]),
+        )
+
+    @pytest.mark.asyncio
+    async def test_should_reuse_connection_across_requests(self):
+        # arrange
+        strategy = self._strategy(await self._start_stub_server())
+
+        try:
+            # act
+            actual_facts = [await strategy.generate_facts("AD") for _ in range(5)]
+        finally:
+            await strategy.close()
+            await self._runner.cleanup()
+
+        # assert
+        assert actual_facts == [["F1", "F2"]] * 5
+        assert len(self._client_ports) == 1
+
+    @pytest.mark.asyncio
+    async def test_should_open_new_session_after_close(self):
+        # arrange
+        strategy = self._strategy(await self._start_stub_server())
+
+        try:
+            await strategy.generate_facts("AD")
+
+            # act
+            await strategy.close()
+            actual_facts = await strategy.generate_facts("AD")
+        finally:
+            await strategy.close()
+            await self._runner.cleanup()
+
+        # assert
+        assert actual_facts == ["F1", "F2"]
+        assert len(self._client_ports) == 2
+
+    @pytest.mark.asyncio
+    async def test_should_fall_back_if_request_times_out(self):
+        # arrange
+        strategy = self._strategy(await self._start_stub_server(hang=True))
+
+        try:
+            # act
+            actual_facts = await strategy.generate_facts("AD")
+        finally:
+            self._released.set()
+            await strategy.close()
+            await self._runner.cleanup()
+
+        # assert
+        assert actual_facts == ["fallback"]
+
+    @pytest.mark.asyncio
+    async def test_should_fall_back_if_server_is_unreachable(self):
+        # arrange
+        base_url = await self._start_stub_server()
+        await self._runner.cleanup()
+        strategy = self._strategy(base_url)
+
+        try:
+            # act
+            actual_facts = await strategy.generate_facts("AD")
+        finally:
+            await strategy.close()
+
+        # assert
+        assert actual_facts == ["fallback"]
+
+    @pytest.mark.asyncio
+    async def test_should_raise_generation_exception_if_error_body_is_not_json(
+        self,
+    ):
+        # arrange
+        strategy = self._strategy(
+            await self._start_stub_server(error_page="<html>Bad Gateway</html>")
+        )
+
+        try:
+            # act & assert
+            with pytest.raises(FactGenerationException, match="502"):
+                await strategy.generate_facts_batch(["AD"])
+        finally:
+            await strategy.close()
+            await self._runner.cleanup()